@@ -0,0 +1,24 @@
+# Benchmarks of C source code generation.
+
+from pathlib import Path
+
+import pytest
+
+import cantools
+from cantools.database.can.c_source import generate
+
+FILES = Path(__file__).parent.parent / 'tests' / 'files'
+
+
+@pytest.mark.parametrize('filename', ['dbc/motohawk.dbc',
+                                      'dbc/vehicle.dbc',
+                                      'dbc/multiplex_2.dbc'])
+def test_generate(benchmark, filename):
+    db = cantools.database.load_file(FILES / filename)
+
+    benchmark(generate,
+              db,
+              'bench',
+              'bench.h',
+              'bench.c',
+              'bench_fuzzer.c')
@@ -0,0 +1,95 @@
+# Benchmarks of database loading, and of message encoding and decoding.
+
+from pathlib import Path
+
+import pytest
+
+import cantools
+
+FILES = Path(__file__).parent.parent / 'tests' / 'files'
+
+DATABASES = [
+    'dbc/vehicle.dbc',
+    'dbc/abs.dbc',
+    'dbc/multiplex_2.dbc',
+    'kcd/the_homer.kcd',
+    'sym/jopp-6.0.sym',
+    'arxml/system-4.2.arxml',
+    'arxml/system-3.2.3.arxml',
+]
+
+# Filename, message name and payload of the encoded and decoded
+# messages.
+MESSAGES = {
+    'plain': ('dbc/motohawk.dbc',
+              'ExampleMessage',
+              'c006e00000000000'),
+    'multiplexed': ('dbc/multiplex_2.dbc',
+                    'Extended',
+                    '2001000002030000'),
+    'float': ('dbc/floating_point.dbc',
+              'Message2',
+              '0000c03f000010c0'),
+    'signed': ('dbc/vehicle.dbc',
+               'RT_DL1MK3_GPS_Pos_LLH_1',
+               '0102030405060708'),
+}
+
+CONTAINER_MESSAGE = [
+    (
+        'message1',
+        {
+            'message1_SeqCounter': 123,
+            'message1_CRC': 456,
+            'signal6': 'zero',
+            'signal1': 5.2,
+            'signal5': 3.1415
+        }
+    )
+]
+
+
+@pytest.mark.parametrize('filename', DATABASES)
+def test_load_file(benchmark, filename):
+    benchmark(cantools.database.load_file, FILES / filename)
+
+
+@pytest.mark.parametrize('kind', list(MESSAGES))
+def test_decode(benchmark, kind):
+    filename, name, payload = MESSAGES[kind]
+    message = cantools.database.load_file(FILES / filename).get_message_by_name(name)
+    data = bytes.fromhex(payload)
+
+    benchmark(message.decode, data)
+
+
+@pytest.mark.parametrize('kind', list(MESSAGES))
+def test_encode(benchmark, kind):
+    filename, name, payload = MESSAGES[kind]
+    message = cantools.database.load_file(FILES / filename).get_message_by_name(name)
+    data = message.decode(bytes.fromhex(payload))
+
+    benchmark(message.encode, data)
+
+
+def test_decode_container(benchmark):
+    db = cantools.database.load_file(FILES / 'arxml/system-4.2.arxml')
+    message = db.get_message_by_name('OneToContainThemAll')
+    data = message.encode(CONTAINER_MESSAGE)
+
+    benchmark(message.decode, data, decode_containers=True)
+
+
+def test_encode_container(benchmark):
+    db = cantools.database.load_file(FILES / 'arxml/system-4.2.arxml')
+    message = db.get_message_by_name('OneToContainThemAll')
+
+    benchmark(message.encode, CONTAINER_MESSAGE)
+
+
+def test_decode_message(benchmark):
+    db = cantools.database.load_file(FILES / 'dbc/vehicle.dbc')
+    message = db.get_message_by_name('RT_DL1MK3_GPS_Pos_LLH_1')
+    data = bytes(range(message.length))
+
+    benchmark(db.decode_message, message.frame_id, data)
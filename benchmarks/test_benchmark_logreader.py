@@ -0,0 +1,51 @@
+# Benchmarks of log file parsing, one per log file format.
+
+import io
+
+import pytest
+
+import cantools
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMBER_OF_LINES = 10000
+
+LINES = {
+    'candump': '  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00',
+    'candump-timestamped': ' (1613749650.388103)  can1       0AD  [08]  A6 55 3B CF 3F 1A F5 2A',
+    'candump-absolute': ' (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00',
+    'candump-log': '(1594172461.968006) vcan0 0C8#F000000000000000',
+    'pcan-trace-v10': '1) 1841 0001 8 F0 00 00 00 00 00 00 00',
+    'pcan-trace-v11': '1)      6357.2 Rx        0401  8    F0 00 00 00 00 00 00 00',
+    'pcan-trace-v12': '1)      6357.213 1  Rx        0401  8    F0 00 00 00 00 00 00 00',
+    'pcan-trace-v13': '1)      6357.213 1  Rx        0401 -  8    F0 00 00 00 00 00 00 00',
+    'pcan-trace-v20': ' 1      1059.900 DT 0300 Rx 7 00 00 00 00 04 00 00',
+    'pcan-trace-v21': ' 1      1059.900 DT 1 0300 Rx - 7 00 00 00 00 04 00 00',
+}
+
+
+def _log(kind):
+    return '\n'.join([LINES[kind]] * NUMBER_OF_LINES) + '\n'
+
+
+def _parse(log):
+    return sum(1 for _ in cantools.logreader.Parser(io.StringIO(log)))
+
+
+@pytest.mark.parametrize('kind', list(LINES))
+def test_parser(benchmark, kind):
+    log = _log(kind)
+
+    assert benchmark(_parse, log) == NUMBER_OF_LINES
+
+
+@pytest.mark.skipif(np is None, reason='numpy is not installed')
+@pytest.mark.parametrize('kind', list(LINES))
+def test_read_columns(benchmark, kind):
+    log = _log(kind)
+    columns = benchmark(lambda: cantools.logreader.read_columns(io.StringIO(log)))
+
+    assert len(columns.frame_ids) == NUMBER_OF_LINES
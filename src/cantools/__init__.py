@@ -1,6 +1,5 @@
 __all__ = ["Error", "__author__", "__version__", "database", "j1939", "logreader", "tester"]
 
-import argparse
 import importlib
 import logging
 import os
@@ -8,18 +7,45 @@ import pathlib
 import sys
 import types
 import warnings
-from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any
 
-from . import database, j1939, logreader, tester
 from .errors import Error
 
+if TYPE_CHECKING:
+    from . import database, j1939, logreader, tester
+
 __author__ = 'Erik Moqvist'
 
-try:
-    __version__ = version("cantools")
-except PackageNotFoundError:
-    # package is not installed
-    pass
+# Submodules are imported when first used, as some of them import
+# large dependencies, for example python-can.
+_SUBMODULES = ["database", "j1939", "logreader", "tester"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    if name == '__version__':
+        from importlib.metadata import (  # noqa: PLC0415
+            PackageNotFoundError,
+            version,
+        )
+
+        try:
+            value = version("cantools")
+        except PackageNotFoundError:
+            # package is not installed
+            pass
+        else:
+            globals()['__version__'] = value
+
+            return value
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
 
 
 class _DeprecatedModule(types.ModuleType):
@@ -29,10 +55,10 @@ class _DeprecatedModule(types.ModuleType):
             DeprecationWarning,
             stacklevel=2
         )
-        return getattr(database, name)
+        return getattr(importlib.import_module('cantools.database'), name)
 
     def __dir__(self):
-        return dir(database)
+        return dir(importlib.import_module('cantools.database'))
 
 # Replace `db` with a deprecation proxy
 db = _DeprecatedModule("cantools.db")
@@ -72,6 +98,8 @@ def _load_subparser(subparser_name, subparsers):
         result.add_subparser(subparsers)
 
 def _main():
+    import argparse  # noqa: PLC0415
+
     parser = argparse.ArgumentParser(
         prog='cantools',
         description='Various CAN utilities.',
@@ -81,7 +109,7 @@ def _main():
     parser.add_argument('-d', '--debug', action='store_true')
     parser.add_argument('--version',
                         action='version',
-                        version=__version__,
+                        version=__getattr__('__version__'),
                         help='Print version information and exit.')
 
     # Workaround to make the subparser required in Python 3.
@@ -1,21 +1,19 @@
 __all__ = ["Bus", "Database", "DecodeError", "EncodeError", "Message",
-           "Node", "Signal", "dump_file", "load", "load_file", "load_string"]
+           "Node", "Signal", "cached_load_file", "dump_file", "load",
+           "load_file", "load_files", "load_string"]
 
+import importlib.util
 import os
 import warnings
+from collections.abc import Sequence
 from contextlib import nullcontext
-from typing import Any, TextIO
-
-try:
-    import diskcache  # type: ignore
-    _DISKCACHE_AVAILABLE = True
-except ImportError:
-    _DISKCACHE_AVAILABLE = False
+from typing import TYPE_CHECKING, Any, TextIO
 
 from ..typechecking import StringPathLike
 from . import can, diagnostics, utils
 from .can.bus import Bus
 from .can.database import Database
+from .can.internal_database import InternalDatabase
 from .can.message import Message
 from .can.node import Node
 from .can.signal import Signal
@@ -26,6 +24,12 @@ from .errors import (
     UnsupportedDatabaseFormatError,
 )
 
+if TYPE_CHECKING:
+    from .content_cache import ContentCache
+
+# diskcache is imported when the cache is used, as it is slow to import.
+_DISKCACHE_AVAILABLE = importlib.util.find_spec('diskcache') is not None
+
 
 def _resolve_database_format_and_encoding(database_format: str | None,
                                           encoding: str | None,
@@ -52,6 +56,9 @@ def load_file(filename: StringPathLike,
               strict: bool = True,
               cache_dir: str | None = None,
               sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit,
+              dbc_parser: str = 'textparser',
+              lazy: bool = False,
+              cache: "ContentCache | None" = None,
               ) -> can.Database | diagnostics.Database:
     """Open, read and parse given database file and return a
     :class:`can.Database<.can.Database>` or
@@ -59,9 +66,9 @@ def load_file(filename: StringPathLike,
     its contents.
 
     `database_format` is one of ``'arxml'``, ``'dbc'``, ``'kcd'``,
-    ``'sym'``, ``cdd`` and ``None``. If ``None``, the database format
-    is selected based on the filename extension as in the table below.
-    Filename extensions are case insensitive.
+    ``'sym'``, ``cdd``, ``'cdb'`` and ``None``. If ``None``, the
+    database format is selected based on the filename extension as in
+    the table below. Filename extensions are case insensitive.
 
     +-----------+-----------------+
     | Extension | Database format |
@@ -76,6 +83,8 @@ def load_file(filename: StringPathLike,
     +-----------+-----------------+
     | .cdd      | ``'cdd'``       |
     +-----------+-----------------+
+    | .cdb      | ``'cdb'``       |
+    +-----------+-----------------+
     | <unknown> | ``None``        |
     +-----------+-----------------+
 
@@ -104,6 +113,16 @@ def load_file(filename: StringPathLike,
     a common prefix ending on an underscore. If you want to have
     the original names you need to pass `prune_choices = False`.
 
+    ``'cdb'`` is a compact binary format written by
+    :func:`~cantools.database.dump_file()`. The file is memory mapped
+    and its messages are created when first used, so opening it is
+    fast even for very large databases. The file stays mapped until
+    all messages are loaded, for example by accessing
+    :attr:`~.can.Database.messages`, and must not be truncated or
+    replaced before. `encoding`, `cache_dir`, `dbc_parser` and `lazy`
+    are not used for it. See
+    :meth:`can.Database.add_cdb_file()<.can.Database.add_cdb_file>`.
+
     `cache_dir` specifies the database cache location in the file
     system. Give as ``None`` to disable the cache. By default the
     cache is disabled, but can be enabled with environment variable
@@ -116,6 +135,13 @@ def load_file(filename: StringPathLike,
     (``pip install cantools[cache]``); if it is not installed, a
     warning is issued and caching is disabled.
 
+    `cache` is a :class:`~cantools.database.content_cache.ContentCache`
+    keyed by the file contents instead of its path and modification
+    time, so it is also used for copies of the file and after fresh
+    checkouts. If ``None``, a cache in the directory given by the
+    environment variable `CANTOOLS_CONTENT_CACHE_DIR` is used, if
+    set. `cache_dir` is not used if a content cache is used.
+
     See :func:`~cantools.database.load_string()` for descriptions of
     other arguments.
 
@@ -135,6 +161,42 @@ def load_file(filename: StringPathLike,
         encoding,
         filename)
 
+    if database_format == 'cdb':
+        from .can.formats import cdb  # noqa: PLC0415
+
+        cdb_db = can.Database(frame_id_mask=frame_id_mask,
+                              strict=strict,
+                              sort_signals=sort_signals)
+        # Choices are pruned when the messages are loaded.
+        cdb_db._add_message_index(
+            cdb.CdbMessageIndex(cdb.map_file(filename),
+                                strict,
+                                sort_signals,
+                                prune_choices,
+                                close_data=True))
+
+        return cdb_db
+
+    if cache is None:
+        content_cache_dir = os.getenv('CANTOOLS_CONTENT_CACHE_DIR')
+
+        if content_cache_dir:
+            from .content_cache import ContentCache  # noqa: PLC0415
+
+            cache = ContentCache(content_cache_dir)
+
+    if cache is not None:
+        with open(filename, encoding=encoding, errors='replace') as fin:
+            return load(fin,
+                        database_format,
+                        frame_id_mask,
+                        prune_choices,
+                        strict,
+                        sort_signals,
+                        dbc_parser,
+                        lazy,
+                        cache)
+
     cache_dir = cache_dir or os.getenv("CANTOOLS_CACHE_DIR", None)
     if cache_dir and not _DISKCACHE_AVAILABLE:
         warnings.warn(
@@ -147,8 +209,11 @@ def load_file(filename: StringPathLike,
     cache_key: tuple[Any, ...] | None = None
     db: can.Database | diagnostics.Database
 
-    with diskcache.Cache(cache_dir) if cache_dir else nullcontext() as cache:
-        if cache is not None:
+    if cache_dir:
+        import diskcache  # type: ignore # noqa: PLC0415
+
+    with diskcache.Cache(cache_dir) if cache_dir else nullcontext() as disk_cache:
+        if disk_cache is not None:
             # do not cache if user-defined sort_signals function is provided
             # the key cannot be created if function is local or depends on context
             # pickle serializer will fail anyway
@@ -160,11 +225,13 @@ def load_file(filename: StringPathLike,
                     prune_choices,
                     strict,
                     sort_signals,
+                    dbc_parser,
+                    lazy,
                     filename,
                     os.path.getmtime(filename),
                 )
 
-            db = cache.get(cache_key)
+            db = disk_cache.get(cache_key)
             if isinstance(db, (can.Database, diagnostics.Database)):
                 return db
 
@@ -174,13 +241,141 @@ def load_file(filename: StringPathLike,
                     frame_id_mask,
                     prune_choices,
                     strict,
-                    sort_signals)
+                    sort_signals,
+                    dbc_parser,
+                    lazy)
 
-        if cache is not None:
-            cache[cache_key] = db
+        if disk_cache is not None:
+            disk_cache[cache_key] = db
 
         return db
 
+def cached_load_file(filename: StringPathLike,
+                     *args: Any,
+                     **kwargs: Any) -> can.Database | diagnostics.Database:
+    """Same as :func:`~cantools.database.load_file()`, but returns the
+    same database object for the same file and arguments, as long as
+    the file is unchanged and the database is used elsewhere in the
+    process.
+
+    This saves memory and load time when several parts of a program
+    load the same file. The returned database is shared and must not
+    be modified. The databases are kept in the process-wide
+    :class:`~cantools.database.registry.Registry`
+    ``cantools.database.registry.REGISTRY``. Call its
+    :meth:`~cantools.database.registry.Registry.invalidate()` method
+    to load a file again.
+
+    >>> db = cantools.database.cached_load_file('foo.dbc')
+    >>> cantools.database.cached_load_file('foo.dbc') is db
+    True
+
+    """
+
+    from .registry import REGISTRY  # noqa: PLC0415
+
+    return REGISTRY.load_file(filename, *args, **kwargs)
+
+def _load_internal_database(filename: StringPathLike,
+                            database_format: str | None,
+                            encoding: str | None,
+                            prune_choices: bool,
+                            strict: bool,
+                            sort_signals: utils.type_sort_signals,
+                            dbc_parser: str) -> InternalDatabase:
+    """Load given CAN database file and return its contents as an
+    internal database, which is sent back from a worker process by
+    :func:`~cantools.database.load_files()`.
+
+    """
+
+    db = load_file(filename,
+                   database_format,
+                   encoding,
+                   prune_choices=prune_choices,
+                   strict=strict,
+                   sort_signals=sort_signals,
+                   dbc_parser=dbc_parser)
+
+    if not isinstance(db, can.Database):
+        raise Error(f"'{filename}' is not a CAN database.")
+
+    return InternalDatabase(db.messages,
+                            db.nodes,
+                            db.buses,
+                            db.version,
+                            db.dbc,
+                            db.autosar)
+
+def load_files(filenames: Sequence[StringPathLike],
+               database_format: str | None = None,
+               encoding: str | None = None,
+               frame_id_mask: int | None = None,
+               prune_choices: bool = False,
+               strict: bool = True,
+               sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit,
+               dbc_parser: str = 'textparser',
+               jobs: int = 1) -> can.Database:
+    """Open, read and parse given CAN database files and return a
+    :class:`can.Database<.can.Database>` object with the contents of
+    all of them.
+
+    The result is the same as adding the files one after another
+    using the ``add_*_file()`` methods of a
+    :class:`can.Database<.can.Database>`, that is, messages of later
+    files overwrite messages of earlier files with the same name or
+    frame id, and the nodes, buses and version of the last file are
+    used.
+
+    `jobs` is the number of processes parsing files in parallel, or
+    ``0`` to use one process per CPU. With more than one job, the
+    load time is bounded by the largest file instead of the sum of
+    all files, but `sort_signals` must be picklable, i.e., not a
+    lambda or local function.
+
+    If `database_format` or `encoding` is ``None``, it is selected for
+    each file based on its filename extension. See
+    :func:`~cantools.database.load_file()` for descriptions of other
+    arguments.
+
+    >>> db = cantools.database.load_files(['foo.dbc', 'bar.arxml'], jobs=0)
+    >>> db.get_message_by_name('Foo')
+    message('Foo', 0x12330, True, 8, {None: 'Foo.'})
+
+    """
+
+    jobs = jobs or os.cpu_count() or 1
+    args = (database_format,
+            encoding,
+            prune_choices,
+            strict,
+            sort_signals,
+            dbc_parser)
+
+    if jobs > 1 and len(filenames) > 1:
+        import concurrent.futures  # noqa: PLC0415
+
+        with concurrent.futures.ProcessPoolExecutor(
+                min(jobs, len(filenames))) as executor:
+            futures = [
+                executor.submit(_load_internal_database, filename, *args)
+                for filename in filenames
+            ]
+            databases = [future.result() for future in futures]
+    else:
+        databases = [
+            _load_internal_database(filename, *args)
+            for filename in filenames
+        ]
+
+    db = can.Database(frame_id_mask=frame_id_mask,
+                      strict=strict,
+                      sort_signals=sort_signals)
+
+    db._add_internal_databases(databases)
+
+    return db
+
 def dump_file(database: can.Database,
               filename: StringPathLike,
               database_format: str | None = None,
@@ -201,7 +396,9 @@ def dump_file(database: can.Database,
 
     The ``'dbc'`` database format will always have Windows-style line
     endings (``\\r\\n``). For other database formats the line ending
-    depends on the operating system.
+    depends on the operating system. The ``'cdb'`` database format is
+    binary, see :meth:`can.Database.as_cdb_bytes()
+    <.can.Database.as_cdb_bytes>`.
 
     >>> db = cantools.database.load_file('foo.dbc')
     >>> cantools.database.dump_file(db, 'bar.dbc')
@@ -217,6 +414,12 @@ def dump_file(database: can.Database,
 
     newline = None
 
+    if database_format == 'cdb':
+        with open(filename, 'wb') as fout:
+            fout.write(database.as_cdb_bytes())
+
+        return
+
     if database_format == 'dbc':
         output = database.as_dbc_string(sort_signals=sort_signals)
         newline = ''
@@ -237,12 +440,20 @@ def load(fp: TextIO,
          frame_id_mask: int | None = None,
          prune_choices: bool = False,
          strict: bool = True,
-         sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit) -> can.Database | diagnostics.Database:
+         sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit,
+         dbc_parser: str = 'textparser',
+         lazy: bool = False,
+         cache: "ContentCache | None" = None) -> can.Database | diagnostics.Database:
     """Read and parse given database file-like object and return a
     :class:`can.Database<.can.Database>` or
     :class:`diagnostics.Database<.diagnostics.Database>` object with
     its contents.
 
+    If `database_format` is ``'arxml'``, or ``'dbc'`` and `dbc_parser`
+    is ``'streaming'``, the data is parsed while it is read from `fp`,
+    instead of being read into a string first, unless `cache` is
+    given.
+
     See :func:`~cantools.database.load_string()` for descriptions of
     other arguments.
 
@@ -258,12 +469,55 @@ def load(fp: TextIO,
 
     """
 
+    if cache is not None:
+        return load_string(fp.read(),
+                           database_format,
+                           frame_id_mask,
+                           prune_choices,
+                           strict,
+                           sort_signals,
+                           dbc_parser,
+                           lazy,
+                           cache)
+
+    if database_format == 'arxml':
+        db = can.Database(frame_id_mask=frame_id_mask,
+                          strict=strict,
+                          sort_signals=sort_signals)
+
+        try:
+            db.add_arxml(fp)
+        except Exception as e:
+            raise UnsupportedDatabaseFormatError(e, None, None, None, None) from e
+
+        if prune_choices:
+            utils.prune_database_choices(db)
+
+        return db
+
+    if database_format == 'dbc' and dbc_parser == 'streaming' and not lazy:
+        db = can.Database(frame_id_mask=frame_id_mask,
+                          strict=strict,
+                          sort_signals=sort_signals)
+
+        try:
+            db.add_dbc(fp, parser=dbc_parser)
+        except Exception as e:
+            raise UnsupportedDatabaseFormatError(None, e, None, None, None) from e
+
+        if prune_choices:
+            utils.prune_database_choices(db)
+
+        return db
+
     return load_string(fp.read(),
                        database_format,
                        frame_id_mask,
                        prune_choices,
                        strict,
-                       sort_signals)
+                       sort_signals,
+                       dbc_parser,
+                       lazy)
 
 
 def load_string(string: str,
@@ -271,7 +525,10 @@ def load_string(string: str,
                 frame_id_mask: int | None = None,
                 prune_choices: bool = False,
                 strict: bool = True,
-                sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit) \
+                sort_signals: utils.type_sort_signals = utils.sort_signals_by_start_bit,
+                dbc_parser: str = 'textparser',
+                lazy: bool = False,
+                cache: "ContentCache | None" = None) \
         -> can.Database | diagnostics.Database:
     """Parse given database string and return a
     :class:`can.Database<.can.Database>` or
@@ -294,6 +551,24 @@ def load_string(string: str,
     If you want the signals to be sorted in another way pass something like
     `sort_signals = lambda signals: list(sorted(signals, key=lambda sig: sig.name))`
 
+    `dbc_parser` selects the parser of DBC data, either
+    ``'textparser'`` or ``'streaming'``. Both create identical
+    databases, but the streaming parser is faster and uses less
+    memory for large files.
+
+    If `lazy` is ``True``, messages in DBC data are only indexed by
+    frame id and name, and parsed when first used. This makes loading
+    large files with few used messages much faster. See
+    :meth:`can.Database.add_dbc()<.can.Database.add_dbc>`.
+
+    If `cache` is a
+    :class:`~cantools.database.content_cache.ContentCache`, the
+    database is loaded from it if `string` has been parsed with the
+    same arguments before, by this or any other process using the
+    same cache directory. Lazily loaded databases and databases with
+    signals sorted by a user-defined `sort_signals` function are not
+    cached.
+
     Raises an
     :class:`~cantools.database.UnsupportedDatabaseFormatError`
     exception if given string does not contain a supported database
@@ -311,6 +586,38 @@ def load_string(string: str,
             f"expected database format 'arxml', 'dbc', 'kcd', 'sym', 'cdd' or "
             f"None, but got '{database_format}'")
 
+    if dbc_parser not in ['textparser', 'streaming']:
+        raise ValueError(
+            f"expected DBC parser 'textparser' or 'streaming', but got "
+            f"'{dbc_parser}'")
+
+    if cache is not None and not lazy:
+        # Both DBC parsers create identical databases.
+        key = cache.key(string,
+                        'load_string',
+                        database_format,
+                        frame_id_mask,
+                        prune_choices,
+                        strict,
+                        sort_signals)
+
+        if key is not None:
+            db = cache.get(key)
+
+            if isinstance(db, (can.Database, diagnostics.Database)):
+                return db
+
+            db = load_string(string,
+                             database_format,
+                             frame_id_mask,
+                             prune_choices,
+                             strict,
+                             sort_signals,
+                             dbc_parser)
+            cache.put(key, db)
+
+            return db
+
     e_arxml = None
     e_dbc = None
     e_kcd = None
@@ -324,8 +631,19 @@ def load_string(string: str,
 
         if fmt == 'arxml':
             db.add_arxml_string(string)
+        elif fmt == 'dbc' and lazy:
+            from .can.formats import dbc  # noqa: PLC0415
+
+            # Choices are pruned when the messages are loaded.
+            db._add_message_index(dbc.DbcMessageIndex(string,
+                                                      strict,
+                                                      sort_signals,
+                                                      dbc_parser,
+                                                      prune_choices))
+
+            return db
         elif fmt == 'dbc':
-            db.add_dbc_string(string)
+            db.add_dbc_string(string, parser=dbc_parser)
         elif fmt == 'kcd':
             db.add_kcd_string(string)
         elif fmt == 'sym':
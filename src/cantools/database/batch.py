@@ -0,0 +1,775 @@
+# Batch encoding and decoding of many payloads using NumPy.
+#
+# This module imports NumPy and is therefore imported on first use
+# only, to keep ``import cantools`` fast.
+
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal, Union
+
+try:
+    import numpy as np
+    _NUMPY_AVAILABLE = True
+except ImportError:
+    _NUMPY_AVAILABLE = False
+
+from ..typechecking import Codec
+from .compiled import (
+    _choice_to_raw,
+    _mux_number,
+    _raise_signed_overflow,
+    _raise_unsigned_overflow,
+    bit_offsets,
+)
+from .conversion import (
+    BaseConversion,
+    IdentityConversion,
+    LinearConversion,
+    LinearIntegerConversion,
+    NamedSignalConversion,
+)
+from .errors import DecodeError, EncodeError, Error
+from .namedsignalvalue import NamedSignalValue
+from .utils import format_or
+
+if TYPE_CHECKING:
+    from .can.database import Database
+    from .can.message import Message
+    from .can.signal import Signal
+
+PayloadsType = Union["np.ndarray", Sequence[bytes]]
+ColumnsType = Mapping[str, Union["np.ndarray", Sequence[Any]]]
+
+_FLOAT_DTYPES = {
+    16: 'float16',
+    32: 'float32',
+    64: 'float64',
+}
+
+
+def require_numpy() -> None:
+    """Raise an error if NumPy, which is an optional dependency required
+    for batch encoding and decoding, is not installed.
+
+    """
+
+    if not _NUMPY_AVAILABLE:
+        raise Error('The numpy package is not installed and is required '
+                    'for batch encoding and decoding. Install it with: '
+                    'pip install cantools[numpy]')
+
+
+def payloads_to_array(payloads: PayloadsType, length: int) -> "np.ndarray":
+    """Return given payloads as a 2-D ``uint8`` array with `length`
+    columns.
+
+    `payloads` is either a 2-D array with one payload per row or a
+    sequence of ``bytes``. Excess data is ignored, while too short
+    payloads raise a ``DecodeError``.
+
+    """
+
+    if isinstance(payloads, np.ndarray):
+        if payloads.ndim != 2:
+            raise DecodeError(f'Expected a 2-D array of payloads, but got '
+                              f'{payloads.ndim} dimensions')
+
+        if payloads.shape[1] < length:
+            raise DecodeError(f'Wrong data size: {payloads.shape[1]} '
+                              f'instead of {length} bytes')
+
+        return payloads[:, :length].astype(np.uint8, copy=False)
+
+    rows: list[bytes] = []
+
+    for payload in payloads:
+        if len(payload) < length:
+            raise DecodeError(f'Wrong data size: {len(payload)} instead of '
+                              f'{length} bytes')
+
+        rows.append(bytes(payload[:length]))
+
+    return np.frombuffer(b''.join(rows),
+                         dtype=np.uint8).reshape(len(rows), length)
+
+
+def _extract_raw(data: "np.ndarray",
+                 signal: "Signal",
+                 offset: int) -> "np.ndarray":
+    """Extract the raw values of given signal from all rows. `offset` is
+    the bit offset of the signal's least significant bit in the
+    payload interpreted as an integer of the signal's byte order.
+
+    """
+
+    number_of_bytes = data.shape[1]
+    length = signal.length
+
+    if length > 64:
+        # Too long for NumPy integers, use Python integers instead.
+        byteorder: Literal['big', 'little'] = (
+            'big' if signal.byte_order == 'big_endian' else 'little')
+        mask = (1 << length) - 1
+
+        return np.array([
+            (int.from_bytes(row.tobytes(), byteorder) >> offset) & mask
+            for row in data
+        ], dtype=object)
+
+    raw = np.zeros(len(data), dtype=np.uint64)
+
+    for i in range(number_of_bytes):
+        # Position of bit 0 of byte i relative to the signal's least
+        # significant bit.
+        if signal.byte_order == 'big_endian':
+            position = 8 * (number_of_bytes - 1 - i) - offset
+        else:
+            position = 8 * i - offset
+
+        if position <= -8 or position >= length:
+            continue
+
+        column = data[:, i].astype(np.uint64)
+
+        if position >= 0:
+            raw |= column << np.uint64(position)
+        else:
+            raw |= column >> np.uint64(-position)
+
+    if length < 64:
+        raw &= np.uint64((1 << length) - 1)
+
+    if signal.conversion.is_float:
+        dtype = _FLOAT_DTYPES[length]
+
+        # Signalling NaNs are converted silently, just like struct does.
+        with np.errstate(invalid='ignore'):
+            return raw.astype(f'u{length // 8}').view(dtype).astype(np.float64)
+    elif signal.is_signed:
+        if length == 64:
+            return raw.view(np.int64)
+
+        sign_bit = 1 << (length - 1)
+
+        return (raw.astype(np.int64) ^ sign_bit) - sign_bit
+    elif length < 64:
+        return raw.astype(np.int64)
+
+    return raw
+
+
+def _scale(conversion: BaseConversion, raw: "np.ndarray") -> "np.ndarray":
+    if isinstance(conversion, NamedSignalConversion):
+        return _scale(conversion._conversion, raw)
+    elif isinstance(conversion, IdentityConversion):
+        return raw
+    elif isinstance(conversion, (LinearConversion, LinearIntegerConversion)):
+        return raw * conversion.scale + conversion.offset
+
+    # A user defined conversion.
+    return np.array([conversion.raw_to_scaled(value, False)
+                     for value in raw.tolist()])
+
+
+def _choice_codes(conversion: BaseConversion, raw: "np.ndarray") -> "np.ndarray":
+    """Return the index of each raw value in the list of choices, or -1
+    if there is no choice for it.
+
+    """
+
+    assert conversion.choices is not None
+    keys = np.array(list(conversion.choices), dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+
+    if raw.dtype.kind == 'f':
+        # Only integral float values can match a choice.
+        integral = (np.isfinite(raw)
+                    & (np.abs(raw) < 2 ** 63)
+                    & (raw == np.trunc(raw)))
+        values = np.where(integral, raw, 0).astype(np.int64)
+    else:
+        integral = None
+        values = raw.astype(np.int64)
+
+    indices = np.searchsorted(sorted_keys, values)
+    indices[indices == len(keys)] = 0
+    found = sorted_keys[indices] == values
+
+    if integral is not None:
+        found &= integral
+
+    return np.where(found, order[indices], -1).astype(np.int32)
+
+
+def _multiplexer_ids(signal: "Signal",
+                     raw: "np.ndarray",
+                     scaled: "np.ndarray") -> "np.ndarray":
+    """The multiplexer ids of all rows, following the same rules as
+    ``Message.decode()``.
+
+    """
+
+    conversion = signal.conversion
+
+    if (isinstance(conversion, (IdentityConversion,
+                                LinearConversion,
+                                LinearIntegerConversion,
+                                NamedSignalConversion))
+        and conversion.scale == 1
+        and conversion.offset == 0
+        and not conversion.is_float):
+        return raw.astype(np.int64)
+
+    return np.trunc(scaled.astype(np.float64)).astype(np.int64)
+
+
+def decode_many(message: "Message",
+                payloads: PayloadsType,
+                decode_choices: bool = False,
+                scaling: bool = True) -> dict[str, "np.ndarray"]:
+    """Decode many payloads of given message at once. See
+    :meth:`Message.decode_many()<cantools.database.can.Message.decode_many>`.
+
+    """
+
+    require_numpy()
+
+    if message.is_container:
+        raise DecodeError(f'Message "{message.name}" is a container')
+
+    codecs = message._codecs
+
+    if codecs is None:
+        raise ValueError('Codec is not initialized.')
+
+    data = payloads_to_array(payloads, message.length)
+    values: dict[str, np.ndarray] = {}
+    valid_rows: dict[str, np.ndarray | None] = {}
+
+    def decode_node(node: Codec, rows: "np.ndarray | None") -> None:
+        offsets = bit_offsets(node['signals'], message.length)
+
+        if offsets is None or any(signal.conversion.is_float
+                                  and signal.length not in _FLOAT_DTYPES
+                                  for signal in node['signals']):
+            raise DecodeError('unpacking failed')
+
+        raws: dict[str, np.ndarray] = {}
+        scaled: dict[str, np.ndarray] = {}
+
+        for signal in node['signals']:
+            name = signal.name
+            conversion = signal.conversion
+            raws[name] = _extract_raw(data, signal, offsets[name])
+            scaled[name] = _scale(conversion, raws[name])
+
+            if decode_choices and conversion.choices:
+                values[name] = _choice_codes(conversion, raws[name])
+            elif scaling:
+                values[name] = scaled[name]
+            else:
+                values[name] = raws[name]
+
+            if name not in valid_rows:
+                valid_rows[name] = rows
+            else:
+                # The signal is part of multiple multiplexed branches.
+                previous = valid_rows[name]
+
+                if previous is None or rows is None:
+                    valid_rows[name] = None
+                else:
+                    valid_rows[name] = previous | rows
+
+        for name, children in node['multiplexers'].items():
+            signal = message.get_signal_by_name(name)
+            mux = _multiplexer_ids(signal, raws[name], scaled[name])
+
+            for multiplexer_id, child in children.items():
+                child_rows = (mux == multiplexer_id)
+
+                if rows is not None:
+                    child_rows &= rows
+
+                decode_node(child, child_rows)
+
+    decode_node(codecs, None)
+    result: dict[str, np.ndarray] = {}
+
+    for name, value in values.items():
+        rows = valid_rows[name]
+
+        if rows is None:
+            result[name] = value
+        else:
+            result[name] = np.ma.masked_array(value, mask=~rows)
+
+    return result
+
+
+def decode_many_frames(database: "Database",
+                       frame_ids: "Sequence[int] | np.ndarray",
+                       payloads: PayloadsType,
+                       decode_choices: bool = False,
+                       scaling: bool = True,
+                       force_extended_id: bool = False,
+                       ) -> dict[str, tuple["np.ndarray", dict[str, "np.ndarray"]]]:
+    """Decode many frames of any messages in given database at once. See
+    :meth:`Database.decode_many()<cantools.database.can.Database.decode_many>`.
+
+    """
+
+    require_numpy()
+    frame_ids = np.asarray(frame_ids, dtype=np.int64)
+
+    # Several frame ids may belong to the same message if a frame id
+    # mask is used.
+    messages: dict[str, Message] = {}
+    message_frame_ids: dict[str, list[int]] = {}
+
+    for frame_id in np.unique(frame_ids).tolist():
+        try:
+            message = database.get_message_by_frame_id(frame_id,
+                                                       force_extended_id)
+        except KeyError:
+            continue
+
+        if message.is_container:
+            continue
+
+        messages[message.name] = message
+        message_frame_ids.setdefault(message.name, []).append(frame_id)
+
+    result: dict[str, tuple[np.ndarray, dict[str, np.ndarray]]] = {}
+
+    for name, ids in message_frame_ids.items():
+        rows = np.flatnonzero(np.isin(frame_ids, ids))
+        selected: PayloadsType
+
+        if isinstance(payloads, np.ndarray):
+            selected = payloads[rows]
+        else:
+            selected = [payloads[row] for row in rows.tolist()]
+
+        result[name] = (rows,
+                        decode_many(messages[name],
+                                    selected,
+                                    decode_choices,
+                                    scaling))
+
+    return result
+
+
+def _is_vectorisable(node: Codec, length: int) -> bool:
+    """Returns ``True`` if all signals of given codec tree can be encoded
+    with NumPy.
+
+    """
+
+    if bit_offsets(node['signals'], length) is None:
+        return False
+
+    for signal in node['signals']:
+        if signal.length > 64:
+            return False
+
+        if signal.conversion.is_float and signal.length not in _FLOAT_DTYPES:
+            return False
+
+        conversion = signal.conversion
+
+        if isinstance(conversion, NamedSignalConversion):
+            conversion = conversion._conversion
+
+        if not isinstance(conversion, (IdentityConversion,
+                                       LinearConversion,
+                                       LinearIntegerConversion)):
+            return False
+
+    return all(_is_vectorisable(child, length)
+               for children in node['multiplexers'].values()
+               for child in children.values())
+
+
+def _sequence_to_array(values: Sequence[Any]) -> "np.ndarray":
+    """Returns given values as an array. Python integers that do not fit
+    in a signed 64 bits integer are not converted to floats to avoid a
+    loss of precision, and numbers mixed with choice strings are not
+    converted to strings.
+
+    """
+
+    array = np.array(values)
+
+    if array.dtype.kind in 'fO':
+        if all(isinstance(value, int) for value in values):
+            try:
+                array = np.array(values, dtype=np.uint64)
+            except OverflowError:
+                array = np.array(values, dtype=object)
+    elif (array.dtype.kind in 'SU'
+          and not all(isinstance(value, (str, bytes)) for value in values)):
+        array = np.array(values, dtype=object)
+
+    return array
+
+
+def _numeric_scaled_to_raw(conversion: BaseConversion,
+                           values: "np.ndarray",
+                           scaling: bool) -> "np.ndarray":
+    """Same as ``_encode_signal_values()`` for numeric values."""
+
+    if isinstance(conversion, NamedSignalConversion):
+        return _numeric_scaled_to_raw(conversion._conversion, values, scaling)
+    elif not scaling or isinstance(conversion, IdentityConversion):
+        raw = values
+    elif isinstance(conversion, LinearIntegerConversion):
+        # try to avoid a loss of precision whenever possible
+        raw = values - conversion.offset
+        quotient, remainder = np.divmod(raw, conversion.scale)
+
+        if (remainder == 0).all():
+            raw = quotient
+        else:
+            raw = np.where(remainder == 0, quotient, raw / conversion.scale)
+    else:
+        assert isinstance(conversion, LinearConversion)
+        raw = (values - conversion.offset) / conversion.scale
+
+    if conversion.is_float:
+        return raw.astype(np.float64)
+    elif raw.dtype.kind == 'f':
+        # Rounds half to even, just like Python's round().
+        return raw.round()
+
+    return raw
+
+
+def _numeric_raw_to_scaled(conversion: BaseConversion,
+                           values: "np.ndarray") -> "np.ndarray":
+    if isinstance(conversion, NamedSignalConversion):
+        return _numeric_raw_to_scaled(conversion._conversion, values)
+    elif isinstance(conversion, IdentityConversion):
+        return values
+
+    return values * conversion.scale + conversion.offset
+
+
+def _column_to_raw(message: "Message",
+                   signal: "Signal",
+                   values: "np.ndarray",
+                   scaling: bool,
+                   strict: bool) -> "np.ndarray":
+    """Convert given values of given signal to raw values. Choice strings
+    and named signal values are converted just like
+    ``Message.encode()`` does.
+
+    """
+
+    conversion = signal.conversion
+    choices = np.zeros(len(values), dtype=bool)
+
+    if values.dtype.kind in 'OSU':
+        items = values.tolist()
+        numeric = []
+
+        for row, item in enumerate(items):
+            if isinstance(item, bytes):
+                item = item.decode()
+
+            if isinstance(item, (str, NamedSignalValue)):
+                choices[row] = True
+                numeric.append(_choice_to_raw(conversion, item))
+            else:
+                numeric.append(item)
+
+        values = _sequence_to_array(numeric)
+
+    raw = _numeric_scaled_to_raw(conversion, values, scaling)
+
+    if choices.any():
+        raw = np.where(choices, values, raw)
+
+    if not strict:
+        return raw
+
+    # Range checks of all values that are not choices.
+    if scaling:
+        scaled = values
+    else:
+        scaled = _numeric_raw_to_scaled(conversion, values)
+
+    if conversion.choices:
+        choices |= np.isin(raw, list(conversion.choices))
+
+    tolerance = abs(conversion.scale) * 1e-6
+
+    if signal.minimum is not None:
+        invalid = ~choices & (scaled < signal.minimum - tolerance)
+
+        if invalid.any():
+            raise EncodeError(
+                f'Expected signal "{signal.name}" value greater than '
+                f'or equal to {signal.minimum} in message "{message.name}", '
+                f'but got {scaled[invalid][0]}.')
+
+    if signal.maximum is not None:
+        invalid = ~choices & (scaled > signal.maximum + tolerance)
+
+        if invalid.any():
+            raise EncodeError(
+                f'Expected signal "{signal.name}" value smaller than '
+                f'or equal to {signal.maximum} in message "{message.name}", '
+                f'but got {scaled[invalid][0]}.')
+
+    return raw
+
+
+def _raw_to_bits(signal: "Signal", raw: "np.ndarray") -> "np.ndarray":
+    """Return the bits of given raw values as unsigned 64 bits integers,
+    raising an ``OverflowError`` if a value does not fit in the
+    signal.
+
+    """
+
+    length = signal.length
+
+    if signal.conversion.is_float:
+        dtype = _FLOAT_DTYPES[length]
+
+        with np.errstate(over='ignore', invalid='ignore'):
+            converted = raw.astype(dtype)
+
+        if length == 16:
+            overflow = np.isfinite(raw) & ~np.isfinite(converted)
+
+            if overflow.any():
+                raise OverflowError('float too large to pack with e format')
+
+        return converted.view(f'u{length // 8}').astype(np.uint64)
+
+    if signal.is_signed:
+        minimum = -(1 << (length - 1))
+        maximum = (1 << (length - 1)) - 1
+        raise_overflow = _raise_signed_overflow
+    else:
+        minimum = 0
+        maximum = (1 << length) - 1
+        raise_overflow = _raise_unsigned_overflow
+
+    if raw.dtype.kind in 'iu':
+        info = np.iinfo(raw.dtype)
+        invalid = np.zeros(len(raw), dtype=bool)
+
+        if minimum > info.min:
+            invalid |= raw < minimum
+
+        if maximum < info.max:
+            invalid |= raw > maximum
+    elif raw.dtype.kind == 'f':
+        # Powers of two are exact floats.
+        invalid = ~((raw >= float(minimum)) & (raw < float(maximum + 1)))
+    else:
+        # Python integers.
+        invalid = ((raw < minimum) | (raw > maximum)).astype(bool)
+
+    if invalid.any():
+        value = raw[invalid][0]
+
+        if raw.dtype.kind == 'f' and np.isfinite(value):
+            value = int(value)
+
+        raise_overflow(value)
+
+    if signal.is_signed:
+        bits = raw.astype(np.int64).view(np.uint64)
+    else:
+        bits = raw.astype(np.uint64)
+
+    if length < 64:
+        bits &= np.uint64((1 << length) - 1)
+
+    return bits
+
+
+def _insert_bits(data: "np.ndarray",
+                 rows: "np.ndarray",
+                 signal: "Signal",
+                 offset: int,
+                 bits: "np.ndarray") -> None:
+    """Insert given bits of given signal into given rows of `data`. This
+    is the inverse of ``_extract_raw()``.
+
+    """
+
+    number_of_bytes = data.shape[1]
+    length = signal.length
+
+    for i in range(number_of_bytes):
+        if signal.byte_order == 'big_endian':
+            position = 8 * (number_of_bytes - 1 - i) - offset
+        else:
+            position = 8 * i - offset
+
+        if position <= -8 or position >= length:
+            continue
+
+        if position >= 0:
+            column = bits >> np.uint64(position)
+        else:
+            column = bits << np.uint64(-position)
+
+        data[rows, i] |= (column & np.uint64(0xff)).astype(np.uint8)
+
+
+def _columns_to_arrays(columns: ColumnsType) -> tuple[dict[str, "np.ndarray"], int]:
+    """Convert given columns to 1-D arrays of equal length. Scalars are
+    repeated for all rows.
+
+    """
+
+    arrays: dict[str, np.ndarray] = {}
+
+    for name, column in columns.items():
+        if isinstance(column, np.ndarray):
+            arrays[name] = column
+        elif isinstance(column, Sequence) and not isinstance(column, str):
+            arrays[name] = _sequence_to_array(column)
+        else:
+            arrays[name] = np.asarray(column)
+    lengths = {len(array) for array in arrays.values() if array.ndim > 0}
+
+    if len(lengths) > 1:
+        raise EncodeError(f'All columns must have the same length, but got '
+                          f'{format_or(sorted(lengths))}')
+
+    number_of_rows = lengths.pop() if lengths else 1
+
+    for name, array in arrays.items():
+        if array.ndim == 0:
+            arrays[name] = np.full(number_of_rows, array.item(),
+                                   dtype=array.dtype)
+        elif array.ndim != 1:
+            raise EncodeError(f'Expected a 1-D column for signal "{name}", '
+                              f'but got {array.ndim} dimensions')
+
+    return arrays, number_of_rows
+
+
+def encode_many(message: "Message",
+                columns: ColumnsType,
+                scaling: bool = True,
+                padding: bool = False,
+                strict: bool = True) -> "np.ndarray":
+    """Encode many frames of given message at once. See
+    :meth:`Message.encode_many()<cantools.database.can.Message.encode_many>`.
+
+    """
+
+    require_numpy()
+
+    if message.is_container:
+        raise EncodeError(f'Message "{message.name}" is a container')
+
+    codecs = message._codecs
+
+    if codecs is None:
+        raise ValueError('Codec is not initialized.')
+
+    arrays, number_of_rows = _columns_to_arrays(columns)
+    length = message.length
+
+    if not _is_vectorisable(codecs, length):
+        # Rare layouts, fall back to encoding one frame at a time.
+        frames = [dict(zip(arrays, values, strict=True))
+                  for values in zip(*[array.tolist()
+                                      for array in arrays.values()],
+                                    strict=True)]
+
+        return np.frombuffer(
+            b''.join([message.encode(frame, scaling, padding, strict)
+                      for frame in frames]),
+            dtype=np.uint8).reshape(number_of_rows, length).copy()
+
+    # Find the rows of every node in the codec tree.
+    nodes: list[tuple[Codec, np.ndarray]] = []
+    used_signals: set[str] = set()
+
+    def gather_node(node: Codec, rows: "np.ndarray") -> None:
+        nodes.append((node, rows))
+
+        for signal in node['signals']:
+            if signal.name not in arrays:
+                if strict:
+                    raise EncodeError(f'The signal "{signal.name}" is '
+                                      f'required for encoding.')
+
+                raise KeyError(signal.name)
+
+            used_signals.add(signal.name)
+
+        for name, children in node['multiplexers'].items():
+            conversion = message.get_signal_by_name(name).conversion
+            values = arrays[name][rows]
+
+            if values.dtype.kind in 'OSU':
+                mux = np.array([_mux_number(conversion, value)
+                                for value in values.tolist()],
+                               dtype=np.int64)
+            else:
+                mux = np.trunc(values).astype(np.int64)
+
+            invalid = ~np.isin(mux, list(children))
+
+            if invalid.any():
+                if strict:
+                    raise EncodeError(
+                        f'A valid value for the multiplexer selector '
+                        f'signal "{name}" is required: Expected one of '
+                        f'{{{format_or(list(children))}}}, but got '
+                        f'{values[invalid][0]}')
+
+                raise EncodeError(f'Expected multiplexer id in '
+                                  f'{{{format_or(list(children))}}}, '
+                                  f'for multiplexer "{name}" '
+                                  f'but got {mux[invalid][0]}')
+
+            for multiplexer_id, child in children.items():
+                child_rows = rows[mux == multiplexer_id]
+
+                if len(child_rows) > 0:
+                    gather_node(child, child_rows)
+
+    gather_node(codecs, np.arange(number_of_rows))
+
+    if strict and used_signals != set(arrays):
+        raise EncodeError(f'The following signals were specified but are '
+                          f'not required to encode the message:'
+                          f'{set(arrays) - used_signals}')
+
+    data = np.zeros((number_of_rows, length), dtype=np.uint8)
+    padding_mask = np.full((number_of_rows, length), 0xff, dtype=np.uint8)
+
+    for node, rows in nodes:
+        offsets = bit_offsets(node['signals'], length)
+        assert offsets is not None
+
+        for signal in node['signals']:
+            raw = _column_to_raw(message,
+                                 signal,
+                                 arrays[signal.name][rows],
+                                 scaling,
+                                 strict)
+            _insert_bits(data,
+                         rows,
+                         signal,
+                         offsets[signal.name],
+                         _raw_to_bits(signal, raw))
+
+        mask = node['formats'].padding_mask.to_bytes(length, 'big')
+        padding_mask[rows] &= np.frombuffer(mask, dtype=np.uint8)
+
+    if padding:
+        data |= padding_mask & np.uint8(message._unused_bit_pattern)
+
+    return data
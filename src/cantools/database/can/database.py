@@ -1,7 +1,11 @@
+import io
 import logging
 from collections import OrderedDict
+from collections.abc import Callable
 from typing import (
+    TYPE_CHECKING,
     Any,
+    BinaryIO,
     TextIO,
 )
 
@@ -15,13 +19,24 @@ from ..utils import (
     type_sort_signals,
 )
 from .bus import Bus
-from .formats import arxml, dbc, kcd, sym
-from .formats.arxml import AutosarDatabaseSpecifics
-from .formats.dbc import DbcSpecifics
+from .decode_cache import DecodeCache
+from .formats.arxml.database_specifics import AutosarDatabaseSpecifics
+from .formats.dbc_specifics import DbcSpecifics
+from .frame_id_resolver import FrameIdResolver
 from .internal_database import InternalDatabase
 from .message import Message
 from .node import Node
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy as np
+
+    from ..batch import PayloadsType
+    from ..content_cache import ContentCache
+    from .formats.cdb import CdbMessageIndex
+    from .formats.dbc import DbcMessageIndex
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -41,6 +56,14 @@ class Database:
     If you don't want them to be sorted pass `sort_signals = None`.
     If you want the signals to be sorted in another way pass something like
     `sort_signals = lambda signals: list(sorted(signals, key=lambda sig: sig.name))`
+
+    Frame ids not found by their (masked) value are passed to
+    `frame_id_resolver`, a :class:`FrameIdResolver
+    <cantools.database.can.frame_id_resolver.FrameIdResolver>`, if
+    given. For example, pass a :class:`J1939FrameIdResolver
+    <cantools.database.can.frame_id_resolver.J1939FrameIdResolver>` to
+    find J1939 messages by parameter group number, ignoring priority
+    and addresses.
     """
 
     def __init__(self,
@@ -53,6 +76,7 @@ class Database:
                  frame_id_mask: int | None = None,
                  strict: bool = True,
                  sort_signals: type_sort_signals = sort_signals_by_start_bit,
+                 frame_id_resolver: FrameIdResolver | None = None,
                  ) -> None:
         self._messages = messages or []
         self._nodes = nodes or []
@@ -69,6 +93,13 @@ class Database:
         self._frame_id_mask = frame_id_mask
         self._strict = strict
         self._sort_signals: type_sort_signals = sort_signals
+        self._frame_id_resolver = frame_id_resolver
+        self._decode_cache: DecodeCache | None = None
+        self._content_cache: ContentCache | None = None
+        self._lazy_messages: DbcMessageIndex | CdbMessageIndex | None = None
+        self._lazy_start = 0
+        self._lazy_name_to_index: dict[str, int] = {}
+        self._lazy_frame_id_to_index: dict[int, int] = {}
         self.refresh()
 
     @property
@@ -79,8 +110,14 @@ class Database:
         :meth:`.get_message_by_name()` to find a message by its frame
         id or name.
 
+        Lazily loaded DBC and CDB data is loaded completely when the
+        list is accessed.
+
         """
 
+        if self._lazy_messages is not None:
+            self._load_lazy_messages()
+
         return self._messages
 
     @property
@@ -99,6 +136,55 @@ class Database:
 
         return self._buses
 
+    @property
+    def frame_id_resolver(self) -> FrameIdResolver | None:
+        """The resolver of frame ids not found in the frame id table, or
+        ``None``.
+
+        """
+
+        return self._frame_id_resolver
+
+    @frame_id_resolver.setter
+    def frame_id_resolver(self, value: FrameIdResolver | None) -> None:
+        self._frame_id_resolver = value
+
+        if value is not None:
+            value.refresh(self._messages)
+
+    @property
+    def decode_cache(self) -> DecodeCache | None:
+        """The :class:`DecodeCache
+        <cantools.database.can.decode_cache.DecodeCache>` shared by all
+        messages in the database, or ``None`` if decoded payloads are
+        not cached.
+
+        """
+
+        return self._decode_cache
+
+    @decode_cache.setter
+    def decode_cache(self, value: DecodeCache | None) -> None:
+        self._decode_cache = value
+
+        for message in self._messages:
+            message.decode_cache = value
+
+    @property
+    def content_cache(self) -> "ContentCache | None":
+        """The :class:`ContentCache
+        <cantools.database.content_cache.ContentCache>` of data parsed by
+        the ``add_*_string()`` methods, or ``None`` if parsed data is
+        not cached.
+
+        """
+
+        return self._content_cache
+
+    @content_cache.setter
+    def content_cache(self, value: "ContentCache | None") -> None:
+        self._content_cache = value
+
     @property
     def version(self) -> str | None:
         """The database version, or ``None`` if unavailable.
@@ -264,9 +350,17 @@ class Database:
         """Read and parse ARXML data from given file-like object and add the
         parsed data to the database.
 
+        The data is parsed while it is read from `fp`, and elements not
+        used by the database, for example software components, are
+        released while parsing. This makes loading large system
+        descriptions faster and uses much less memory.
+
         """
 
-        self.add_arxml_string(fp.read())
+        from .formats import arxml  # noqa: PLC0415
+
+        self._add_arxml_database(
+            arxml.load(fp, self._strict, sort_signals=self._sort_signals))
 
     def add_arxml_file(self,
                        filename: StringPathLike,
@@ -287,9 +381,18 @@ class Database:
 
         """
 
-        database = arxml.load_string(string, self._strict, sort_signals=self._sort_signals)
+        from .formats import arxml  # noqa: PLC0415
 
-        self._messages += database.messages
+        self._add_arxml_database(
+            self._load_string_cached(
+                'arxml',
+                string,
+                lambda: arxml.load_string(string,
+                                          self._strict,
+                                          sort_signals=self._sort_signals)))
+
+    def _add_arxml_database(self, database: InternalDatabase) -> None:
+        self.messages.extend(database.messages)
         self._nodes = database.nodes
         self._buses = database.buses
         self._version = database.version
@@ -297,53 +400,269 @@ class Database:
         self._autosar = database.autosar
         self.refresh()
 
-    def add_dbc(self, fp: TextIO) -> None:
+    def add_dbc(self,
+                fp: TextIO,
+                parser: str = 'textparser',
+                lazy: bool = False) -> None:
         """Read and parse DBC data from given file-like object and add the
         parsed data to the database.
 
+        `parser` is ``'textparser'`` or ``'streaming'``. The streaming
+        parser parses the data while reading it from `fp`, which is
+        faster and uses less memory for large files. Both parsers
+        create identical databases.
+
+        If `lazy` is ``True`` only the frame ids and names of the
+        messages are indexed, and each message is parsed when it is
+        first found by :meth:`.get_message_by_frame_id()`,
+        :meth:`.get_message_by_name()`, :meth:`.encode_message()` or
+        :meth:`.decode_message()`. Accessing :attr:`.messages` loads all
+        messages. The frame id resolver only finds loaded messages. See
+        :class:`DbcMessageIndex
+        <cantools.database.can.formats.DbcMessageIndex>` for
+        details.
+
         >>> db = cantools.database.Database()
         >>> with open ('foo.dbc', 'r') as fin:
         ...     db.add_dbc(fin)
 
         """
 
-        self.add_dbc_string(fp.read())
+        from .formats import dbc  # noqa: PLC0415
+
+        if parser == 'streaming' and not lazy:
+            self._add_dbc_database(
+                dbc.load(fp, self._strict, sort_signals=self._sort_signals))
+        else:
+            self.add_dbc_string(fp.read(), parser, lazy)
 
     def add_dbc_file(self,
                      filename: StringPathLike,
-                     encoding: str = 'cp1252') -> None:
+                     encoding: str = 'cp1252',
+                     parser: str = 'textparser',
+                     lazy: bool = False) -> None:
         """Open, read and parse DBC data from given file and add the parsed
         data to the database.
 
         `encoding` specifies the file encoding.
 
+        See :meth:`.add_dbc()` for descriptions of `parser` and `lazy`.
+
         >>> db = cantools.database.Database()
         >>> db.add_dbc_file('foo.dbc')
 
         """
 
         with open(filename, encoding=encoding, errors='replace') as fin:
-            self.add_dbc(fin)
+            self.add_dbc(fin, parser, lazy)
 
-    def add_dbc_string(self, string: str) -> None:
+    def add_dbc_string(self,
+                       string: str,
+                       parser: str = 'textparser',
+                       lazy: bool = False) -> None:
         """Parse given DBC data string and add the parsed data to the
         database.
 
+        See :meth:`.add_dbc()` for descriptions of `parser` and `lazy`.
+
         >>> db = cantools.database.Database()
         >>> with open ('foo.dbc', 'r') as fin:
         ...     db.add_dbc_string(fin.read())
 
         """
 
-        database = dbc.load_string(string, self._strict, sort_signals=self._sort_signals)
+        from .formats import dbc  # noqa: PLC0415
+
+        if lazy:
+            self._add_message_index(dbc.DbcMessageIndex(string,
+                                                        self._strict,
+                                                        self._sort_signals,
+                                                        parser))
+
+            return
+
+        if parser == 'streaming':
+            def load() -> InternalDatabase:
+                return dbc.load(io.StringIO(string),
+                                self._strict,
+                                sort_signals=self._sort_signals)
+        elif parser == 'textparser':
+            def load() -> InternalDatabase:
+                return dbc.load_string(string,
+                                       self._strict,
+                                       sort_signals=self._sort_signals)
+        else:
+            raise ValueError(
+                f"expected DBC parser 'textparser' or 'streaming', but got "
+                f"'{parser}'")
 
-        self._messages += database.messages
+        # Both parsers create identical databases.
+        self._add_dbc_database(self._load_string_cached('dbc', string, load))
+
+    def _add_dbc_database(self, database: InternalDatabase) -> None:
+        self.messages.extend(database.messages)
         self._nodes = database.nodes
         self._buses = database.buses
         self._version = database.version
         self._dbc = database.dbc
         self.refresh()
 
+    def _load_string_cached(self,
+                            database_format: str,
+                            string: str,
+                            load: Callable[[], InternalDatabase]) -> InternalDatabase:
+        """Return the parsed database of given data string `string` from
+        the content cache, or parse it with `load` and add it to the
+        cache.
+
+        """
+
+        cache = self._content_cache
+
+        if cache is None:
+            return load()
+
+        key = cache.key(string,
+                        'can.Database',
+                        database_format,
+                        self._strict,
+                        self._sort_signals)
+
+        if key is None:
+            return load()
+
+        database = cache.get(key)
+
+        if isinstance(database, InternalDatabase):
+            return database
+
+        database = load()
+        cache.put(key, database)
+
+        return database
+
+    def _add_internal_databases(self,
+                                databases: list[InternalDatabase]) -> None:
+        """Add the messages of given parsed databases `databases`, as if
+        they were added one after another by the ``add_*()`` methods,
+        but refresh the lookup tables only once.
+
+        """
+
+        for database in databases:
+            self.messages.extend(database.messages)
+            self._nodes = database.nodes
+            self._buses = database.buses
+            self._version = database.version
+            self._dbc = database.dbc
+
+            if database.autosar is not None:
+                self._autosar = database.autosar
+
+        self.refresh()
+
+    def _add_message_index(self,
+                           index: "DbcMessageIndex | CdbMessageIndex") -> None:
+        """Add the messages of given message index `index`, which are
+        loaded on first use.
+
+        """
+
+        self._add_internal_databases([index.database])
+        self._lazy_messages = index
+        self._lazy_start = len(self._messages)
+        self.refresh()
+
+    def _load_lazy_message(self, index: int) -> Message:
+        """Load the lazily loaded message at given index `index` and add
+        it to the lookup tables.
+
+        """
+
+        assert self._lazy_messages is not None
+        message = self._lazy_messages.load(index)
+
+        if self._decode_cache is not None:
+            message.decode_cache = self._decode_cache
+
+        self._messages.append(message)
+        self._add_message(message)
+
+        name = self._lazy_messages.names[index]
+        key = self._masked_dbc_frame_id(self._lazy_messages.frame_ids[index])
+
+        if self._lazy_name_to_index.get(name) == index:
+            del self._lazy_name_to_index[name]
+
+        if self._lazy_frame_id_to_index.get(key) == index:
+            del self._lazy_frame_id_to_index[key]
+
+        if self._frame_id_resolver is not None:
+            self._frame_id_resolver.refresh(self._messages)
+
+        return message
+
+    def _load_lazy_messages(self) -> None:
+        """Load all lazily loaded messages, in the order of the DBC data.
+
+        """
+
+        assert self._lazy_messages is not None
+        self._messages[self._lazy_start:] = self._lazy_messages.load_all()
+        self._lazy_messages = None
+        self.refresh()
+
+    def add_cdb(self, fp: BinaryIO) -> None:
+        """Read CDB data from given binary file-like object and add it to
+        the database.
+
+        See :meth:`.add_cdb_bytes()`.
+
+        """
+
+        self.add_cdb_bytes(fp.read())
+
+    def add_cdb_file(self, filename: StringPathLike) -> None:
+        """Memory map CDB data from given file and add it to the database.
+
+        The file stays mapped until all messages are loaded, for
+        example by accessing :attr:`.messages`. It must not be
+        truncated or replaced before, as accessing a truncated mapped
+        file crashes the process with ``SIGBUS`` on some operating
+        systems, and mapped files can not be replaced on Windows.
+
+        See :meth:`.add_cdb_bytes()`.
+
+        >>> db = cantools.database.Database()
+        >>> db.add_cdb_file('foo.cdb')
+
+        """
+
+        from .formats import cdb  # noqa: PLC0415
+
+        self._add_message_index(
+            cdb.CdbMessageIndex(cdb.map_file(filename),
+                                self._strict,
+                                self._sort_signals,
+                                close_data=True))
+
+    def add_cdb_bytes(self, data: Any) -> None:
+        """Add given CDB data `data`, a bytes-like object, to the database.
+
+        Only the frame ids and names of the messages are read, and
+        each message is created when it is first found by
+        :meth:`.get_message_by_frame_id()`,
+        :meth:`.get_message_by_name()`, :meth:`.encode_message()` or
+        :meth:`.decode_message()`, as for DBC data added with `lazy`
+        set to ``True``. See :meth:`.add_dbc()`.
+
+        """
+
+        from .formats.cdb import CdbMessageIndex  # noqa: PLC0415
+
+        self._add_message_index(
+            CdbMessageIndex(data, self._strict, self._sort_signals))
+
     def add_kcd(self, fp: TextIO) -> None:
         """Read and parse KCD data from given file-like object and add the
         parsed data to the database.
@@ -371,9 +690,16 @@ class Database:
 
         """
 
-        database = kcd.load_string(string, self._strict, sort_signals=self._sort_signals)
+        from .formats import kcd  # noqa: PLC0415
+
+        database = self._load_string_cached(
+            'kcd',
+            string,
+            lambda: kcd.load_string(string,
+                                    self._strict,
+                                    sort_signals=self._sort_signals))
 
-        self._messages += database.messages
+        self.messages.extend(database.messages)
         self._nodes = database.nodes
         self._buses = database.buses
         self._version = database.version
@@ -407,9 +733,16 @@ class Database:
 
         """
 
-        database = sym.load_string(string, self._strict, sort_signals=self._sort_signals)
+        from .formats import sym  # noqa: PLC0415
 
-        self._messages += database.messages
+        database = self._load_string_cached(
+            'sym',
+            string,
+            lambda: sym.load_string(string,
+                                    self._strict,
+                                    sort_signals=self._sort_signals))
+
+        self.messages.extend(database.messages)
         self._nodes = database.nodes
         self._buses = database.buses
         self._version = database.version
@@ -457,7 +790,9 @@ class Database:
         if not self._sort_signals and sort_signals == SORT_SIGNALS_DEFAULT:
             sort_signals = None
 
-        return dbc.dump_string(InternalDatabase(self._messages,
+        from .formats import dbc  # noqa: PLC0415
+
+        return dbc.dump_string(InternalDatabase(self.messages,
                                                 self._nodes,
                                                 self._buses,
                                                 self._version,
@@ -475,7 +810,9 @@ class Database:
         if not self._sort_signals and sort_signals == SORT_SIGNALS_DEFAULT:
             sort_signals = None
 
-        return kcd.dump_string(InternalDatabase(self._messages,
+        from .formats import kcd  # noqa: PLC0415
+
+        return kcd.dump_string(InternalDatabase(self.messages,
                                                 self._nodes,
                                                 self._buses,
                                                 self._version,
@@ -489,29 +826,84 @@ class Database:
         if not self._sort_signals and sort_signals == SORT_SIGNALS_DEFAULT:
             sort_signals = None
 
-        return sym.dump_string(InternalDatabase(self._messages,
+        from .formats import sym  # noqa: PLC0415
+
+        return sym.dump_string(InternalDatabase(self.messages,
                                                 self._nodes,
                                                 self._buses,
                                                 self._version,
                                                 self._dbc),
                                sort_signals=sort_signals)
 
+    def as_cdb_bytes(self) -> bytes:
+        """Return the database as bytes formatted as a CDB file.
+
+        CDB is a compact binary format of cantools, which is opened
+        much faster than text formats. Format specific properties, for
+        example DBC attributes and AUTOSAR end-to-end protection, are
+        not stored.
+
+        """
+
+        from .formats import cdb  # noqa: PLC0415
+
+        return cdb.dump_bytes(InternalDatabase(self.messages,
+                                               self._nodes,
+                                               self._buses,
+                                               self._version))
+
     def get_message_by_name(self, name: str) -> Message:
         """Find the message object for given name `name`.
 
         """
 
-        return self._name_to_message[name]
+        try:
+            return self._name_to_message[name]
+        except KeyError:
+            if name not in self._lazy_name_to_index:
+                raise
+
+            return self._load_lazy_message(self._lazy_name_to_index[name])
 
     def get_message_by_frame_id(self, frame_id: int, force_extended_id: bool = False) -> Message:
         """Find the message object for given frame id `frame_id`.
 
         """
 
-        if force_extended_id or frame_id > 0x7FF:
-            frame_id |= 0x80000000
+        is_extended_frame = force_extended_id or frame_id > 0x7FF
+        key = frame_id & self._frame_id_mask
+
+        if is_extended_frame:
+            key |= 0x80000000
+
+        return self._lookup_frame_id(key, frame_id, is_extended_frame)
+
+    def _lookup_frame_id(self,
+                         key: int,
+                         frame_id: int,
+                         is_extended_frame: bool) -> Message:
+        """Find the message for given frame id table key `key`, or ask
+        the frame id resolver for raw frame id `frame_id` if not found.
+
+        """
+
+        try:
+            return self._frame_id_to_message[key]
+        except KeyError:
+            if key in self._lazy_frame_id_to_index:
+                return self._load_lazy_message(
+                    self._lazy_frame_id_to_index[key])
+
+            if self._frame_id_resolver is None:
+                raise
+
+            message = self._frame_id_resolver.resolve(frame_id,
+                                                      is_extended_frame)
 
-        return self._frame_id_to_message[frame_id & (0x80000000 | self._frame_id_mask)]
+            if message is None:
+                raise
+
+            return message
 
     def get_node_by_name(self, name: str) -> Node:
         """Find the node object for given name `name`.
@@ -564,11 +956,13 @@ class Database:
         """
 
         if isinstance(frame_id_or_name, int):
-            if force_extended_id or frame_id_or_name > 0x7FF:
-                frame_id_or_name |= 0x80000000
-            message = self._frame_id_to_message[frame_id_or_name]
+            is_extended_frame = force_extended_id or frame_id_or_name > 0x7FF
+            message = self._lookup_frame_id(
+                frame_id_or_name | (0x80000000 if is_extended_frame else 0),
+                frame_id_or_name,
+                is_extended_frame)
         elif isinstance(frame_id_or_name, str):
-            message = self._name_to_message[frame_id_or_name]
+            message = self.get_message_by_name(frame_id_or_name)
         else:
             raise ValueError(f"Invalid frame_id_or_name '{frame_id_or_name}'") # noqa: TRY004
 
@@ -606,14 +1000,19 @@ class Database:
         expect this to misbehave. Trying to decode a container message
         with `decode_containers` set to ``False`` will raise a
         `DecodeError`.
+
+        See :attr:`decode_cache` to cache the decoded signals of
+        repeated payloads.
         """
 
         if isinstance(frame_id_or_name, int):
-            if force_extended_id or frame_id_or_name > 0x7FF:
-                frame_id_or_name |= 0x80000000
-            message = self._frame_id_to_message[frame_id_or_name]
+            is_extended_frame = force_extended_id or frame_id_or_name > 0x7FF
+            message = self._lookup_frame_id(
+                frame_id_or_name | (0x80000000 if is_extended_frame else 0),
+                frame_id_or_name,
+                is_extended_frame)
         elif isinstance(frame_id_or_name, str):
-            message = self._name_to_message[frame_id_or_name]
+            message = self.get_message_by_name(frame_id_or_name)
         else:
             raise ValueError(f"Invalid frame_id_or_name '{frame_id_or_name}'") # noqa: TRY004
 
@@ -634,6 +1033,46 @@ class Database:
                               scaling,
                               allow_truncated=allow_truncated)
 
+    def decode_many(self,
+                    frame_ids: "Sequence[int] | np.ndarray",
+                    payloads: "PayloadsType",
+                    decode_choices: bool = False,
+                    scaling: bool = True,
+                    force_extended_id: bool = False,
+                    ) -> dict[str, tuple["np.ndarray", dict[str, "np.ndarray"]]]:
+        """Decode many frames of any messages at once. Requires the
+        optional ``numpy`` package.
+
+        `frame_ids` are the frame ids of the frames and `payloads`
+        their payloads, either as a 2-D ``uint8`` array with one
+        payload per row or as a sequence of ``bytes`` objects.
+
+        Returns a dictionary that maps the name of every decoded
+        message to a tuple of the indices of its frames and the signal
+        arrays returned by :meth:`Message.decode_many()
+        <cantools.database.can.Message.decode_many>`. Frames with
+        unknown frame ids and frames of container messages are
+        skipped.
+
+        >>> frame_ids = [158, 160, 158]
+        >>> payloads = [b'\\x01\\x45\\x23\\x00\\x11',
+        ...             b'\\x01\\x00',
+        ...             b'\\x02\\x45\\x23\\x00\\x11']
+        >>> db.decode_many(frame_ids, payloads)
+        {'Foo': (array([0, 2]), {'Bar': array([1, 2]), 'Fum': array([5., 5.])}),
+         'Bar': (array([1]), {'Baz': array([1])})}
+
+        """
+
+        from ..batch import decode_many_frames  # noqa: PLC0415
+
+        return decode_many_frames(self,
+                                  frame_ids,
+                                  payloads,
+                                  decode_choices,
+                                  scaling,
+                                  force_extended_id)
+
     def refresh(self) -> None:
         """Refresh the internal database state.
 
@@ -647,9 +1086,51 @@ class Database:
         self._frame_id_to_message = {}
 
         for message in self._messages:
+            if self._decode_cache is not None:
+                message.decode_cache = self._decode_cache
+
             message.refresh(self._strict)
             self._add_message(message)
 
+        if self._frame_id_resolver is not None:
+            self._frame_id_resolver.refresh(self._messages)
+
+        self._lazy_name_to_index = {}
+        self._lazy_frame_id_to_index = {}
+
+        if self._lazy_messages is not None:
+            lazy_messages = self._lazy_messages
+            frame_ids = lazy_messages.frame_ids
+            names = lazy_messages.names
+            indices = [
+                index
+                for index in range(len(lazy_messages))
+                if not lazy_messages.is_loaded(index)
+            ]
+
+            # Same as _masked_dbc_frame_id(), but much faster for large
+            # databases.
+            key_mask = (self._frame_id_mask & 0x7fffffff) | 0x80000000
+            self._lazy_name_to_index = {
+                names[index]: index for index in indices
+            }
+            self._lazy_frame_id_to_index = {
+                frame_ids[index] & key_mask: index for index in indices
+            }
+
+    def _masked_dbc_frame_id(self, frame_id_dbc: int) -> int:
+        """Returns the frame id table key of given DBC frame id
+        `frame_id_dbc`, which has bit 31 set for extended frames.
+
+        """
+
+        masked_frame_id = (frame_id_dbc & 0x7fffffff & self._frame_id_mask)
+
+        if frame_id_dbc & 0x80000000:
+            masked_frame_id |= 0x80000000
+
+        return masked_frame_id
+
     def __repr__(self) -> str:
         lines = [f"version('{self._version}')", '']
 
@@ -659,7 +1140,7 @@ class Database:
 
             lines.append('')
 
-        for message in self._messages:
+        for message in self.messages:
             lines.append(repr(message))
 
             for signal in message.signals:
@@ -0,0 +1,122 @@
+# A least recently used cache of decoded messages.
+
+from collections import OrderedDict
+from collections.abc import Hashable, Mapping
+from types import MappingProxyType
+from typing import Any
+
+from ...typechecking import SignalDictType
+
+
+class DecodeCache:
+    """A bounded least recently used cache of decoded signals, keyed by
+    message, payload and decode flags.
+
+    Assign a cache to :attr:`Message.decode_cache
+    <cantools.database.can.Message.decode_cache>` or
+    :attr:`Database.decode_cache
+    <cantools.database.can.Database.decode_cache>` to return cached
+    results when the same payload is decoded again, which is common
+    for cyclic frames with unchanged contents. Cached results are
+    read-only mappings shared by all callers.
+
+    >>> db.decode_cache = DecodeCache(maxsize=256)
+    >>> db.decode_message(158, b'\\x01\\x45\\x23\\x00\\x11')
+    mappingproxy({'Bar': 1, 'Fum': 5.0})
+    >>> db.decode_cache.hits, db.decode_cache.misses
+    (0, 1)
+
+    """
+
+    def __init__(self, maxsize: int = 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f'Expected a maximum size of at least 1, but got {maxsize}.')
+
+        self._maxsize = maxsize
+        self._entries: OrderedDict[Hashable, Mapping[str, Any]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of cached results.
+
+        """
+
+        return self._maxsize
+
+    @property
+    def currsize(self) -> int:
+        """The current number of cached results.
+
+        """
+
+        return len(self._entries)
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found a cached result.
+
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that did not find a cached result.
+
+        """
+
+        return self._misses
+
+    def get(self, key: Hashable) -> Mapping[str, Any] | None:
+        """Return the cached result for given key `key`, or ``None`` if
+        not cached.
+
+        """
+
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self._misses += 1
+
+            return None
+
+        self._entries.move_to_end(key)
+        self._hits += 1
+
+        return value
+
+    def put(self, key: Hashable, value: SignalDictType) -> Mapping[str, Any]:
+        """Cache given decoded signals `value` for key `key`, and return
+        them as a read-only mapping. The least recently used result is
+        dropped if the cache is full.
+
+        """
+
+        entry = MappingProxyType(value)
+        self._entries[key] = entry
+
+        if len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+        return entry
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the hit and miss counters.
+
+        """
+
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Cached results are not pickled.
+        return (DecodeCache, (self._maxsize,))
+
+    def __repr__(self) -> str:
+        return (f'DecodeCache(maxsize={self._maxsize}, '
+                f'currsize={self.currsize}, '
+                f'hits={self._hits}, '
+                f'misses={self._misses})')
@@ -0,0 +1,17 @@
+import importlib
+from typing import Any
+
+# The formats are imported when first used, as only the format of the
+# loaded database is needed.
+_SUBMODULES = ["arxml", "cdb", "dbc", "kcd", "sym"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f'.{name}', __name__)
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_SUBMODULES))
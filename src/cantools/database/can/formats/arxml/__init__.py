@@ -1,22 +1,78 @@
+from __future__ import annotations
+
 __all__ = ["AutosarBusSpecifics", "AutosarDatabaseSpecifics",
            "AutosarEnd2EndProperties", "AutosarMessageSpecifics",
-           "AutosarNodeSpecifics", "AutosarSecOCProperties", "load_string"]
+           "AutosarNodeSpecifics", "AutosarSecOCProperties", "load",
+           "load_string"]
 
 import re
-from typing import Any
-from xml.etree import ElementTree
-
-from cantools.database.can.internal_database import InternalDatabase
+from typing import TYPE_CHECKING, Any, TextIO
 
 from ....utils import sort_signals_by_start_bit, type_sort_signals
 from .bus_specifics import AutosarBusSpecifics
 from .database_specifics import AutosarDatabaseSpecifics
-from .ecu_extract_loader import EcuExtractLoader
 from .end_to_end_properties import AutosarEnd2EndProperties
 from .message_specifics import AutosarMessageSpecifics
 from .node_specifics import AutosarNodeSpecifics
 from .secoc_properties import AutosarSecOCProperties
-from .system_loader import SystemLoader
+
+if TYPE_CHECKING:
+    from cantools.database.can.internal_database import InternalDatabase
+
+# Kinds of package elements that are not used by the loaders, but
+# may be large, for example software components and port interfaces.
+# They are dropped by load() while parsing. Elements of all other
+# kinds are kept.
+DROPPED_ELEMENT_KINDS = frozenset([
+    'APPLICATION-ARRAY-DATA-TYPE',
+    'APPLICATION-PRIMITIVE-DATA-TYPE',
+    'APPLICATION-RECORD-DATA-TYPE',
+    'APPLICATION-SW-COMPONENT-TYPE',
+    'BSW-IMPLEMENTATION',
+    'BSW-MODULE-DESCRIPTION',
+    'BSW-MODULE-ENTRY',
+    'CLIENT-SERVER-INTERFACE',
+    'COMPLEX-DEVICE-DRIVER-SW-COMPONENT-TYPE',
+    'COMPOSITION-SW-COMPONENT-TYPE',
+    'DATA-TYPE-MAPPING-SET',
+    'ECU-ABSTRACTION-SW-COMPONENT-TYPE',
+    'IMPLEMENTATION-DATA-TYPE',
+    'MODE-DECLARATION-GROUP',
+    'MODE-SWITCH-INTERFACE',
+    'NV-BLOCK-SW-COMPONENT-TYPE',
+    'NV-DATA-INTERFACE',
+    'PARAMETER-INTERFACE',
+    'PARAMETER-SW-COMPONENT-TYPE',
+    'PORT-INTERFACE-MAPPING-SET',
+    'SENDER-RECEIVER-INTERFACE',
+    'SENSOR-ACTUATOR-SW-COMPONENT-TYPE',
+    'SERVICE-SW-COMPONENT-TYPE',
+    'SWC-BSW-MAPPING',
+    'SWC-IMPLEMENTATION',
+    'SWC-TIMING',
+    'TRIGGER-INTERFACE'
+])
+
+# Children of loaded elements that are not used by the loaders.
+DROPPED_CHILDREN = {
+    'SYSTEM': frozenset(['MAPPINGS'])
+}
+
+
+def __getattr__(name: str) -> Any:
+    # The loaders are imported when first used, as the specifics
+    # classes above are imported by all CAN databases.
+    if name == 'EcuExtractLoader':
+        from .ecu_extract_loader import EcuExtractLoader  # noqa: PLC0415
+
+        return EcuExtractLoader
+
+    if name == 'SystemLoader':
+        from .system_loader import SystemLoader  # noqa: PLC0415
+
+        return SystemLoader
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 def is_ecu_extract(root: Any # For whatever reason, mypy does not
@@ -42,6 +98,56 @@ def is_ecu_extract(root: Any # For whatever reason, mypy does not
 
     return ecuc_value_collection is not None
 
+def _iterparse(fp: TextIO) -> Any:
+    """Parse ARXML data read from given file-like object `fp` and return
+    the root element. Subtrees not used by the loaders are released as
+    soon as they are parsed.
+
+    """
+
+    root = None
+    stack: list[Any] = []
+    dropped = None
+
+    from xml.etree import ElementTree  # noqa: PLC0415
+
+    for event, elem in ElementTree.iterparse(fp, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            elif dropped is None:
+                parent_kind = stack[-1].tag.rpartition('}')[2]
+                kind = elem.tag.rpartition('}')[2]
+
+                if parent_kind == 'ELEMENTS':
+                    if kind in DROPPED_ELEMENT_KINDS:
+                        dropped = elem
+                elif kind in DROPPED_CHILDREN.get(parent_kind, ()):
+                    dropped = elem
+
+            stack.append(elem)
+        else:
+            stack.pop()
+
+            if elem is dropped:
+                stack[-1].remove(elem)
+                dropped = None
+            elif dropped is not None:
+                elem.clear()
+
+    return root
+
+def load(fp: TextIO,
+         strict: bool = True,
+         sort_signals: type_sort_signals = sort_signals_by_start_bit) \
+            -> InternalDatabase:
+    """Parse ARXML data read from given file-like object incrementally,
+    keeping only the elements used to load the database.
+
+    """
+
+    return _load_root(_iterparse(fp), strict, sort_signals)
+
 def load_string(string:str,
                 strict:bool=True,
                 sort_signals:type_sort_signals=sort_signals_by_start_bit) \
@@ -50,8 +156,13 @@ def load_string(string:str,
 
     """
 
-    root = ElementTree.fromstring(string)
+    from xml.etree import ElementTree  # noqa: PLC0415
 
+    return _load_root(ElementTree.fromstring(string), strict, sort_signals)
+
+def _load_root(root: Any,
+               strict: bool,
+               sort_signals: type_sort_signals) -> InternalDatabase:
     m = re.match(r'{(.*)}AUTOSAR', root.tag)
     if not m:
         raise ValueError(f"No XML namespace specified or illegal root tag name '{root.tag}'")
@@ -73,6 +184,10 @@ def load_string(string:str,
             raise ValueError(f'Expected root element tag {expected_root}, '
                              f'but got {root.tag}.')
 
+        from .ecu_extract_loader import EcuExtractLoader  # noqa: PLC0415
+
         return EcuExtractLoader(root, strict, sort_signals).load()
     else:
+        from .system_loader import SystemLoader  # noqa: PLC0415
+
         return SystemLoader(root, strict, sort_signals).load()
@@ -97,6 +97,31 @@ class SystemLoader:
 
         self._create_arxml_reference_dicts()
 
+        # memo table of resolved ARXML references and its statistics
+        self._arxml_reference_cache: dict[tuple[Any, ...], Any] = {}
+        self._arxml_reference_cache_hits = 0
+        self._arxml_reference_cache_misses = 0
+
+        # ARXML path of a PDU -> list of messages featuring it. This
+        # is populated once all messages have been loaded.
+        self._pdu_path_to_messages: dict[str, list[Message]] = {}
+
+    @property
+    def reference_cache_hits(self):
+        """The number of ARXML references that were resolved using the
+        memo table.
+        """
+
+        return self._arxml_reference_cache_hits
+
+    @property
+    def reference_cache_misses(self):
+        """The number of ARXML references that had to be resolved by
+        path.
+        """
+
+        return self._arxml_reference_cache_misses
+
     def autosar_version_newer(self, major, minor=None, patch=None):
         """Returns true iff the AUTOSAR version specified in the ARXML it at
         least as the version specified by the function parameters
@@ -150,6 +175,7 @@ class SystemLoader:
         buses = self._load_buses(root_packages)
         nodes = self._load_nodes(root_packages)
         messages = self._load_messages(root_packages)
+        self._create_pdu_path_index(messages)
 
         # the senders and receivers can only be loaded once all
         # messages are known...
@@ -172,6 +198,10 @@ class SystemLoader:
         # the data IDs (for end-to-end protection)
         self._load_e2e_properties(root_packages, messages)
 
+        LOGGER.debug(f'Resolved ARXML references with '
+                     f'{self._arxml_reference_cache_hits} memo table hits '
+                     f'and {self._arxml_reference_cache_misses} misses')
+
         return InternalDatabase(buses=buses,
                                 nodes=nodes,
                                 messages=messages,
@@ -311,22 +341,29 @@ class SystemLoader:
 
             self._load_senders_and_receivers(sub_package_list, messages)
 
-    # given a list of Message objects and an reference to a PDU by its absolute ARXML path,
-    # return the subset of messages of the list which feature the specified PDU.
-    def __get_messages_of_pdu(self, msg_list, pdu_path):
-        pdu_messages = \
-            [ x for x in msg_list if pdu_path in x.autosar.pdu_paths ]
-
-        # add all messages featured by container frames
-        for message in msg_list:
-            if message.contained_messages is None:
-                continue
-
-            pdu_messages.extend(
-                [
-                    x for x in message.contained_messages
-                          if pdu_path in x.autosar.pdu_paths
-                 ])
+    # create the reverse index of the PDUs featured by a list of
+    # Message objects, i.e., a dictionary from the absolute ARXML path
+    # of each PDU to the messages featuring it. The messages featured
+    # by container frames come after all top-level messages.
+    def _create_pdu_path_index(self, msg_list):
+        self._pdu_path_to_messages = {}
+
+        contained_messages = [
+            x
+            for message in msg_list
+            if message.contained_messages is not None
+            for x in message.contained_messages
+        ]
+
+        for message in [*msg_list, *contained_messages]:
+            for pdu_path in dict.fromkeys(message.autosar.pdu_paths):
+                self._pdu_path_to_messages.setdefault(pdu_path, []) \
+                                          .append(message)
+
+    # given a reference to a PDU by its absolute ARXML path, return
+    # the loaded messages which feature the specified PDU.
+    def __get_messages_of_pdu(self, pdu_path):
+        pdu_messages = self._pdu_path_to_messages.get(pdu_path, [])
 
         if len(pdu_messages) < 1:
             # hm: the data set seems to be inconsistent
@@ -378,8 +415,7 @@ class SystemLoader:
 
             for pdu in self._get_arxml_children(pdu_group, pdu_spec):
                 pdu_path = self._node_to_arxml_path.get(pdu)
-                pdu_messages = \
-                    self.__get_messages_of_pdu(messages, pdu_path)
+                pdu_messages = self.__get_messages_of_pdu(pdu_path)
 
                 if comm_dir == 'IN':
                     for pdu_message in pdu_messages:
@@ -445,8 +481,7 @@ class SystemLoader:
                                                            '*&RX-NM-PDU'
                                                        ]):
                     pdu_path = self._node_to_arxml_path.get(rx_pdu)
-                    pdu_messages = self.__get_messages_of_pdu(messages,
-                                                              pdu_path)
+                    pdu_messages = self.__get_messages_of_pdu(pdu_path)
 
                     for pdu_message in pdu_messages:
                         for signal in pdu_message.signals:
@@ -460,8 +495,7 @@ class SystemLoader:
                                                            '*&TX-NM-PDU'
                                                        ]):
                     pdu_path = self._node_to_arxml_path.get(tx_pdu)
-                    pdu_messages = self.__get_messages_of_pdu(messages,
-                                                              pdu_path)
+                    pdu_messages = self.__get_messages_of_pdu(pdu_path)
 
                     for pdu_message in pdu_messages:
                         if ecu_name not in pdu_message.senders:
@@ -605,8 +639,7 @@ class SystemLoader:
                                 ])
                 for pdu in pdus:
                     pdu_path = self._node_to_arxml_path.get(pdu)
-                    pdu_messages = \
-                        self.__get_messages_of_pdu(messages, pdu_path)
+                    pdu_messages = self.__get_messages_of_pdu(pdu_path)
 
                     for message in pdu_messages:
                         if message.is_container:
@@ -2074,8 +2107,31 @@ class SystemLoader:
         It returns the ElementTree node which corresponds to the given
         path through the ARXML package structure. If no such node
         exists, a None object is returned.
+
+        Resolved references are memoized: relative references are
+        keyed by the ARXML path of the base element because their
+        meaning depends on the reference bases in scope.
         """
 
+        if arxml_path.startswith('/'):
+            key = (None, arxml_path, dest_tag_name, None)
+        else:
+            key = (self._node_to_arxml_path[base_elem],
+                   arxml_path,
+                   dest_tag_name,
+                   refbase_name)
+
+        try:
+            result = self._arxml_reference_cache[key]
+        except KeyError:
+            pass
+        else:
+            self._arxml_reference_cache_hits += 1
+
+            return result
+
+        self._arxml_reference_cache_misses += 1
+
         arxml_path = self._get_absolute_arxml_path(base_elem,
                                                    arxml_path,
                                                    refbase_name)
@@ -2090,7 +2146,9 @@ class SystemLoader:
            and result.tag != f'{{{self.xml_namespace}}}{dest_tag_name}':
             # the reference could be resolved but it lead to a node of
             # unexpected kind
-            return None
+            result = None
+
+        self._arxml_reference_cache[key] = result
 
         return result
 
@@ -2248,14 +2306,13 @@ class SystemLoader:
 
             # traverse the specified path one level deeper
             result = []
+            ctt = f'{{{self.xml_namespace}}}{child_tag_name}'
+            cttr = f'{{{self.xml_namespace}}}{child_tag_name}-REF'
 
             for base_elem in base_elems:
                 local_result = []
 
                 for child_elem in base_elem:
-                    ctt = f'{{{self.xml_namespace}}}{child_tag_name}'
-                    cttr = f'{{{self.xml_namespace}}}{child_tag_name}-REF'
-
                     if child_elem.tag == ctt:
                         local_result.append(child_elem)
                     elif child_elem.tag == cttr:
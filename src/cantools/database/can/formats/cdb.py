@@ -0,0 +1,916 @@
+# Load and dump a CAN database in the compact binary CDB format.
+#
+# A CDB file starts with a header followed by sections, which are
+# arrays of fixed size little endian records, a string table and a
+# pool of variable length lists. All references between records are
+# indices, so a message is created by reading its record and the
+# records it refers to, without parsing the rest of the file.
+#
+# Header: magic, format version, database version (string), number
+# of messages and the offset and size in bytes of each section.
+#
+# Strings: an array of uint32 offsets, one more than the number of
+# strings, and the concatenated UTF-8 encoded strings. None is
+# NONE.
+#
+# Lists: a pool of uint32 values. A list reference is the index of
+# the length of the list, followed by its items. None is NONE.
+#
+# Numbers: a kind byte and 8 bytes holding an int64, a float64 or the
+# string of an integer not fitting in 64 bits.
+#
+# Messages are stored in the order of the database, followed by the
+# messages contained in container messages. The frame ids (with bit 31
+# set for extended frames) and the names of the top level messages
+# are also stored in separate sections to index the messages quickly.
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Any
+
+from ...conversion import (
+    BaseConversion,
+    IdentityConversion,
+    LinearConversion,
+    LinearIntegerConversion,
+    NamedSignalConversion,
+)
+from ...errors import ParseError
+from ...namedsignalvalue import NamedSignalValue
+from ...utils import (
+    prune_message_choices,
+    sort_signals_by_start_bit,
+    type_sort_signals,
+)
+from ..bus import Bus
+from ..internal_database import InternalDatabase
+from ..message import Message
+from ..node import Node
+from ..signal import Signal
+from ..signal_group import SignalGroup
+
+MAGIC = b'CDB\x00'
+
+FORMAT_VERSION = 1
+
+NONE = 0xffffffff
+
+NUMBER_NONE = 0
+NUMBER_INT = 1
+NUMBER_FLOAT = 2
+NUMBER_BIG_INT = 3
+
+CONVERSION_IDENTITY = 0
+CONVERSION_LINEAR_INTEGER = 1
+CONVERSION_LINEAR = 2
+CONVERSION_NAMED_SIGNAL = 3
+
+MESSAGE_IS_EXTENDED_FRAME = 0x01
+MESSAGE_IS_FD = 0x02
+MESSAGE_HEADER_LITTLE_ENDIAN = 0x04
+
+SIGNAL_LITTLE_ENDIAN = 0x01
+SIGNAL_IS_SIGNED = 0x02
+SIGNAL_IS_MULTIPLEXER = 0x04
+SIGNAL_IS_FLOAT = 0x08
+SIGNAL_ORDERED_CHOICES = 0x10
+SIGNAL_INVALID_IS_CHOICE = 0x20
+
+CHOICE_IS_NAMED_SIGNAL_VALUE = 0x01
+
+SECTIONS = [
+    'string_offsets',
+    'string_data',
+    'lists',
+    'messages',
+    'signals',
+    'choices',
+    'signal_groups',
+    'nodes',
+    'buses',
+    'frame_ids',
+    'names'
+]
+
+HEADER = struct.Struct(f'<4sIII{2 * len(SECTIONS)}I')
+
+# Numbers are a kind byte (B) followed by 8 value bytes (Q).
+MESSAGE = struct.Struct(
+    '<'
+    'I'   # name
+    'I'   # frame id
+    'B'   # flags
+    'BQ'  # header id
+    'I'   # length
+    'I'   # unused bit pattern
+    'I'   # comments
+    'I'   # senders
+    'I'   # send type
+    'BQ'  # cycle time
+    'I'   # bus name
+    'I'   # protocol
+    'I'   # index of first signal
+    'I'   # number of signals
+    'I'   # contained messages
+    'I')  # signal groups
+
+SIGNAL = struct.Struct(
+    '<'
+    'I'   # name
+    'I'   # start
+    'I'   # length
+    'B'   # flags
+    'B'   # conversion
+    'BQ'  # scale
+    'BQ'  # offset
+    'I'   # index of first choice, or NONE if no choices
+    'I'   # number of choices
+    'BQ'  # minimum
+    'BQ'  # maximum
+    'BQ'  # raw initial
+    'BQ'  # raw invalid
+    'BQ'  # invalid, if set without a raw invalid value
+    'I'   # unit
+    'I'   # comments
+    'I'   # receivers
+    'I'   # multiplexer ids
+    'I'   # multiplexer signal
+    'BQ') # spn
+
+CHOICE = struct.Struct(
+    '<'
+    'BQ'  # value
+    'I'   # name
+    'B'   # flags
+    'I')  # comments
+
+SIGNAL_GROUP = struct.Struct(
+    '<'
+    'I'   # name
+    'I'   # repetitions
+    'I')  # signal names
+
+NODE = struct.Struct(
+    '<'
+    'I'   # name
+    'I')  # comments
+
+BUS = struct.Struct(
+    '<'
+    'I'   # name
+    'I'   # comments
+    'BQ'  # baudrate
+    'BQ') # fd baudrate
+
+FLOAT64 = struct.Struct('<d')
+UINT64 = struct.Struct('<Q')
+STRING_OFFSETS = struct.Struct('<II')
+
+
+def _uint32_array(data: Any) -> array:
+    values = array('I')
+    values.frombytes(data)
+
+    if sys.byteorder == 'big':
+        values.byteswap()
+
+    return values
+
+
+class _Writer:
+    """Build the sections of a CDB file.
+
+    """
+
+    def __init__(self) -> None:
+        self.strings: dict[str, int] = {}
+        self.string_data = bytearray()
+        self.string_offsets = [0]
+        self.lists = array('I')
+        self.messages: list[bytes] = []
+        self.signals: list[bytes] = []
+        self.choices: list[bytes] = []
+        self.signal_groups: list[bytes] = []
+
+    def string(self, value: str | None) -> int:
+        if value is None:
+            return NONE
+
+        index = self.strings.get(value)
+
+        if index is None:
+            index = len(self.string_offsets) - 1
+            self.string_data += value.encode('utf-8')
+            self.string_offsets.append(len(self.string_data))
+            self.strings[value] = index
+
+        return index
+
+    def int_list(self, values: list[int] | None) -> int:
+        if values is None:
+            return NONE
+
+        index = len(self.lists)
+        self.lists.append(len(values))
+        self.lists.extend(values)
+
+        return index
+
+    def string_list(self, values: list[str] | None) -> int:
+        if values is None:
+            return NONE
+
+        return self.int_list([self.string(value) for value in values])
+
+    def comments(self, comments: dict[Any, str] | None) -> int:
+        if comments is None:
+            return NONE
+
+        values = []
+
+        for language, comment in comments.items():
+            values.append(self.string(language))
+            values.append(self.string(comment))
+
+        return self.int_list(values)
+
+    def number(self, value: float | None) -> tuple[int, int]:
+        if value is None:
+            return NUMBER_NONE, 0
+        elif isinstance(value, float):
+            return NUMBER_FLOAT, UINT64.unpack(FLOAT64.pack(value))[0]
+        elif -2**63 <= value < 2**63:
+            return NUMBER_INT, value & 0xffffffffffffffff
+        else:
+            return NUMBER_BIG_INT, self.string(str(value))
+
+    def signal(self, signal: Signal) -> None:
+        conversion = signal.conversion
+        choices = conversion.choices
+        choices_start = NONE
+
+        if choices is not None:
+            choices_start = len(self.choices)
+
+            for value, choice in choices.items():
+                if isinstance(choice, NamedSignalValue):
+                    flags = CHOICE_IS_NAMED_SIGNAL_VALUE
+                    name = choice.name
+                    comments = self.comments(choice.comments)
+                else:
+                    flags = 0
+                    name = choice
+                    comments = NONE
+
+                self.choices.append(CHOICE.pack(*self.number(value),
+                                                self.string(name),
+                                                flags,
+                                                comments))
+
+        if isinstance(conversion, IdentityConversion):
+            conversion_kind = CONVERSION_IDENTITY
+        elif isinstance(conversion, LinearIntegerConversion):
+            conversion_kind = CONVERSION_LINEAR_INTEGER
+        elif isinstance(conversion, NamedSignalConversion):
+            conversion_kind = CONVERSION_NAMED_SIGNAL
+        else:
+            conversion_kind = CONVERSION_LINEAR
+
+        flags = 0
+
+        if signal.byte_order == 'little_endian':
+            flags |= SIGNAL_LITTLE_ENDIAN
+
+        if signal.is_signed:
+            flags |= SIGNAL_IS_SIGNED
+
+        if signal.is_multiplexer:
+            flags |= SIGNAL_IS_MULTIPLEXER
+
+        if conversion.is_float:
+            flags |= SIGNAL_IS_FLOAT
+
+        if isinstance(choices, OrderedDict):
+            flags |= SIGNAL_ORDERED_CHOICES
+
+        # Some loaders set the scaled invalid value of multiplexers
+        # without a raw invalid value.
+        invalid: float | None = None
+
+        if signal.raw_invalid is None:
+            if isinstance(signal.invalid, NamedSignalValue):
+                flags |= SIGNAL_INVALID_IS_CHOICE
+                invalid = signal.invalid.value
+            elif isinstance(signal.invalid, (int, float)):
+                invalid = signal.invalid
+
+        self.signals.append(
+            SIGNAL.pack(self.string(signal.name),
+                        signal.start,
+                        signal.length,
+                        flags,
+                        conversion_kind,
+                        *self.number(conversion.scale),
+                        *self.number(conversion.offset),
+                        choices_start,
+                        0 if choices is None else len(choices),
+                        *self.number(signal.minimum),
+                        *self.number(signal.maximum),
+                        *self.number(signal.raw_initial),
+                        *self.number(signal.raw_invalid),
+                        *self.number(invalid),
+                        self.string(signal.unit),
+                        self.comments(signal.comments),
+                        self.string_list(signal.receivers),
+                        self.int_list(signal.multiplexer_ids),
+                        self.string(signal.multiplexer_signal),
+                        *self.number(signal.spn)))
+
+    def message(self, message: Message, contained: list[int]) -> None:
+        signals_start = len(self.signals)
+
+        for signal in message.signals:
+            self.signal(signal)
+
+        signal_groups = None
+
+        if message.signal_groups is not None:
+            signal_groups = []
+
+            for signal_group in message.signal_groups:
+                signal_groups.append(len(self.signal_groups))
+                self.signal_groups.append(
+                    SIGNAL_GROUP.pack(
+                        self.string(signal_group.name),
+                        signal_group.repetitions,
+                        self.string_list(signal_group.signal_names)))
+
+        flags = 0
+
+        if message.is_extended_frame:
+            flags |= MESSAGE_IS_EXTENDED_FRAME
+
+        if message.is_fd:
+            flags |= MESSAGE_IS_FD
+
+        if message.header_byte_order == 'little_endian':
+            flags |= MESSAGE_HEADER_LITTLE_ENDIAN
+
+        self.messages.append(
+            MESSAGE.pack(self.string(message.name),
+                         message.frame_id,
+                         flags,
+                         *self.number(message.header_id),
+                         message.length,
+                         message.unused_bit_pattern,
+                         self.comments(message.comments),
+                         self.string_list(message.senders),
+                         self.string(message.send_type),
+                         *self.number(message.cycle_time),
+                         self.string(message.bus_name),
+                         self.string(message.protocol),
+                         signals_start,
+                         len(message.signals),
+                         self.int_list(contained) if contained else NONE,
+                         self.int_list(signal_groups)))
+
+
+def dump_bytes(database: InternalDatabase) -> bytes:
+    """Format given database in CDB format.
+
+    Format specific properties, for example DBC attributes and AUTOSAR
+    end-to-end protection, are not stored.
+
+    """
+
+    writer = _Writer()
+    version = writer.string(database.version)
+    pending = list(database.messages)
+    contained_indices: list[list[int]] = []
+
+    # Contained messages are appended after the top level messages.
+    for message in pending:
+        contained = []
+
+        for contained_message in message.contained_messages or []:
+            contained.append(len(pending))
+            pending.append(contained_message)
+
+        contained_indices.append(contained)
+
+    for message, contained in zip(pending, contained_indices, strict=True):
+        writer.message(message, contained)
+
+    nodes = [
+        NODE.pack(writer.string(node.name), writer.comments(node.comments))
+        for node in database.nodes
+    ]
+    buses = [
+        BUS.pack(writer.string(bus.name),
+                 writer.comments(bus.comments),
+                 *writer.number(bus.baudrate),
+                 *writer.number(bus.fd_baudrate))
+        for bus in database.buses
+    ]
+    frame_ids = array('I', [
+        message.frame_id | (0x80000000 if message.is_extended_frame else 0)
+        for message in database.messages
+    ])
+    string_offsets = array('I', writer.string_offsets)
+
+    if sys.byteorder == 'big':
+        for values in [frame_ids, string_offsets, writer.lists]:
+            values.byteswap()
+
+    sections = {
+        'string_offsets': string_offsets.tobytes(),
+        'string_data': bytes(writer.string_data),
+        'lists': writer.lists.tobytes(),
+        'messages': b''.join(writer.messages),
+        'signals': b''.join(writer.signals),
+        'choices': b''.join(writer.choices),
+        'signal_groups': b''.join(writer.signal_groups),
+        'nodes': b''.join(nodes),
+        'buses': b''.join(buses),
+        'frame_ids': frame_ids.tobytes(),
+        'names': '\0'.join(
+            message.name for message in database.messages).encode('utf-8')
+    }
+    offsets_and_sizes = []
+    offset = HEADER.size
+
+    for name in SECTIONS:
+        offsets_and_sizes += [offset, len(sections[name])]
+        offset += len(sections[name])
+
+    header = HEADER.pack(MAGIC,
+                         FORMAT_VERSION,
+                         version,
+                         len(database.messages),
+                         *offsets_and_sizes)
+
+    return b''.join([header, *[sections[name] for name in SECTIONS]])
+
+
+class CdbMessageIndex:
+    """An index of the messages in given CDB data `data`, which creates
+    message objects only when they are loaded.
+
+    `data` is a bytes-like object, for example a memory mapped CDB
+    file. The nodes, buses and version are loaded on creation, and are
+    available as :attr:`.database`, without messages.
+
+    If `prune_choices` is ``True`` choice names of loaded messages are
+    pruned.
+
+    If `close_data` is ``True`` `data` is closed by :meth:`.load_all()`,
+    as it is not needed once all messages are loaded. Use it for memory
+    mapped files, which are otherwise only unmapped when `data` is
+    garbage collected.
+
+    """
+
+    def __init__(self,
+                 data: Any,
+                 strict: bool = True,
+                 sort_signals: type_sort_signals = sort_signals_by_start_bit,
+                 prune_choices: bool = False,
+                 close_data: bool = False) -> None:
+        self._data = data
+        self._strict = strict
+        self._sort_signals = sort_signals
+        self._prune_choices = prune_choices
+        self._close_data = close_data
+        self._load_database()
+
+    @property
+    def database(self) -> InternalDatabase:
+        """The nodes, buses and version of the data.
+
+        """
+
+        return self._database
+
+    @property
+    def frame_ids(self) -> list[int]:
+        """The frame ids of all messages in the CDB data, with bit 31 set
+        for extended frames.
+
+        """
+
+        return self._frame_ids
+
+    @property
+    def names(self) -> list[str]:
+        """The names of all messages in the CDB data.
+
+        """
+
+        return self._names
+
+    def is_loaded(self, index: int) -> bool:
+        """Returns ``True`` if the message at given index `index` is
+        loaded.
+
+        """
+
+        return self._messages[index] is not None
+
+    def load(self, index: int) -> Message:
+        """Load the message at given index `index`, unless already
+        loaded.
+
+        """
+
+        message = self._messages[index]
+
+        if message is None:
+            message = self._load_message(index)
+
+            if self._prune_choices:
+                prune_message_choices(message)
+
+            self._messages[index] = message
+
+        return message
+
+    def load_all(self) -> list[Message]:
+        """Load all messages, in the order they appear in the CDB data.
+
+        """
+
+        messages = [self.load(index) for index in range(len(self._messages))]
+
+        if self._close_data:
+            self._data.close()
+            self._data = b''
+            self._close_data = False
+
+        return messages
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+
+        # Memory maps cannot be pickled.
+        if not isinstance(self._data, bytes):
+            state['_data'] = bytes(self._data)
+            state['_close_data'] = False
+
+        return state
+
+    def _load_database(self) -> None:
+        data = self._data
+
+        if len(data) < HEADER.size:
+            raise ParseError('CDB data is truncated.')
+
+        magic, format_version, version, number_of_messages, *offsets_and_sizes = \
+            HEADER.unpack_from(data)
+
+        if magic != MAGIC:
+            raise ParseError('Invalid CDB magic.')
+
+        if format_version != FORMAT_VERSION:
+            raise ParseError(
+                f'Expected CDB format version {FORMAT_VERSION}, but got '
+                f'{format_version}.')
+
+        self._sections = {}
+
+        for i, name in enumerate(SECTIONS):
+            offset, size = offsets_and_sizes[2 * i:2 * i + 2]
+
+            if offset + size > len(data):
+                raise ParseError('CDB data is truncated.')
+
+            self._sections[name] = (offset, size)
+
+        self._strings: dict[int, str] = {}
+        self._string_offsets = self._sections['string_offsets'][0]
+        self._string_data = self._sections['string_data'][0]
+        self._lists = self._sections['lists'][0]
+        offset, size = self._sections['frame_ids']
+        self._frame_ids = _uint32_array(data[offset:offset + size]).tolist()
+        offset, size = self._sections['names']
+
+        if number_of_messages > 0:
+            self._names = str(data[offset:offset + size], 'utf-8').split('\0')
+        else:
+            self._names = []
+
+        if not (len(self._frame_ids) == len(self._names) == number_of_messages):
+            raise ParseError('CDB message index is corrupt.')
+
+        self._messages: list[Message | None] = [None] * number_of_messages
+        nodes = []
+        offset, size = self._sections['nodes']
+
+        for name, comments in NODE.iter_unpack(data[offset:offset + size]):
+            nodes.append(Node(name=self._string(name),
+                              comment=self._comments(comments)))
+
+        buses = []
+        offset, size = self._sections['buses']
+
+        for (name,
+             comments,
+             baudrate_kind,
+             baudrate,
+             fd_baudrate_kind,
+             fd_baudrate) in BUS.iter_unpack(data[offset:offset + size]):
+            buses.append(
+                Bus(name=self._string(name),
+                    comment=self._comments(comments),
+                    baudrate=self._number(baudrate_kind, baudrate),
+                    fd_baudrate=self._number(fd_baudrate_kind, fd_baudrate)))
+
+        self._database = InternalDatabase([],
+                                          nodes,
+                                          buses,
+                                          self._string(version))
+
+    def _string(self, index: int) -> Any:
+        if index == NONE:
+            return None
+
+        try:
+            return self._strings[index]
+        except KeyError:
+            pass
+
+        start, end = STRING_OFFSETS.unpack_from(
+            self._data,
+            self._string_offsets + 4 * index)
+        offset = self._string_data
+        string = str(self._data[offset + start:offset + end], 'utf-8')
+        self._strings[index] = string
+
+        return string
+
+    def _list(self, index: int) -> list[int] | None:
+        if index == NONE:
+            return None
+
+        offset = self._lists + 4 * index
+        length = struct.unpack_from('<I', self._data, offset)[0]
+
+        return list(struct.unpack_from(f'<{length}I', self._data, offset + 4))
+
+    def _string_list(self, index: int) -> list[str] | None:
+        values = self._list(index)
+
+        if values is None:
+            return None
+
+        return [self._string(value) for value in values]
+
+    def _comments(self, index: int) -> Any:
+        values = self._list(index)
+
+        if values is None:
+            return None
+
+        return {
+            self._string(values[i]): self._string(values[i + 1])
+            for i in range(0, len(values), 2)
+        }
+
+    def _number(self, kind: int, value: int) -> Any:
+        if kind == NUMBER_NONE:
+            return None
+        elif kind == NUMBER_INT:
+            return value - (value >> 63 << 64)
+        elif kind == NUMBER_FLOAT:
+            return FLOAT64.unpack(UINT64.pack(value))[0]
+        else:
+            return int(self._string(value))
+
+    def _record(self, section: str, record: struct.Struct, index: int) -> Any:
+        return record.unpack_from(self._data,
+                                  self._sections[section][0] + record.size * index)
+
+    def _load_choices(self, start: int, count: int, ordered: bool) -> Any:
+        choices: Any = OrderedDict() if ordered else {}
+
+        for index in range(start, start + count):
+            (value_kind,
+             value,
+             name,
+             flags,
+             comments) = self._record('choices', CHOICE, index)
+            value = self._number(value_kind, value)
+
+            if flags & CHOICE_IS_NAMED_SIGNAL_VALUE:
+                choices[value] = NamedSignalValue(value,
+                                                  self._string(name),
+                                                  self._comments(comments))
+            else:
+                choices[value] = self._string(name)
+
+        return choices
+
+    def _load_conversion(self,
+                         kind: int,
+                         scale: Any,
+                         offset: Any,
+                         choices: Any,
+                         is_float: bool) -> BaseConversion:
+        if kind == CONVERSION_IDENTITY:
+            return IdentityConversion(is_float=is_float)
+        elif kind == CONVERSION_LINEAR_INTEGER:
+            return LinearIntegerConversion(scale=scale, offset=offset)
+        elif kind == CONVERSION_NAMED_SIGNAL:
+            return NamedSignalConversion(scale=scale,
+                                         offset=offset,
+                                         choices=choices,
+                                         is_float=is_float)
+        else:
+            return LinearConversion(scale=scale,
+                                    offset=offset,
+                                    is_float=is_float)
+
+    def _load_signal(self, index: int) -> Signal:
+        (name,
+         start,
+         length,
+         flags,
+         conversion_kind,
+         scale_kind,
+         scale,
+         offset_kind,
+         offset,
+         choices_start,
+         choices_count,
+         minimum_kind,
+         minimum,
+         maximum_kind,
+         maximum,
+         raw_initial_kind,
+         raw_initial,
+         raw_invalid_kind,
+         raw_invalid,
+         invalid_kind,
+         invalid,
+         unit,
+         comments,
+         receivers,
+         multiplexer_ids,
+         multiplexer_signal,
+         spn_kind,
+         spn) = self._record('signals', SIGNAL, index)
+
+        if choices_start == NONE:
+            choices = None
+        else:
+            choices = self._load_choices(choices_start,
+                                         choices_count,
+                                         bool(flags & SIGNAL_ORDERED_CHOICES))
+
+        conversion = self._load_conversion(conversion_kind,
+                                           self._number(scale_kind, scale),
+                                           self._number(offset_kind, offset),
+                                           choices,
+                                           bool(flags & SIGNAL_IS_FLOAT))
+
+        signal = Signal(
+            name=self._string(name),
+            start=start,
+            length=length,
+            byte_order=('little_endian'
+                        if flags & SIGNAL_LITTLE_ENDIAN
+                        else 'big_endian'),
+            is_signed=bool(flags & SIGNAL_IS_SIGNED),
+            raw_initial=self._number(raw_initial_kind, raw_initial),
+            raw_invalid=self._number(raw_invalid_kind, raw_invalid),
+            conversion=conversion,
+            minimum=self._number(minimum_kind, minimum),
+            maximum=self._number(maximum_kind, maximum),
+            unit=self._string(unit),
+            comment=self._comments(comments),
+            receivers=self._string_list(receivers),
+            is_multiplexer=bool(flags & SIGNAL_IS_MULTIPLEXER),
+            multiplexer_ids=self._list(multiplexer_ids),
+            multiplexer_signal=self._string(multiplexer_signal),
+            spn=self._number(spn_kind, spn))
+
+        if invalid_kind != NUMBER_NONE:
+            invalid = self._number(invalid_kind, invalid)
+
+            if flags & SIGNAL_INVALID_IS_CHOICE:
+                assert choices is not None
+                invalid = choices[invalid]
+
+            signal.invalid = invalid
+
+        return signal
+
+    def _load_message(self, index: int) -> Message:
+        (name,
+         frame_id,
+         flags,
+         header_id_kind,
+         header_id,
+         length,
+         unused_bit_pattern,
+         comments,
+         senders,
+         send_type,
+         cycle_time_kind,
+         cycle_time,
+         bus_name,
+         protocol,
+         signals_start,
+         signals_count,
+         contained,
+         signal_groups) = self._record('messages', MESSAGE, index)
+
+        signals = [
+            self._load_signal(signal_index)
+            for signal_index in range(signals_start,
+                                      signals_start + signals_count)
+        ]
+        contained_indices = self._list(contained)
+        contained_messages = None
+
+        if contained_indices is not None:
+            contained_messages = [
+                self._load_message(contained_index)
+                for contained_index in contained_indices
+            ]
+
+        signal_group_indices = self._list(signal_groups)
+        loaded_signal_groups = None
+
+        if signal_group_indices is not None:
+            loaded_signal_groups = []
+
+            for signal_group_index in signal_group_indices:
+                (signal_group_name,
+                 repetitions,
+                 signal_names) = self._record('signal_groups',
+                                              SIGNAL_GROUP,
+                                              signal_group_index)
+                loaded_signal_groups.append(
+                    SignalGroup(self._string(signal_group_name),
+                                repetitions,
+                                self._string_list(signal_names)))
+
+        return Message(
+            frame_id=frame_id,
+            name=self._string(name),
+            length=length,
+            signals=signals,
+            contained_messages=contained_messages,
+            header_id=self._number(header_id_kind, header_id),
+            header_byte_order=('little_endian'
+                               if flags & MESSAGE_HEADER_LITTLE_ENDIAN
+                               else 'big_endian'),
+            unused_bit_pattern=unused_bit_pattern,
+            comment=self._comments(comments),
+            senders=self._string_list(senders),
+            send_type=self._string(send_type),
+            cycle_time=self._number(cycle_time_kind, cycle_time),
+            is_extended_frame=bool(flags & MESSAGE_IS_EXTENDED_FRAME),
+            is_fd=bool(flags & MESSAGE_IS_FD),
+            bus_name=self._string(bus_name),
+            signal_groups=loaded_signal_groups,
+            strict=self._strict,
+            protocol=self._string(protocol),
+            sort_signals=self._sort_signals)
+
+
+def load_bytes(data: Any,
+               strict: bool = True,
+               sort_signals: type_sort_signals = sort_signals_by_start_bit) -> InternalDatabase:
+    """Load all messages of given CDB data `data`.
+
+    """
+
+    index = CdbMessageIndex(data, strict, sort_signals)
+    database = index.database
+    database.messages = index.load_all()
+
+    return database
+
+
+def map_file(filename: Any) -> mmap.mmap:
+    """Memory map given CDB file `filename` for reading.
+
+    The file must not be truncated while mapped, as accessing the
+    missing part crashes the process with ``SIGBUS`` on some operating
+    systems. On Windows the file can not be replaced while mapped.
+
+    """
+
+    with open(filename, 'rb') as fin:
+        if os.fstat(fin.fileno()).st_size == 0:
+            raise ParseError('CDB data is truncated.')
+
+        return mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
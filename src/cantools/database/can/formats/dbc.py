@@ -1,5 +1,6 @@
 # Load and dump a CAN database in DBC format.
 
+import io
 import re
 import typing
 from collections import OrderedDict, defaultdict
@@ -34,6 +35,7 @@ from ...errors import ParseError
 from ...namedsignalvalue import NamedSignalValue
 from ...utils import (
     SORT_SIGNALS_DEFAULT,
+    prune_message_choices,
     sort_signals_by_start_bit,
     sort_signals_by_start_bit_reversed,
     type_sort_attribute,
@@ -318,79 +320,80 @@ def to_float(value: AttributeValue) -> float:
         return float(Decimal(value))
     return float(value)
 
-class DbcParser(Parser):
+DBC_KEYWORDS = {
+    'BA_',
+    'BA_DEF_',
+    'BA_DEF_DEF_',
+    'BA_DEF_DEF_REL_',
+    'BA_DEF_REL_',
+    'BA_DEF_SGTYPE_',
+    'BA_REL_',
+    'BA_SGTYPE_',
+    'BO_',
+    'BO_TX_BU_',
+    'BS_',
+    'BU_',
+    'BU_BO_REL_',
+    'BU_EV_REL_',
+    'BU_SG_REL_',
+    'CAT_',
+    'CAT_DEF_',
+    'CM_',
+    'ENVVAR_DATA_',
+    'EV_',
+    'EV_DATA_',
+    'FILTER',
+    'NS_',
+    'NS_DESC_',
+    'SG_',
+    'SG_MUL_VAL_',
+    'SGTYPE_',
+    'SGTYPE_VAL_',
+    'SIG_GROUP_',
+    'SIG_TYPE_REF_',
+    'SIG_VALTYPE_',
+    'SIGTYPE_VALTYPE_',
+    'VAL_',
+    'VAL_TABLE_',
+    'VERSION'
+}
 
-    def tokenize(self, string: str) -> list[Token]:
-        keywords = {
-            'BA_',
-            'BA_DEF_',
-            'BA_DEF_DEF_',
-            'BA_DEF_DEF_REL_',
-            'BA_DEF_REL_',
-            'BA_DEF_SGTYPE_',
-            'BA_REL_',
-            'BA_SGTYPE_',
-            'BO_',
-            'BO_TX_BU_',
-            'BS_',
-            'BU_',
-            'BU_BO_REL_',
-            'BU_EV_REL_',
-            'BU_SG_REL_',
-            'CAT_',
-            'CAT_DEF_',
-            'CM_',
-            'ENVVAR_DATA_',
-            'EV_',
-            'EV_DATA_',
-            'FILTER',
-            'NS_',
-            'NS_DESC_',
-            'SG_',
-            'SG_MUL_VAL_',
-            'SGTYPE_',
-            'SGTYPE_VAL_',
-            'SIG_GROUP_',
-            'SIG_TYPE_REF_',
-            'SIG_VALTYPE_',
-            'SIGTYPE_VALTYPE_',
-            'VAL_',
-            'VAL_TABLE_',
-            'VERSION'
-        }
+DBC_TOKEN_NAMES = {
+    'LPAREN': '(',
+    'RPAREN': ')',
+    'LBRACE': '[',
+    'RBRACE': ']',
+    'COMMA':  ',',
+    'AT':     '@',
+    'SCOLON': ';',
+    'COLON':  ':',
+    'PIPE':   '|',
+    'SIGN':   '+/-'
+}
 
-        names = {
-            'LPAREN': '(',
-            'RPAREN': ')',
-            'LBRACE': '[',
-            'RBRACE': ']',
-            'COMMA':  ',',
-            'AT':     '@',
-            'SCOLON': ';',
-            'COLON':  ':',
-            'PIPE':   '|',
-            'SIGN':   '+/-'
-        }
+DBC_TOKEN_SPECS = [
+    ('SKIP',     r'[ \r\n\t]+|//.*?\n'),
+    ('NUMBER',   r'[-+]?\d+\.?\d*([eE][+-]?\d+)?'),
+    ('WORD',     r'[A-Za-z0-9_]+'),
+    ('STRING',   r'"(\\"|[^"])*?"'),
+    ('LPAREN',   r'\('),
+    ('RPAREN',   r'\)'),
+    ('LBRACE',   r'\['),
+    ('RBRACE',   r'\]'),
+    ('COMMA',    r','),
+    ('PIPE',     r'\|'),
+    ('AT',       r'@'),
+    ('SIGN',     r'[+-]'),
+    ('SCOLON',   r';'),
+    ('COLON',    r':'),
+    ('MISMATCH', r'.')
+]
 
-        token_specs = [
-            ('SKIP',     r'[ \r\n\t]+|//.*?\n'),
-            ('NUMBER',   r'[-+]?\d+\.?\d*([eE][+-]?\d+)?'),
-            ('WORD',     r'[A-Za-z0-9_]+'),
-            ('STRING',   r'"(\\"|[^"])*?"'),
-            ('LPAREN',   r'\('),
-            ('RPAREN',   r'\)'),
-            ('LBRACE',   r'\['),
-            ('RBRACE',   r'\]'),
-            ('COMMA',    r','),
-            ('PIPE',     r'\|'),
-            ('AT',       r'@'),
-            ('SIGN',     r'[+-]'),
-            ('SCOLON',   r';'),
-            ('COLON',    r':'),
-            ('MISMATCH', r'.')
-        ]
 
-        tokens, token_regex = tokenize_init(token_specs)
+class DbcParser(Parser):
+
+    def tokenize(self, string: str) -> list[Token]:
+        tokens, token_regex = tokenize_init(DBC_TOKEN_SPECS)
 
         for mo in re.finditer(token_regex, string, re.DOTALL):
             kind: str = mo.lastgroup  # type: ignore[assignment]
@@ -403,11 +406,11 @@ class DbcParser(Parser):
             elif kind != 'MISMATCH':
                 value = mo.group(kind)
 
-                if value in keywords:
+                if value in DBC_KEYWORDS:
                     kind = value
 
-                if kind in names:
-                    kind = names[kind]
+                if kind in DBC_TOKEN_NAMES:
+                    kind = DBC_TOKEN_NAMES[kind]
 
                 tokens.append(Token(kind, value, mo.start()))
             else:
@@ -538,6 +541,462 @@ class DbcParser(Parser):
                                             version)))
 
 
+DBC_TOKEN_REGEX = re.compile(
+    '|'.join(f'(?P<{name}>{regex})' for name, regex in DBC_TOKEN_SPECS),
+    re.DOTALL)
+
+DBC_STATEMENT_KEYWORDS = [
+    'VERSION',
+    'NS_',
+    'BS_',
+    'BU_',
+    'BO_',
+    'EV_',
+    'CM_',
+    'BA_DEF_',
+    'BA_DEF_DEF_',
+    'BA_',
+    'BA_DEF_REL_',
+    'BA_DEF_DEF_REL_',
+    'BA_REL_',
+    'VAL_',
+    'VAL_TABLE_',
+    'SIG_VALTYPE_',
+    'SG_MUL_VAL_',
+    'BO_TX_BU_',
+    'SIG_GROUP_'
+]
+
+# Statement keywords at the beginning of a line. Strings and comments
+# are matched as well, only to skip them.
+DBC_STATEMENT_REGEX = re.compile(
+    r'"(?:\\"|[^"])*?"|//[^\n]*'
+    r'|^[ \t]*(?P<keyword>' + '|'.join(DBC_STATEMENT_KEYWORDS) + r')'
+    r'(?![A-Za-z0-9_])(?P<colon>\s*:)?',
+    re.MULTILINE)
+
+DBC_MESSAGE_HEADER_REGEX = re.compile(
+    r'BO_\s+(?P<frame_id>\d+)\s+(?P<name>[A-Za-z0-9_]+)')
+
+# Statements of a single message, identified by its frame id.
+DBC_MESSAGE_STATEMENT_REGEX = re.compile(
+    r'(?:CM_\s+(?:BO_|SG_)'
+    r'|BA_\s+"(?P<attribute>[^"]*)"\s+(?P<kind>BO_|SG_)'
+    r'|VAL_|SIG_GROUP_|SIG_VALTYPE_|BO_TX_BU_|SG_MUL_VAL_)'
+    r'\s+(?P<frame_id>\d+)(?:\s+"(?P<value>(?:\\"|[^"])*?)")?')
+
+
+class DbcStreamParser:
+    """Parse DBC data statement by statement while reading it from a
+    file-like object, instead of tokenizing all data before parsing
+    it as :class:`DbcParser` does.
+
+    The parse tree is identical to the one of :class:`DbcParser`.
+
+    """
+
+    def __init__(self, chunk_size: int = 1 << 20) -> None:
+        self._chunk_size = chunk_size
+        self._token: tuple[str, str, int] = ('__EOF__', '', 0)
+        self._next_token: tuple[str, str, int] = ('__EOF__', '', 0)
+        self._tokens: typing.Iterator[tuple[str, str, int]] = iter(())
+        self._statements: dict[str, typing.Callable[[], TokenList]] = {
+            'VERSION': self._parse_version,
+            'NS_': self._parse_ns,
+            'BS_': self._parse_bs,
+            'BU_': self._parse_nodes,
+            'BO_': self._parse_message,
+            'EV_': self._parse_environment_variable,
+            'CM_': self._parse_comment,
+            'BA_DEF_': self._parse_attribute_definition,
+            'BA_DEF_DEF_': self._parse_attribute_definition_default,
+            'BA_': self._parse_attribute,
+            'BA_DEF_REL_': self._parse_relation_attribute_definition,
+            'BA_DEF_DEF_REL_': self._parse_attribute_definition_default,
+            'BA_REL_': self._parse_relation_attribute,
+            'VAL_': self._parse_choice,
+            'VAL_TABLE_': self._parse_value_table,
+            'SIG_VALTYPE_': self._parse_signal_type,
+            'SG_MUL_VAL_': self._parse_signal_multiplexer_values,
+            'BO_TX_BU_': self._parse_message_add_sender,
+            'SIG_GROUP_': self._parse_signal_group
+        }
+
+    def parse(self, fp: typing.TextIO) -> DbcTokens:
+        """Parse DBC data read from given file-like object `fp` and return
+        the statements grouped by keyword.
+
+        """
+
+        self._tokens = self._tokenize(fp)
+        self._advance()
+        self._advance()
+        tokens: DbcTokens = {}
+
+        while self._token[0] != '__EOF__':
+            keyword = self._token[0]
+
+            try:
+                parse_statement = self._statements[keyword]
+            except KeyError:
+                self._error()
+
+            tokens.setdefault(keyword, []).append(parse_statement())
+
+        if not tokens:
+            self._error()
+
+        return tokens
+
+    def _tokenize(self, fp: typing.TextIO) -> typing.Iterator[tuple[str, str, int]]:
+        """Yield ``(kind, value, line)`` tuples of all tokens read from
+        `fp`. A token is only yielded once enough data follows it to be
+        sure that it is not cut at the end of a chunk.
+
+        """
+
+        buffer = ''
+        line = 1
+        eof = False
+
+        while not eof:
+            data = fp.read(self._chunk_size)
+            eof = not data
+            buffer += data
+            safe_end = len(buffer) - 3
+            position = 0
+
+            for mo in DBC_TOKEN_REGEX.finditer(buffer):
+                kind: str = mo.lastgroup  # type: ignore[assignment]
+
+                if not eof and (mo.end() > safe_end
+                                or kind == 'MISMATCH'
+                                or (kind == 'STRING'
+                                    and mo.group()[-2] == '\\')):
+                    # Wait for more data.
+                    break
+
+                position = mo.end()
+
+                if kind == 'SKIP':
+                    line += mo.group().count('\n')
+                elif kind == 'STRING':
+                    value = mo.group()
+                    yield kind, value[1:-1].replace('\\"', '"'), line
+                    line += value.count('\n')
+                elif kind == 'MISMATCH':
+                    raise ParseError(
+                        f'Invalid syntax at line {line}: {buffer[mo.start():mo.start() + 10]!r}.')
+                else:
+                    value = mo.group()
+
+                    if value in DBC_KEYWORDS:
+                        kind = value
+
+                    yield DBC_TOKEN_NAMES.get(kind, kind), value, line
+
+            buffer = buffer[position:]
+
+    def _advance(self) -> None:
+        self._token = self._next_token
+        self._next_token = next(self._tokens, ('__EOF__', '', self._token[2]))
+
+    def _error(self) -> typing.NoReturn:
+        kind, value, line = self._token
+
+        if kind == '__EOF__':
+            raise ParseError(f'Invalid syntax at line {line}: unexpected end of data.')
+
+        raise ParseError(f'Invalid syntax at line {line}: unexpected {value!r}.')
+
+    def _expect(self, kind: str) -> str:
+        if self._token[0] != kind:
+            self._error()
+
+        value = self._token[1]
+        self._advance()
+
+        return value
+
+    def _expect_value(self) -> str:
+        if self._token[0] not in ('NUMBER', 'STRING'):
+            self._error()
+
+        value = self._token[1]
+        self._advance()
+
+        return value
+
+    def _zero_or_more(self, kind: str) -> TokenList:
+        values: TokenList = []
+
+        while self._token[0] == kind:
+            values.append(self._token[1])
+            self._advance()
+
+        return values
+
+    def _delimited_list(self, kind: str) -> TokenList:
+        values: TokenList = [self._expect(kind)]
+
+        while self._token[0] == ',':
+            self._advance()
+            values.append(self._expect(kind))
+
+        return values
+
+    def _value_descriptions(self) -> TokenList:
+        descriptions: TokenList = []
+
+        while self._token[0] == 'NUMBER':
+            descriptions.append([self._expect('NUMBER'),
+                                 self._expect('STRING')])
+
+        return descriptions
+
+    def _parse_version(self) -> TokenList:
+        return [self._expect('VERSION'), self._expect('STRING')]
+
+    def _parse_ns(self) -> TokenList:
+        statement: TokenList = [self._expect('NS_'), self._expect(':')]
+        symbols: TokenList = []
+
+        while self._next_token[0] != ':':
+            if self._token[0] == '__EOF__':
+                self._error()
+
+            symbols.append(self._token[1])
+            self._advance()
+
+        statement.append(symbols)
+
+        return statement
+
+    def _parse_bs(self) -> TokenList:
+        return [self._expect('BS_'), self._expect(':')]
+
+    def _parse_nodes(self) -> TokenList:
+        return [self._expect('BU_'),
+                self._expect(':'),
+                self._zero_or_more('WORD')]
+
+    def _parse_signal(self) -> TokenList:
+        statement: TokenList = [self._expect('SG_')]
+        names: TokenList = [self._expect('WORD')]
+
+        if self._token[0] == 'WORD':
+            names.append(self._expect('WORD'))
+
+        statement.append(names)
+
+        for kind in [':', 'NUMBER', '|', 'NUMBER', '@', 'NUMBER', '+/-',
+                     '(', 'NUMBER', ',', 'NUMBER', ')',
+                     '[', 'NUMBER', '|', 'NUMBER', ']',
+                     'STRING']:
+            statement.append(self._expect(kind))
+
+        statement.append(self._delimited_list('WORD'))
+
+        return statement
+
+    def _parse_message(self) -> TokenList:
+        statement: TokenList = [self._expect('BO_'),
+                                self._expect('NUMBER'),
+                                self._expect('WORD'),
+                                self._expect(':'),
+                                self._expect('NUMBER'),
+                                self._expect('WORD')]
+        signals: TokenList = []
+
+        while self._token[0] == 'SG_':
+            signals.append(self._parse_signal())
+
+        statement.append(signals)
+
+        return statement
+
+    def _parse_environment_variable(self) -> TokenList:
+        return [self._expect(kind)
+                for kind in ['EV_', 'WORD', ':', 'NUMBER',
+                             '[', 'NUMBER', '|', 'NUMBER', ']',
+                             'STRING', 'NUMBER', 'NUMBER', 'WORD', 'WORD',
+                             ';']]
+
+    def _parse_comment(self) -> TokenList:
+        statement: TokenList = [self._expect('CM_')]
+        kind = self._token[0]
+
+        if kind == 'SG_':
+            statement.append([self._expect('SG_'),
+                              self._expect('NUMBER'),
+                              self._expect('WORD'),
+                              self._expect('STRING')])
+        elif kind == 'BO_':
+            statement.append([self._expect('BO_'),
+                              self._expect('NUMBER'),
+                              self._expect('STRING')])
+        elif kind in ('EV_', 'BU_'):
+            statement.append([self._expect(kind),
+                              self._expect('WORD'),
+                              self._expect('STRING')])
+        else:
+            statement.append(self._expect('STRING'))
+
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_attribute_definition(self) -> TokenList:
+        statement: TokenList = [self._expect('BA_DEF_')]
+
+        if self._token[0] in ('SG_', 'BO_', 'EV_', 'BU_'):
+            statement.append([self._expect(self._token[0])])
+        else:
+            statement.append([])
+
+        statement.append(self._expect('STRING'))
+        statement.append(self._expect('WORD'))
+
+        if self._token[0] == 'STRING':
+            statement.append([self._delimited_list('STRING')])
+        else:
+            statement.append([self._zero_or_more('NUMBER')])
+
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_attribute_definition_default(self) -> TokenList:
+        return [self._expect(self._token[0]),
+                self._expect('STRING'),
+                self._expect_value(),
+                self._expect(';')]
+
+    def _parse_attribute(self) -> TokenList:
+        statement: TokenList = [self._expect('BA_'), self._expect('STRING')]
+        objects: TokenList = []
+
+        while True:
+            kind = self._token[0]
+
+            if kind == 'BO_':
+                objects.append([self._expect('BO_'),
+                                self._expect('NUMBER')])
+            elif kind == 'SG_':
+                objects.append([self._expect('SG_'),
+                                self._expect('NUMBER'),
+                                self._expect('WORD')])
+            elif kind in ('BU_', 'EV_'):
+                objects.append([self._expect(kind), self._expect('WORD')])
+            else:
+                break
+
+        statement.append(objects)
+        statement.append(self._expect_value())
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_relation_attribute_definition(self) -> TokenList:
+        statement: TokenList = [self._expect('BA_DEF_REL_')]
+
+        if self._token[0] in ('BU_SG_REL_', 'BU_BO_REL_'):
+            statement.append([self._expect(self._token[0])])
+        else:
+            statement.append([])
+
+        statement.append(self._expect('STRING'))
+        statement.append(self._expect('WORD'))
+
+        if self._token[0] == 'STRING':
+            statement.append([self._delimited_list('STRING')])
+        elif self._token[0] == 'NUMBER':
+            statement.append([self._zero_or_more('NUMBER')])
+        else:
+            statement.append([])
+
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_relation_attribute(self) -> TokenList:
+        statement: TokenList = [self._expect('BA_REL_'),
+                                self._expect('STRING')]
+
+        if self._token[0] == 'BU_SG_REL_':
+            statement += [self._expect('BU_SG_REL_'),
+                          self._expect('WORD'),
+                          self._expect('SG_'),
+                          self._expect('NUMBER'),
+                          self._expect('WORD')]
+        else:
+            statement += [self._expect('BU_BO_REL_'),
+                          self._expect('WORD'),
+                          self._expect('NUMBER')]
+
+        statement.append(self._expect_value())
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_choice(self) -> TokenList:
+        statement: TokenList = [self._expect('VAL_')]
+
+        if self._token[0] == 'NUMBER':
+            statement.append([self._expect('NUMBER')])
+        else:
+            statement.append([])
+
+        statement.append(self._expect('WORD'))
+        statement.append(self._value_descriptions())
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_value_table(self) -> TokenList:
+        return [self._expect('VAL_TABLE_'),
+                self._expect('WORD'),
+                self._value_descriptions(),
+                self._expect(';')]
+
+    def _parse_signal_type(self) -> TokenList:
+        return [self._expect(kind)
+                for kind in ['SIG_VALTYPE_', 'NUMBER', 'WORD', ':', 'NUMBER',
+                             ';']]
+
+    def _parse_signal_multiplexer_values(self) -> TokenList:
+        statement: TokenList = [self._expect('SG_MUL_VAL_'),
+                                self._expect('NUMBER'),
+                                self._expect('WORD'),
+                                self._expect('WORD')]
+        ranges: TokenList = [[self._expect('NUMBER'), self._expect('NUMBER')]]
+
+        while self._token[0] == ',':
+            self._advance()
+            ranges.append([self._expect('NUMBER'), self._expect('NUMBER')])
+
+        statement.append(ranges)
+        statement.append(self._expect(';'))
+
+        return statement
+
+    def _parse_message_add_sender(self) -> TokenList:
+        return [self._expect('BO_TX_BU_'),
+                self._expect('NUMBER'),
+                self._expect(':'),
+                self._delimited_list('WORD'),
+                self._expect(';')]
+
+    def _parse_signal_group(self) -> TokenList:
+        return [self._expect('SIG_GROUP_'),
+                self._expect('NUMBER'),
+                self._expect('WORD'),
+                self._expect('NUMBER'),
+                self._expect(':'),
+                self._zero_or_more('WORD'),
+                self._expect(';')]
+
+
 class LongNamesConverter:
     def __init__(self, long_names: list[str]) -> None:
 
@@ -2386,6 +2845,34 @@ def update_signal_relation_attribute_names_after_load(messages: list[Message],
         relation_attributes.node_signal_relations[frame_id] = updated_signal_map
 
 
+def _load_messages_and_relations(tokens: DbcTokens,
+                                 comments: DbcComments,
+                                 attributes: DbcAttributes,
+                                 definitions: OrderedDict[str, AttributeDefinitionType],
+                                 relation_attributes: DbcRelationAttributes,
+                                 strict: bool,
+                                 bus_name: str | None,
+                                 sort_signals: type_sort_signals) -> list[Message]:
+    messages = _load_messages(tokens,
+                              comments,
+                              attributes,
+                              definitions,
+                              _load_choices(tokens),
+                              _load_message_senders(tokens, attributes),
+                              _load_signal_types(tokens),
+                              _load_signal_multiplexer_values(tokens),
+                              strict,
+                              bus_name,
+                              _load_signal_groups(tokens, attributes),
+                              sort_signals)
+    update_signal_relation_attribute_names_after_load(
+        messages,
+        attributes,
+        relation_attributes)
+
+    return messages
+
+
 def load_string(string: str, strict: bool = True,
                 sort_signals: type_sort_signals = sort_signals_by_start_bit) -> InternalDatabase:
     """Parse given string.
@@ -2394,6 +2881,22 @@ def load_string(string: str, strict: bool = True,
 
     tokens: DbcTokens = dbc_assert_type(DbcParser().parse(string), dict)
 
+    return _load_tokens(tokens, strict, sort_signals)
+
+
+def load(fp: typing.TextIO, strict: bool = True,
+         sort_signals: type_sort_signals = sort_signals_by_start_bit) -> InternalDatabase:
+    """Parse DBC data read from given file-like object with the streaming
+    parser.
+
+    """
+
+    return _load_tokens(DbcStreamParser().parse(fp), strict, sort_signals)
+
+
+def _load_tokens(tokens: DbcTokens,
+                 strict: bool,
+                 sort_signals: type_sort_signals) -> InternalDatabase:
     comments = _load_comments(tokens)
     attribute_definitions = _load_attribute_definitions(tokens)
     defaults = _load_attribute_definition_defaults(tokens)
@@ -2405,27 +2908,14 @@ def load_string(string: str, strict: bool = True,
     relation_attributes = _load_relation_attributes(tokens, relation_attribute_definitions)
     bus = _load_bus(attributes, comments)
     value_tables = _load_value_tables(tokens)
-    choices = _load_choices(tokens)
-    message_senders = _load_message_senders(tokens, attributes)
-    signal_types = _load_signal_types(tokens)
-    signal_multiplexer_values = _load_signal_multiplexer_values(tokens)
-    signal_groups = _load_signal_groups(tokens, attributes)
-    messages = _load_messages(tokens,
-                              comments,
-                              attributes,
-                              attribute_definitions_dict,
-                              choices,
-                              message_senders,
-                              signal_types,
-                              signal_multiplexer_values,
-                              strict,
-                              bus.name if bus else None,
-                              signal_groups,
-                              sort_signals)
-    update_signal_relation_attribute_names_after_load(
-        messages,
-        attributes,
-        relation_attributes)
+    messages = _load_messages_and_relations(tokens,
+                                            comments,
+                                            attributes,
+                                            attribute_definitions_dict,
+                                            relation_attributes,
+                                            strict,
+                                            bus.name if bus else None,
+                                            sort_signals)
     nodes = _load_nodes(tokens, comments, attributes, attribute_definitions_dict)
     version = _load_version(tokens)
     environment_variables = _load_environment_variables(tokens, comments, attributes, attribute_definitions_dict)
@@ -2441,3 +2931,231 @@ def load_string(string: str, strict: bool = True,
                             [bus] if bus else [],
                             version,
                             dbc_specifics)
+
+
+class DbcMessageIndex:
+    """An index of the messages in given DBC data `string`, which creates
+    message objects only when they are loaded.
+
+    The data is split into statements, which must start on new lines
+    as in files written by common tools. All statements that do not
+    belong to a message are parsed on creation, and are available as
+    :attr:`.database`, without messages. The ``BO_`` block of a message
+    and the comments, attributes, choices, signal groups and other
+    statements of its frame id are only parsed when the message is
+    loaded.
+
+    `parser` is ``'textparser'`` or ``'streaming'``, as in
+    :meth:`Database.add_dbc() <cantools.database.can.Database.add_dbc>`.
+    If `prune_choices` is ``True`` choice names of loaded messages are
+    pruned.
+
+    """
+
+    def __init__(self,
+                 string: str,
+                 strict: bool = True,
+                 sort_signals: type_sort_signals = sort_signals_by_start_bit,
+                 parser: str = 'textparser',
+                 prune_choices: bool = False) -> None:
+        if parser not in ['textparser', 'streaming']:
+            raise ValueError(
+                f"expected DBC parser 'textparser' or 'streaming', but got "
+                f"'{parser}'")
+
+        self._string = string
+        self._strict = strict
+        self._sort_signals = sort_signals
+        self._parser = parser
+        self._prune_choices = prune_choices
+        self._frame_ids: list[int] = []
+        self._names: list[str] = []
+        self._blocks: list[tuple[int, int]] = []
+        self._message_statements: defaultdict[int, list[tuple[int, int]]] = defaultdict(list)
+        self._messages: list[Message | None] = []
+        self._load_database()
+
+    @property
+    def database(self) -> InternalDatabase:
+        """The nodes, buses, version and DBC specifics of the data.
+
+        """
+
+        return self._database
+
+    @property
+    def frame_ids(self) -> list[int]:
+        """The frame ids of all messages in the DBC data, with bit 31 set
+        for extended frames.
+
+        """
+
+        return self._frame_ids
+
+    @property
+    def names(self) -> list[str]:
+        """The names of all messages in the DBC data.
+
+        """
+
+        return self._names
+
+    def is_loaded(self, index: int) -> bool:
+        """Returns ``True`` if the message at given index `index` is
+        loaded.
+
+        """
+
+        return self._messages[index] is not None
+
+    def load(self, index: int) -> Message:
+        """Load the message at given index `index`, unless already
+        loaded.
+
+        """
+
+        message = self._messages[index]
+
+        if message is None:
+            message = self._load_message(index)
+            self._messages[index] = message
+
+        return message
+
+    def load_all(self) -> list[Message]:
+        """Load all messages, in the order they appear in the DBC data.
+
+        """
+
+        return [self.load(index) for index in range(len(self._messages))]
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _parse(self, string: str) -> DbcTokens:
+        if self._parser == 'streaming':
+            return DbcStreamParser().parse(io.StringIO(string))
+
+        return dbc_assert_type(DbcParser().parse(string), dict)
+
+    def _load_database(self) -> None:
+        """Index the message blocks and the statements of their frame ids,
+        and parse all other statements.
+
+        """
+
+        string = self._string
+        statements: list[tuple[int, str]] = []
+        in_ns = False
+
+        for mo in DBC_STATEMENT_REGEX.finditer(string):
+            keyword = mo.group('keyword')
+
+            if keyword is None:
+                continue
+
+            # Keywords listed in the NS_ section are not statements.
+            if in_ns and mo.group('colon') is None:
+                continue
+
+            in_ns = (keyword == 'NS_')
+            statements.append((mo.start('keyword'), keyword))
+
+        if not statements:
+            # Let the parser report the error.
+            self._parse(string)
+
+        long_names = {}
+        other_statements = [string[:statements[0][0]]]
+        ends = [start for start, _ in statements[1:]] + [len(string)]
+
+        for (start, keyword), end in zip(statements, ends, strict=True):
+            if keyword == 'BO_':
+                header = DBC_MESSAGE_HEADER_REGEX.match(string, start)
+
+                if header is not None:
+                    if header.group('name') != 'VECTOR__INDEPENDENT_SIG_MSG':
+                        self._blocks.append((start, end))
+                        self._frame_ids.append(int(header.group('frame_id')))
+                        self._names.append(header.group('name'))
+                        self._messages.append(None)
+
+                    continue
+            elif keyword in ['CM_', 'BA_', 'VAL_', 'SIG_GROUP_',
+                             'SIG_VALTYPE_', 'BO_TX_BU_', 'SG_MUL_VAL_']:
+                statement = DBC_MESSAGE_STATEMENT_REGEX.match(string, start)
+
+                if statement is not None:
+                    frame_id_dbc = int(statement.group('frame_id'))
+                    self._message_statements[frame_id_dbc].append((start, end))
+
+                    if (statement.group('attribute') == 'SystemMessageLongSymbol'
+                            and statement.group('kind') == 'BO_'
+                            and statement.group('value') is not None):
+                        long_names[frame_id_dbc] = statement.group('value').replace('\\"', '"')
+
+                    continue
+
+            other_statements.append(string[start:end])
+
+        self._names = [
+            long_names.get(frame_id_dbc, name)
+            for frame_id_dbc, name in zip(self._frame_ids, self._names, strict=True)
+        ]
+        tokens = self._parse('\n'.join(other_statements))
+        self._comments = _load_comments(tokens)
+        attribute_definitions = _load_attribute_definitions(tokens)
+        defaults = _load_attribute_definition_defaults(tokens)
+        relation_definitions = _load_relation_attribute_definitions(tokens)
+        relation_defaults = _load_relation_attribute_definition_defaults(tokens)
+        self._definitions = get_attribute_definitions_dict(attribute_definitions, defaults)
+        self._attributes = _load_attributes(tokens, self._definitions)
+        relation_attribute_definitions = get_relation_definitions_dict(relation_definitions, relation_defaults)
+        self._relation_attributes = _load_relation_attributes(tokens, relation_attribute_definitions)
+        bus = _load_bus(self._attributes, self._comments)
+        self._bus_name = bus.name if bus else None
+        nodes = _load_nodes(tokens, self._comments, self._attributes, self._definitions)
+        environment_variables = _load_environment_variables(tokens,
+                                                            self._comments,
+                                                            self._attributes,
+                                                            self._definitions)
+        dbc_specifics = DbcSpecifics(attributes=self._attributes.database or None,
+                                     attribute_definitions=self._definitions,
+                                     environment_variables=environment_variables,
+                                     value_tables=_load_value_tables(tokens),
+                                     relation_attributes=self._relation_attributes,
+                                     relation_attribute_definitions=relation_attribute_definitions)
+        self._database = InternalDatabase([],
+                                          nodes or [],
+                                          [bus] if bus else [],
+                                          _load_version(tokens),
+                                          dbc_specifics)
+
+    def _load_message(self, index: int) -> Message:
+        frame_id_dbc = self._frame_ids[index]
+        start, end = self._blocks[index]
+        statements = [self._string[start:end]]
+
+        for start, end in self._message_statements.get(frame_id_dbc, []):
+            statements.append(self._string[start:end])
+
+        tokens = self._parse('\n'.join(statements))
+        message_attributes = _load_attributes(tokens, self._definitions)
+        attributes = DbcAttributes(database=self._attributes.database,
+                                   messages=message_attributes.messages,
+                                   signals=message_attributes.signals,
+                                   nodes=self._attributes.nodes,
+                                   envvars=self._attributes.envvars)
+        message = _load_messages_and_relations(tokens,
+                                               _load_comments(tokens),
+                                               attributes,
+                                               self._definitions,
+                                               self._relation_attributes,
+                                               self._strict,
+                                               self._bus_name,
+                                               self._sort_signals)[0]
+
+        if self._prune_choices:
+            prune_message_choices(message)
+
+        return message
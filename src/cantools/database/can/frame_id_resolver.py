@@ -0,0 +1,111 @@
+# Resolvers of frame ids that are not found in the frame id table of a
+# database.
+
+from typing import TYPE_CHECKING
+
+from ... import j1939
+
+if TYPE_CHECKING:
+    from .message import Message
+
+
+class FrameIdResolver:
+    """Base class of frame id resolvers.
+
+    A :class:`Database<.can.Database>` looks up a frame id in its frame
+    id table first, and only calls :meth:`.resolve()` of its resolver
+    if not found. Resolved messages are cached per raw frame id, so
+    repeated lookups of the same frame id are dictionary lookups.
+
+    Subclasses build their index in :meth:`.refresh()` and implement
+    :meth:`._resolve()`.
+
+    """
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        self._cache_size = cache_size
+        self._cache: dict[int, Message | None] = {}
+
+    def refresh(self, messages: list["Message"]) -> None:
+        """Rebuild the index from given messages. Called by the database
+        when its lookup tables are refreshed.
+
+        """
+
+        self._cache = {}
+
+    def resolve(self,
+                frame_id: int,
+                is_extended_frame: bool) -> "Message | None":
+        """Find the message for given raw frame id `frame_id`, or return
+        ``None`` if there is no such message.
+
+        """
+
+        key = frame_id | (0x80000000 if is_extended_frame else 0)
+
+        try:
+            return self._cache[key]
+        except KeyError:
+            pass
+
+        message = self._resolve(frame_id, is_extended_frame)
+
+        if len(self._cache) >= self._cache_size:
+            self._cache.clear()
+
+        self._cache[key] = message
+
+        return message
+
+    def _resolve(self,
+                 frame_id: int,
+                 is_extended_frame: bool) -> "Message | None":
+        raise NotImplementedError
+
+
+class J1939FrameIdResolver(FrameIdResolver):
+    """Find J1939 messages by parameter group number (PGN), ignoring
+    the priority, the destination address and the source address of
+    the frame id.
+
+    If several messages have the same PGN, the one with the same
+    source address as the frame id is preferred.
+
+    """
+
+    def __init__(self, cache_size: int = 4096) -> None:
+        super().__init__(cache_size)
+        self._pgn_to_messages: dict[int, dict[int, Message]] = {}
+
+    def refresh(self, messages: list["Message"]) -> None:
+        super().refresh(messages)
+        self._pgn_to_messages = {}
+
+        for message in messages:
+            if message.protocol != 'j1939' or not message.is_extended_frame:
+                continue
+
+            frame_id = message.frame_id & 0x1fffffff
+            pgn = j1939.pgn_from_frame_id(frame_id)
+            source_addresses = self._pgn_to_messages.setdefault(pgn, {})
+            source_addresses.setdefault(frame_id & 0xff, message)
+
+    def _resolve(self,
+                 frame_id: int,
+                 is_extended_frame: bool) -> "Message | None":
+        if not is_extended_frame or frame_id > 0x1fffffff:
+            return None
+
+        source_addresses = self._pgn_to_messages.get(
+            j1939.pgn_from_frame_id(frame_id))
+
+        if source_addresses is None:
+            return None
+
+        message = source_addresses.get(frame_id & 0xff)
+
+        if message is None:
+            message = next(iter(source_addresses.values()))
+
+        return message
@@ -1,9 +1,10 @@
 # A CAN message.
 
 import logging
-from collections.abc import MutableSequence, Sequence
+from collections.abc import Callable, Iterable, MutableSequence, Sequence
 from copy import deepcopy
 from typing import (
+    TYPE_CHECKING,
     Optional,
     cast,
 )
@@ -25,22 +26,32 @@ from ...typechecking import (
     SignalMappingType,
     SignalValueType,
 )
+from ..compiled import (
+    CompiledDecoder,
+    CompiledEncoder,
+    compiled_codecs_generation,
+)
 from ..errors import DecodeError, EncodeError, Error
 from ..namedsignalvalue import NamedSignalValue
 from ..utils import (
     SORT_SIGNALS_DEFAULT,
     create_encode_decode_formats,
     decode_data,
-    encode_data,
     format_or,
     sort_signals_by_start_bit,
     start_bit,
     type_sort_signals,
 )
+from .decode_cache import DecodeCache
 from .formats.arxml.message_specifics import AutosarMessageSpecifics
 from .signal import Signal
 from .signal_group import SignalGroup
 
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ..batch import ColumnsType, PayloadsType
+
 LOGGER = logging.getLogger(__name__)
 
 SignalTreeMuxElemType = dict[str, dict[int, Sequence[str]]]
@@ -140,6 +151,8 @@ class Message:
         self._signal_tree: SignalTreeType = []
         self._strict = strict
         self._protocol = protocol
+        self._decode_cache: DecodeCache | None = None
+        self._codecs_generation = 0
         self.refresh()
 
     def _create_codec(self,
@@ -196,10 +209,28 @@ class Message:
 
             signals.append(signal)
 
+        formats = create_encode_decode_formats(signals, self._length)
+        decoder = CompiledDecoder(
+            signals,
+            self._length,
+            {
+                name: {mux: codec['decoder'] for mux, codec in codecs.items()}
+                for name, codecs in multiplexers.items()
+            })
+        encoder = CompiledEncoder(
+            signals,
+            formats,
+            self._length,
+            {
+                name: {mux: codec['encoder'] for mux, codec in codecs.items()}
+                for name, codecs in multiplexers.items()
+            })
+
         return {
             'signals': signals,
-            'formats': create_encode_decode_formats(signals,
-                                                    self._length),
+            'formats': formats,
+            'decoder': decoder,
+            'encoder': encoder,
             'multiplexers': multiplexers
         }
 
@@ -505,6 +536,20 @@ class Message:
     def protocol(self, value: str | None) -> None:
         self._protocol = value
 
+    @property
+    def decode_cache(self) -> DecodeCache | None:
+        """The :class:`DecodeCache
+        <cantools.database.can.decode_cache.DecodeCache>` of decoded
+        payloads, or ``None`` if decoded payloads are not cached.
+
+        """
+
+        return self._decode_cache
+
+    @decode_cache.setter
+    def decode_cache(self, value: DecodeCache | None) -> None:
+        self._decode_cache = value
+
     @property
     def signal_tree(self) -> SignalTreeType:
         """All signal names and multiplexer ids as a tree. Multiplexer signals
@@ -777,35 +822,6 @@ class Message:
                     f'or equal to {signal.maximum} in message "{self.name}", '
                     f'but got {scaled_value}.')
 
-    def _encode(self, node: Codec, data: SignalMappingType, scaling: bool) -> tuple[int, int, list[Signal]]:
-        encoded = encode_data(data,
-                              node['signals'],
-                              node['formats'],
-                              scaling)
-        padding_mask = node['formats'].padding_mask
-        multiplexers = node['multiplexers']
-
-        all_signals = list(node['signals'])
-        for signal in multiplexers:
-            mux = self._get_mux_number(data, signal)
-
-            try:
-                node = multiplexers[signal][mux]
-            except KeyError:
-                raise EncodeError(f'Expected multiplexer id in '
-                                  f'{{{format_or(list(multiplexers[signal].keys()))}}}, '
-                                  f'for multiplexer "{signal}" '
-                                  f'but got {mux}') from None
-
-            mux_encoded, mux_padding_mask, mux_signals = \
-                self._encode(node, data, scaling)
-            all_signals.extend(mux_signals)
-
-            encoded |= mux_encoded
-            padding_mask &= mux_padding_mask
-
-        return encoded, padding_mask, all_signals
-
     def _encode_container(self,
                           data: ContainerEncodeInputType,
                           scaling: bool,
@@ -942,9 +958,9 @@ class Message:
         if self._codecs is None:
             raise ValueError('Codec is not initialized.')
 
-        encoded, padding_mask, _ = self._encode(self._codecs,
-                                                cast('SignalMappingType', data),
-                                                scaling)
+        encoded, padding_mask = self._codecs['encoder'].encode(
+            cast('SignalMappingType', data),
+            scaling)
 
         if padding:
             padding_pattern = int.from_bytes([self._unused_bit_pattern] * self._length, "big")
@@ -952,6 +968,38 @@ class Message:
 
         return encoded.to_bytes(self._length, "big")
 
+    def encode_many(self,
+                    columns: "ColumnsType",
+                    scaling: bool = True,
+                    padding: bool = False,
+                    strict: bool = True) -> "np.ndarray":
+        """Encode many frames of this message at once. Requires the
+        optional ``numpy`` package.
+
+        `columns` maps the name of every required signal to an array
+        or a sequence with one value per frame. Scalars are used for
+        all frames. Signals that are only used by some multiplexed
+        branches are ignored in the frames where their branch is not
+        selected.
+
+        Returns a 2-D ``uint8`` array with one encoded frame per row.
+
+        `scaling`, `padding` and `strict` have the same meaning as for
+        :meth:`encode()`. The range checks of `strict` are done for all
+        frames at once, and an `EncodeError` exception for the first
+        invalid value is raised.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> foo.encode_many({'Bar': [1, 2], 'Fum': 5.0})
+        array([[ 1, 69, 35,  0, 17],
+               [ 2, 69, 35,  0, 17]], dtype=uint8)
+
+        """
+
+        from ..batch import encode_many  # noqa: PLC0415
+
+        return encode_many(self, columns, scaling, padding, strict)
+
     def _decode(self,
                 node: Codec,
                 data: bytes,
@@ -1093,6 +1141,10 @@ class Message:
         If `allow_excess` is ``True``, data that is are longer than
         the expected message length is decoded, else a `ValueError` is
         raised if such data is encountered.
+
+        If the message has a :attr:`decode_cache`, the decoded signals
+        of repeated payloads are returned from the cache as a
+        read-only mapping.
         """
 
         if decode_containers and self.is_container:
@@ -1127,6 +1179,111 @@ class Message:
         elif self._codecs is None:
             raise ValueError('Codec is not initialized.')
 
+        if self._decode_cache is not None:
+            # The generations make entries decoded before the codecs
+            # or the conversions of the signals changed unreachable.
+            key = (self,
+                   self._codecs_generation,
+                   compiled_codecs_generation(),
+                   bytes(data),
+                   decode_choices,
+                   scaling,
+                   allow_truncated,
+                   allow_excess)
+            decoded = self._decode_cache.get(key)
+
+            if decoded is None:
+                decoded = self._decode_cache.put(
+                    key,
+                    self._decode_uncached(data,
+                                          decode_choices,
+                                          scaling,
+                                          allow_truncated,
+                                          allow_excess))
+
+            return cast('SignalDictType', decoded)
+
+        return self._decode_uncached(data,
+                                     decode_choices,
+                                     scaling,
+                                     allow_truncated,
+                                     allow_excess)
+
+    def create_decoder(self,
+                       signal_names: Iterable[str]) \
+                       -> Callable[..., SignalDictType]:
+        """Return a function ``decode(data, decode_choices=True,
+        scaling=True)``, which decodes given data as a message of this
+        type like :meth:`.decode_simple()`, but only the signals named
+        in `signal_names` and the multiplexer signals needed to select
+        them. This is faster than decoding all signals if only a few
+        of them are needed.
+
+        Other signals are not decoded, so errors in them, for example
+        an invalid multiplexer id of a branch without any of the
+        signals, are not detected.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> decode = foo.create_decoder(['Fum'])
+        >>> decode(b'\\x01\\x45\\x23\\x00\\x11')
+        {'Fum': 5.0}
+
+        """
+
+        if self.is_container:
+            raise DecodeError(f'Message "{self.name}" is a container')
+        elif self._codecs is None:
+            raise ValueError('Codec is not initialized.')
+
+        names = set(signal_names)
+        length = self._length
+
+        def create(node: Codec) -> CompiledDecoder:
+            multiplexers = {
+                name: {mux: create(child) for mux, child in children.items()}
+                for name, children in node['multiplexers'].items()
+            }
+            signals = [
+                signal for signal in node['signals']
+                if signal.name in names or signal.name in multiplexers
+            ]
+
+            return CompiledDecoder(signals, length, multiplexers)
+
+        decoder = create(self._codecs)
+
+        def decode(data: bytes,
+                   decode_choices: bool = True,
+                   scaling: bool = True) -> SignalDictType:
+            if len(data) == length:
+                return decoder.decode(data, decode_choices, scaling)
+            elif len(data) > length:
+                return decoder.decode(data[:length], decode_choices, scaling)
+
+            # Raises an error, as truncated payloads are not allowed.
+            return self.decode_simple(data, decode_choices, scaling)
+
+        return decode
+
+    def _decode_uncached(self,
+                         data: bytes,
+                         decode_choices: bool,
+                         scaling: bool,
+                         allow_truncated: bool,
+                         allow_excess: bool) -> SignalDictType:
+        assert self._codecs is not None
+
+        # Use the compiled decoder for complete payloads. Truncated
+        # payloads and errors are handled by the generic decoder.
+        if len(data) == self._length:
+            return self._codecs['decoder'].decode(data,
+                                                  decode_choices,
+                                                  scaling)
+        elif allow_excess and len(data) > self._length:
+            return self._codecs['decoder'].decode(data[:self._length],
+                                                  decode_choices,
+                                                  scaling)
+
         return self._decode(self._codecs,
                             data,
                             decode_choices,
@@ -1134,6 +1291,41 @@ class Message:
                             allow_truncated,
                             allow_excess)
 
+    def decode_many(self,
+                    payloads: "PayloadsType",
+                    decode_choices: bool = False,
+                    scaling: bool = True) -> dict[str, "np.ndarray"]:
+        """Decode many payloads of this message at once. Requires the
+        optional ``numpy`` package.
+
+        `payloads` is either a 2-D ``uint8`` array with one payload
+        per row or a sequence of ``bytes`` objects. Excess data of a
+        payload is ignored, while too short payloads raise a
+        `DecodeError`.
+
+        Returns a dictionary of one NumPy array per signal, with one
+        value per payload. Signals of multiplexed branches are masked
+        arrays, which are masked in all rows where the branch is not
+        selected by its multiplexer signal.
+
+        If `scaling` is ``False`` no scaling of signals is performed.
+
+        If `decode_choices` is ``True``, signals with choices are
+        returned as categorical codes, i.e. as the index of the value
+        in ``list(signal.choices.values())``, or -1 if there is no
+        choice for the value.
+
+        >>> foo = db.get_message_by_name('Foo')
+        >>> foo.decode_many([b'\\x01\\x45\\x23\\x00\\x11',
+        ...                  b'\\x02\\x45\\x23\\x00\\x11'])
+        {'Bar': array([1, 2]), 'Fum': array([5., 5.])}
+
+        """
+
+        from ..batch import decode_many  # noqa: PLC0415
+
+        return decode_many(self, payloads, decode_choices, scaling)
+
     def decode_container(self,
                          data: bytes,
                          decode_choices: bool = True,
@@ -1288,6 +1480,9 @@ class Message:
     def refresh(self, strict: bool | None = None) -> None:
         """Refresh the internal message state.
 
+        This recreates the codecs, including the compiled encoders and
+        decoders, of the message. Call it after modifying signals of the message.
+
         If `strict` is ``True`` an exception is raised if any signals
         are overlapping or if they don't fit in the message. This
         argument overrides the value of the same argument passed to
@@ -1296,6 +1491,8 @@ class Message:
         """
 
         self._check_signal_lengths()
+
+        self._codecs_generation += 1
         self._codecs = self._create_codec()
         self._signal_tree = self._create_signal_tree(self._codecs)
         self._signal_dict = {signal.name: signal for signal in self._signals}
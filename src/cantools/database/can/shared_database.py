@@ -0,0 +1,170 @@
+# A read-only CAN database in shared memory.
+
+import sys
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any
+
+from .database import Database
+from .formats.cdb import CdbMessageIndex
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+# The shared databases created or attached to by this process, by
+# name, so that each process attaches to a shared database only once.
+_SHARED_DATABASES: dict[str, 'SharedDatabase'] = {}
+
+
+class SharedDatabase:
+    """A read-only copy of a CAN database in shared memory, which
+    processes attach to without parsing or copying it.
+
+    The database is stored in the compact binary CDB format, see
+    :meth:`Database.as_cdb_bytes()
+    <cantools.database.can.Database.as_cdb_bytes>`. :attr:`.database`
+    returns a database of which messages are created from the shared
+    memory when first used, so each process only creates the messages
+    it uses, and the shared pages are never written to.
+
+    Pickling a shared database only pickles the name of the shared
+    memory block, so it is cheap to pass to processes created by
+    :mod:`multiprocessing` or :mod:`concurrent.futures`, where it is
+    attached to when unpickled. Each process attaches to a shared
+    database once, and keeps it until :meth:`.close()` is called.
+
+    The process creating the shared database should call
+    :meth:`.unlink()` when it is no longer used by any process, or use
+    it as a context manager. On Python versions before 3.13 the
+    processes attaching to it should be started by the creating
+    process using :mod:`multiprocessing`, as the shared memory block
+    may otherwise be removed when an attaching process exits.
+
+    >>> db = cantools.database.load_file('foo.dbc')
+    >>> with SharedDatabase.create(db) as shared:
+    ...     with multiprocessing.Pool() as pool:
+    ...         pool.starmap(decode, [(shared, frame) for frame in frames])
+
+    where ``decode()`` uses ``shared.database``.
+
+    """
+
+    def __init__(self,
+                 block: shared_memory.SharedMemory,
+                 strict: bool = True,
+                 frame_id_mask: int | None = None,
+                 owner: bool = False) -> None:
+        self._shared_memory = block
+        self._strict = strict
+        self._frame_id_mask = frame_id_mask
+        self._owner = owner
+        self._database: Database | None = None
+        _SHARED_DATABASES[block.name] = self
+
+    @classmethod
+    def create(cls,
+               database: Database,
+               name: str | None = None) -> 'SharedDatabase':
+        """Copy given database `database` to a new shared memory block
+        named `name`, or a unique name if ``None``.
+
+        Format specific properties, for example DBC attributes, are not
+        copied.
+
+        """
+
+        data = database.as_cdb_bytes()
+        block = shared_memory.SharedMemory(name, create=True, size=len(data))
+        assert block.buf is not None
+        block.buf[:len(data)] = data
+
+        return cls(block, database._strict, database._frame_id_mask, True)
+
+    @classmethod
+    def attach(cls,
+               name: str,
+               strict: bool = True,
+               frame_id_mask: int | None = None) -> 'SharedDatabase':
+        """Attach to the shared database in the shared memory block named
+        `name`, unless already attached to by this process.
+
+        """
+
+        try:
+            return _SHARED_DATABASES[name]
+        except KeyError:
+            pass
+
+        if sys.version_info >= (3, 13):
+            block = shared_memory.SharedMemory(name, track=False)
+        else:
+            block = shared_memory.SharedMemory(name)
+
+        return cls(block, strict, frame_id_mask)
+
+    @property
+    def name(self) -> str:
+        """The name of the shared memory block.
+
+        """
+
+        return self._shared_memory.name
+
+    @property
+    def size(self) -> int:
+        """The size of the shared memory block in bytes.
+
+        """
+
+        return self._shared_memory.size
+
+    @property
+    def database(self) -> Database:
+        """The database in the shared memory, created on first use in
+        each process. It must not be modified.
+
+        """
+
+        if self._database is None:
+            database = Database(frame_id_mask=self._frame_id_mask,
+                                strict=self._strict,
+                                sort_signals=None)
+            # Signals are stored in the order of the copied database.
+            database._add_message_index(
+                CdbMessageIndex(self._shared_memory.buf, self._strict, None))
+            self._database = database
+
+        return self._database
+
+    def close(self) -> None:
+        """Detach from the shared memory block. The database returned by
+        :attr:`.database` can not load messages afterwards.
+
+        """
+
+        self._database = None
+        _SHARED_DATABASES.pop(self.name, None)
+        self._shared_memory.close()
+
+    def unlink(self) -> None:
+        """Remove the shared memory block once all processes have closed
+        it.
+
+        """
+
+        self._shared_memory.unlink()
+
+    def __enter__(self) -> 'Self':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return (SharedDatabase.attach,
+                (self.name, self._strict, self._frame_id_mask))
+
+    def __repr__(self) -> str:
+        return f"SharedDatabase('{self.name}', size={self.size})"
@@ -3,6 +3,7 @@
 from cantools.database.can.formats.dbc_specifics import DbcSpecifics
 
 from ...typechecking import ByteOrder, Choices, Comments, SignalValueType
+from ..compiled import invalidate_compiled_codecs
 from ..conversion import BaseConversion, IdentityConversion
 from ..namedsignalvalue import NamedSignalValue
 
@@ -191,6 +192,7 @@ class Signal:
             choices=self.conversion.choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def offset(self) -> int | float:
@@ -205,6 +207,7 @@ class Signal:
             choices=self.conversion.choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def choices(self) -> Choices | None:
@@ -220,6 +223,7 @@ class Signal:
             choices=choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def is_float(self) -> bool:
@@ -234,6 +238,7 @@ class Signal:
             choices=self.conversion.choices,
             is_float=is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def comment(self) -> str | None:
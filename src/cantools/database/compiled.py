@@ -0,0 +1,770 @@
+# Encoders and decoders generated as Python source code.
+
+import math
+import struct
+from collections.abc import Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Union
+
+from ..typechecking import (
+    Formats,
+    SignalDictType,
+    SignalMappingType,
+    SignalValueType,
+)
+from .conversion import (
+    BaseConversion,
+    IdentityConversion,
+    LinearConversion,
+    LinearIntegerConversion,
+    NamedSignalConversion,
+)
+from .errors import DecodeError, EncodeError
+from .namedsignalvalue import NamedSignalValue
+from .utils import encode_data, format_or, start_bit
+
+if TYPE_CHECKING:
+    from .can.signal import Signal
+    from .diagnostics import Data
+
+
+_BUILTIN_CONVERSIONS = (
+    IdentityConversion,
+    LinearConversion,
+    LinearIntegerConversion,
+    NamedSignalConversion,
+)
+
+# The generation of the conversions of all signals, incremented when
+# the conversion of a signal is replaced. Generated functions inline
+# the scales and offsets of the conversions, so functions of an older
+# generation are generated again when called.
+_GENERATION = [0]
+
+_FLOAT_STRUCTS = {
+    16: struct.Struct('>e'),
+    32: struct.Struct('>f'),
+    64: struct.Struct('>d'),
+}
+
+
+def invalidate_compiled_codecs() -> None:
+    """Make all compiled codecs generate their functions again when
+    called next. Called when the conversion of a signal is replaced.
+
+    """
+
+    _GENERATION[0] += 1
+
+
+def compiled_codecs_generation() -> int:
+    """Return the current generation of the conversions of all signals.
+
+    """
+
+    return _GENERATION[0]
+
+
+def _mux_number(conversion: BaseConversion, value: SignalValueType) -> int:
+    """Same as ``Message._get_mux_number()``, given the conversion of the
+    multiplexer signal.
+
+    """
+
+    if isinstance(value, (str, NamedSignalValue)):
+        try:
+            return conversion.choice_to_number(str(value))
+        except KeyError:
+            raise EncodeError() from None
+
+    return int(value)
+
+
+def _choice_to_raw(conversion: BaseConversion,
+                   value: str | NamedSignalValue) -> int:
+    """Same as ``_encode_signal_values()`` for choice strings and named
+    signal values.
+
+    """
+
+    if isinstance(value, str):
+        return conversion.choice_to_number(value)
+
+    # validate the given NamedSignalValue first
+    if value != conversion.raw_to_scaled(value.value, decode_choices=True):
+        raise EncodeError(
+            f"Invalid 'NamedSignalValue' name/value pair not found! Name {value.name}, value {value.value}"
+        )
+
+    return value.value
+
+
+def _pack_float32(value: float) -> bytes:
+    # Values too large for single precision are packed as infinity,
+    # just as bitstruct does.
+    try:
+        return _FLOAT_STRUCTS[32].pack(value)
+    except OverflowError:
+        return _FLOAT_STRUCTS[32].pack(math.copysign(math.inf, value))
+
+
+def _raise_unsigned_overflow(value: int) -> None:
+    raise OverflowError(f'Unsigned integer value {value} out of range.')
+
+
+def _raise_signed_overflow(value: int) -> None:
+    raise OverflowError(f'Signed integer value {value} out of range.')
+
+
+def bit_offsets(signals: Sequence[Union["Signal", "Data"]],
+                number_of_bytes: int) -> dict[str, int] | None:
+    """Return the bit offset of every signal in the integer it is
+    extracted from, or ``None`` if the signals do not fit.
+
+    The offsets are derived exactly like the bitstruct formats created
+    by ``create_encode_decode_formats()``, i.e. overlapping signals
+    (only possible in non-strict mode) end up at the same bit
+    positions as with the generic codec.
+
+    """
+
+    format_length = 8 * number_of_bytes
+    offsets: dict[str, int] = {}
+
+    # Big endian signals are extracted from the payload interpreted
+    # as a big endian integer.
+    be_signals = sorted(
+        [signal for signal in signals if signal.byte_order == 'big_endian'],
+        key=start_bit)
+    start = 0
+    cursor = 0
+
+    for signal in be_signals:
+        cursor += max(start_bit(signal) - start, 0)
+        offsets[signal.name] = format_length - cursor - signal.length
+        cursor += signal.length
+        start = start_bit(signal) + signal.length
+
+    if cursor + max(format_length - start, 0) > format_length:
+        return None
+
+    # Little endian signals are extracted from the payload
+    # interpreted as a little endian integer.
+    end = format_length
+    cursor = 0
+
+    for signal in signals[::-1]:
+        if signal.byte_order == 'big_endian':
+            continue
+
+        cursor += max(end - (signal.start + signal.length), 0)
+        offsets[signal.name] = format_length - cursor - signal.length
+        cursor += signal.length
+        end = signal.start
+
+    if cursor + max(end, 0) > format_length:
+        return None
+
+    return offsets
+
+
+class _SourceNamespace:
+    """The globals of generated source code.
+
+    """
+
+    def __init__(self) -> None:
+        self.globals: dict[str, Any] = {
+            '_from_bytes': int.from_bytes,
+            '_numbers': (int, float),
+            '_DecodeError': DecodeError,
+            '_EncodeError': EncodeError,
+        }
+        self._names: dict[tuple[str, int], str] = {}
+
+    def add(self, prefix: str, value: Any) -> str:
+        """Add given value and return its name. Adding the same object
+        again returns the same name.
+
+        """
+
+        key = (prefix, id(value))
+        name = self._names.get(key)
+
+        if name is None:
+            name = f'_{prefix}{len(self.globals)}'
+            self.globals[name] = value
+            self._names[key] = name
+
+        return name
+
+    def literal(self, value: Any) -> str:
+        """Return an expression that evaluates to given value. Plain numbers
+        are inlined as constants.
+
+        """
+
+        if type(value) is int or (type(value) is float and math.isfinite(value)):
+            return repr(value)
+
+        return self.add('k', value)
+
+
+def _raw_expression(signal: Union["Signal", "Data"],
+                    offset: int,
+                    format_length: int,
+                    namespace: _SourceNamespace) -> str:
+    source = 'big' if signal.byte_order == 'big_endian' else 'little'
+
+    if offset > 0:
+        source = f'({source} >> {offset})'
+
+    if offset + signal.length < format_length:
+        source = f'({source} & {hex((1 << signal.length) - 1)})'
+
+    if signal.conversion.is_float:
+        unpack = namespace.add('f', _FLOAT_STRUCTS[signal.length].unpack)
+
+        return f'{unpack}({source}.to_bytes({signal.length // 8}, "big"))[0]'
+    elif signal.is_signed:
+        sign_bit = hex(1 << (signal.length - 1))
+
+        return f'(({source} ^ {sign_bit}) - {sign_bit})'
+
+    return source
+
+
+def _value_expression(conversion: BaseConversion,
+                      raw: str,
+                      decode_choices: bool,
+                      scaling: bool,
+                      namespace: _SourceNamespace) -> str:
+    """Return an expression of the decoded value, identical to what
+    ``decode_data()`` returns for given flags.
+
+    """
+
+    if not scaling:
+        if decode_choices and conversion.choices:
+            choices = namespace.add('c', conversion.choices)
+
+            return f'(_v if (_v := {choices}.get({raw})) is not None else {raw})'
+
+        return raw
+
+    if isinstance(conversion, NamedSignalConversion):
+        scaled = _value_expression(conversion._conversion,
+                                   raw,
+                                   False,
+                                   True,
+                                   namespace)
+
+        if not decode_choices:
+            return scaled
+
+        choices = namespace.add('c', conversion.choices)
+        key = f'int({raw})' if conversion.is_float else raw
+
+        return f'(_v if (_v := {choices}.get({key})) is not None else {scaled})'
+    elif isinstance(conversion, IdentityConversion):
+        return raw
+    elif isinstance(conversion, (LinearConversion, LinearIntegerConversion)):
+        scale = namespace.literal(conversion.scale)
+        offset = namespace.literal(conversion.offset)
+
+        return f'({raw} * {scale} + {offset})'
+
+    # A user defined conversion.
+    name = namespace.add('v', conversion)
+
+    return f'{name}.raw_to_scaled({raw}, {decode_choices})'
+
+
+def _numeric_raw_expression(conversion: BaseConversion,
+                            value: str,
+                            scaling: bool,
+                            namespace: _SourceNamespace) -> str:
+    """Return an expression of the raw value of given numeric value,
+    identical to what ``_encode_signal_values()`` does.
+
+    """
+
+    if not scaling or isinstance(conversion, IdentityConversion):
+        return value if conversion.is_float else f'round({value})'
+    elif isinstance(conversion, NamedSignalConversion):
+        return _numeric_raw_expression(conversion._conversion,
+                                       value,
+                                       scaling,
+                                       namespace)
+    elif isinstance(conversion, LinearIntegerConversion):
+        # try to avoid a loss of precision whenever possible
+        scale = namespace.literal(conversion.scale)
+        offset = namespace.literal(conversion.offset)
+
+        return (f'round(_q[0] if (_q := divmod({value} - {offset}, {scale}))[1] == 0 '
+                f'else ({value} - {offset}) / {scale})')
+    elif isinstance(conversion, LinearConversion):
+        scale = namespace.literal(conversion.scale)
+        offset = namespace.literal(conversion.offset)
+        raw = f'({value} - {offset}) / {scale}'
+
+        return raw if conversion.is_float else f'round({raw})'
+
+    # A user defined conversion.
+    name = namespace.add('v', conversion)
+
+    return f'{name}.numeric_scaled_to_raw({value})'
+
+
+def _pack_expression(signal: Union["Signal", "Data"],
+                     raw: str,
+                     offset: int,
+                     namespace: _SourceNamespace) -> tuple[list[str], str]:
+    """Return range checks of given raw value and an expression of its
+    bits shifted to their position.
+
+    """
+
+    checks: list[str] = []
+
+    if signal.conversion.is_float:
+        if signal.length == 32:
+            pack = namespace.add('p', _pack_float32)
+        else:
+            pack = namespace.add('p', _FLOAT_STRUCTS[signal.length].pack)
+
+        bits = f'_from_bytes({pack}({raw}), "big")'
+    elif signal.is_signed:
+        overflow = namespace.add('o', _raise_signed_overflow)
+        checks += [
+            f'if ({raw} + {hex(1 << (signal.length - 1))}) >> {signal.length}:',
+            f'    {overflow}({raw})',
+        ]
+        bits = f'({raw} & {hex((1 << signal.length) - 1)})'
+    else:
+        overflow = namespace.add('o', _raise_unsigned_overflow)
+        checks += [
+            f'if {raw} >> {signal.length}:',
+            f'    {overflow}({raw})',
+        ]
+        bits = raw
+
+    if offset > 0:
+        bits = f'({bits} << {offset})'
+
+    return checks, bits
+
+
+class CompiledDecoder:
+    """A decoder of one node of a message's codec tree.
+
+    The decoder is a Python function generated when the codec is
+    created. It extracts all signals with precomputed shifts and masks
+    from the payload interpreted as one big and one little endian
+    integer, applies the conversions inline and builds the result
+    dictionary in one go. Signals of multiplexed branches are decoded
+    by the compiled decoders of the child nodes.
+
+    Call ``decoder.decode(data, decode_choices, scaling)`` with a
+    payload of exactly `number_of_bytes` bytes. The result is
+    identical to the one of ``decode_data()``. The function is
+    generated on first use, as compiling it for every message of a
+    large database would slow down loading, and again after the
+    conversion of a signal has changed.
+
+    """
+
+    def __init__(self,
+                 signals: Sequence[Union["Signal", "Data"]],
+                 number_of_bytes: int,
+                 multiplexers: Mapping[str, Mapping[int, "CompiledDecoder"]] | None = None,
+                 ) -> None:
+        self._signals = signals
+        self._number_of_bytes = number_of_bytes
+        self._multiplexers = multiplexers or {}
+        self._source: str | None = None
+        self._generation = 0
+
+    @property
+    def source(self) -> str:
+        """The generated source code.
+
+        """
+
+        return self._compile()._source  # type: ignore[return-value]
+
+    def decode(self,
+               data: bytes,
+               decode_choices: bool,
+               scaling: bool) -> SignalDictType:
+        return self._compile().decode(data, decode_choices, scaling)
+
+    def decode_integers(self,
+                        big: int,
+                        little: int,
+                        decode_choices: bool,
+                        scaling: bool) -> SignalDictType:
+        return self._compile().decode_integers(big,
+                                               little,
+                                               decode_choices,
+                                               scaling)
+
+    def _compile(self) -> "CompiledDecoder":
+        """Generate and compile the decode functions, unless already
+        done. They replace the methods of this instance.
+
+        """
+
+        if self._source is None or self._generation != _GENERATION[0]:
+            self._generation = _GENERATION[0]
+            namespace = _SourceNamespace()
+            namespace.globals['_generation'] = _GENERATION
+            namespace.globals['_recompile'] = self._compile
+            source = self._generate(namespace)
+            # The source is generated from the database, not user input.
+            exec(compile(source, '<compiled decoder>', 'exec'),  # noqa: S102
+                 namespace.globals)
+            self.__dict__['decode'] = namespace.globals['decode']
+            self.__dict__['decode_integers'] = \
+                namespace.globals['decode_integers']
+            self._source = source
+
+        return self
+
+    def _generate(self, namespace: _SourceNamespace) -> str:
+        format_length = 8 * self._number_of_bytes
+        offsets = bit_offsets(self._signals, self._number_of_bytes)
+        body: list[str] = []
+
+        if offsets is None or any(signal.conversion.is_float
+                                  and signal.length not in _FLOAT_STRUCTS
+                                  for signal in self._signals):
+            # Same as the bitstruct formats, which fail to unpack.
+            body.append("raise _DecodeError('unpacking failed')")
+        else:
+            body += self._generate_body(offsets, format_length, namespace)
+
+        # Only convert the payload to the integers actually needed by
+        # this node and its children.
+        conversions: list[str] = []
+
+        for name in ('big', 'little'):
+            if self._uses(name):
+                conversions.append(f"    {name} = _from_bytes(data, '{name}')")
+            elif self._multiplexers:
+                conversions.append(f'    {name} = 0')
+
+        lines = [
+            'def decode_integers(big, little, decode_choices, scaling):',
+            f'    if _generation[0] != {self._generation}:',
+            '        return _recompile().decode_integers(big, little, decode_choices, scaling)',
+            *[f'    {line}' for line in body],
+            '',
+            'def decode(data, decode_choices, scaling):',
+            f'    if _generation[0] != {self._generation}:',
+            '        return _recompile().decode(data, decode_choices, scaling)',
+            *conversions,
+            *[f'    {line}' for line in body],
+            ''
+        ]
+
+        return '\n'.join(lines)
+
+    def _uses(self, byte_order: str) -> bool:
+        """Returns ``True`` if any signal of this node or its children is
+        extracted from the payload interpreted as a `byte_order`
+        (``'big'`` or ``'little'``) endian integer.
+
+        """
+
+        if any(signal.byte_order == f'{byte_order}_endian'
+               for signal in self._signals):
+            return True
+
+        return any(child._uses(byte_order)
+                   for children in self._multiplexers.values()
+                   for child in children.values())
+
+    def _generate_body(self,
+                       offsets: dict[str, int],
+                       format_length: int,
+                       namespace: _SourceNamespace) -> list[str]:
+        body: list[str] = []
+        raws: dict[str, str] = {}
+
+        for i, signal in enumerate(self._signals):
+            body.append(f'r{i} = '
+                        f'{_raw_expression(signal, offsets[signal.name], format_length, namespace)}')
+            raws[signal.name] = f'r{i}'
+
+        def dictionary(decode_choices: bool, scaling: bool) -> str:
+            items = [
+                f'{signal.name!r}: '
+                f'{_value_expression(signal.conversion, raws[signal.name], decode_choices, scaling, namespace)}'
+                for signal in self._signals
+            ]
+
+            return '{' + ', '.join(items) + '}'
+
+        variants = {
+            (decode_choices, scaling): dictionary(decode_choices, scaling)
+            for decode_choices in (True, False)
+            for scaling in (True, False)
+        }
+        target = 'd = ' if self._multiplexers else 'return '
+
+        if len(set(variants.values())) == 1:
+            body.append(target + variants[(True, True)])
+        elif (variants[(True, True)] == variants[(False, True)]
+              and variants[(True, False)] == variants[(False, False)]):
+            body += [
+                'if scaling:',
+                f'    {target}{variants[(True, True)]}',
+                'else:',
+                f'    {target}{variants[(True, False)]}',
+            ]
+        else:
+            body += [
+                'if scaling:',
+                '    if decode_choices:',
+                f'        {target}{variants[(True, True)]}',
+                '    else:',
+                f'        {target}{variants[(False, True)]}',
+                'elif decode_choices:',
+                f'    {target}{variants[(True, False)]}',
+                'else:',
+                f'    {target}{variants[(False, False)]}',
+            ]
+
+        if not self._multiplexers:
+            return body
+
+        signals = {signal.name: signal for signal in self._signals}
+
+        for name, children in self._multiplexers.items():
+            signal = signals[name]
+            conversion = signal.conversion
+            branches = namespace.add(
+                'm',
+                {mux: child._compile().decode_integers
+                 for mux, child in children.items()})
+            error = namespace.add(
+                'e',
+                f'expected multiplexer id {format_or(sorted(children))}, but got ')
+
+            if (isinstance(conversion, _BUILTIN_CONVERSIONS)
+                and conversion.scale == 1
+                and conversion.offset == 0
+                and not conversion.is_float):
+                # The multiplexer id is the raw value.
+                mux = raws[name]
+            else:
+                mux_number = namespace.add('n', _mux_number)
+                conversion_name = namespace.add('v', conversion)
+                mux = f'{mux_number}({conversion_name}, d[{name!r}])'
+
+            body += [
+                f'branch = {branches}.get(mux := {mux})',
+                'if branch is None:',
+                f'    raise _DecodeError({error} + str(mux))',
+                'd.update(branch(big, little, decode_choices, scaling))',
+            ]
+
+        body.append('return d')
+
+        return body
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The generated functions cannot be pickled. Generate them
+        # again when unpickling.
+        return (self.__class__,
+                (self._signals, self._number_of_bytes, self._multiplexers))
+
+
+class CompiledEncoder:
+    """An encoder of one node of a message's codec tree.
+
+    The encoder is a generated Python function. It converts the value
+    of every signal to its raw value, checks its range, and masks and
+    shifts it into one integer without any intermediate dictionaries.
+    Signals of multiplexed branches are encoded by the compiled
+    encoders of the child nodes.
+
+    Call ``encoder.encode(data, scaling)`` to get a tuple of the
+    encoded integer and the padding mask. The function is generated on
+    first use, and again after the conversion of a signal has changed.
+
+    """
+
+    def __init__(self,
+                 signals: Sequence[Union["Signal", "Data"]],
+                 formats: Formats,
+                 number_of_bytes: int,
+                 multiplexers: Mapping[str, Mapping[int, "CompiledEncoder"]] | None = None,
+                 ) -> None:
+        self._signals = signals
+        self._formats = formats
+        self._number_of_bytes = number_of_bytes
+        self._multiplexers = multiplexers or {}
+        self._source: str | None = None
+        self._generation = 0
+
+    @property
+    def source(self) -> str:
+        """The generated source code.
+
+        """
+
+        return self._compile()._source  # type: ignore[return-value]
+
+    def encode(self,
+               data: SignalMappingType,
+               scaling: bool) -> tuple[int, int]:
+        return self._compile().encode(data, scaling)
+
+    def _compile(self) -> "CompiledEncoder":
+        """Generate and compile the encode function, unless already done.
+        It replaces the method of this instance.
+
+        """
+
+        if self._source is None or self._generation != _GENERATION[0]:
+            self._generation = _GENERATION[0]
+            namespace = _SourceNamespace()
+            namespace.globals['_generation'] = _GENERATION
+            namespace.globals['_recompile'] = self._compile
+            source = self._generate(namespace)
+            # The source is generated from the database, not user input.
+            exec(compile(source, '<compiled encoder>', 'exec'),  # noqa: S102
+                 namespace.globals)
+            self.__dict__['encode'] = namespace.globals['encode']
+            self._source = source
+
+        return self
+
+    def _generate(self, namespace: _SourceNamespace) -> str:
+        offsets = bit_offsets(self._signals, self._number_of_bytes)
+        body: list[str] = []
+
+        if offsets is None or any((signal.conversion.is_float
+                                   and signal.length not in _FLOAT_STRUCTS)
+                                  or signal.length > 64
+                                  for signal in self._signals):
+            # Let bitstruct deal with signals that do not fit and with
+            # very long signals, which are packed by the pure Python
+            # implementation of bitstruct.
+            encode = namespace.add('n', encode_data)
+            signals = namespace.add('s', self._signals)
+            formats = namespace.add('f', self._formats)
+            body.append(f'encoded = {encode}(data, {signals}, {formats}, scaling)')
+        elif self._signals:
+            body += self._generate_signals(offsets, namespace)
+        else:
+            body.append('encoded = 0')
+
+        body.append(f'padding_mask = {self._formats.padding_mask}')
+
+        for name, children in self._multiplexers.items():
+            signal = next(signal
+                          for signal in self._signals
+                          if signal.name == name)
+            mux_number = namespace.add('n', _mux_number)
+            conversion = namespace.add('v', signal.conversion)
+            branches = namespace.add(
+                'm',
+                {mux: child._compile().encode
+                 for mux, child in children.items()})
+            error = namespace.add(
+                'e',
+                f'Expected multiplexer id in '
+                f'{{{format_or(list(children))}}}, '
+                f'for multiplexer "{name}" but got ')
+            body += [
+                f'mux = data[{name!r}]',
+                'if mux.__class__ is not int:',
+                f'    mux = {mux_number}({conversion}, mux)',
+                f'branch = {branches}.get(mux)',
+                'if branch is None:',
+                f'    raise _EncodeError({error} + str(mux))',
+                'mux_encoded, mux_padding_mask = branch(data, scaling)',
+                'encoded |= mux_encoded',
+                'padding_mask &= mux_padding_mask',
+            ]
+
+        body.append('return encoded, padding_mask')
+        lines = [
+            'def encode(data, scaling):',
+            f'    if _generation[0] != {self._generation}:',
+            '        return _recompile().encode(data, scaling)',
+            *[f'    {line}' for line in body],
+            ''
+        ]
+
+        return '\n'.join(lines)
+
+    def _generate_signals(self,
+                          offsets: dict[str, int],
+                          namespace: _SourceNamespace) -> list[str]:
+        def raw_values(scaling: bool) -> list[str]:
+            lines: list[str] = []
+
+            for i, signal in enumerate(self._signals):
+                conversion = namespace.add('v', signal.conversion)
+                choice_to_raw = namespace.add('c', _choice_to_raw)
+                numeric = _numeric_raw_expression(signal.conversion,
+                                                  'v',
+                                                  scaling,
+                                                  namespace)
+                lines += [
+                    f'v = data[{signal.name!r}]',
+                    (f'r{i} = {numeric} if isinstance(v, _numbers) '
+                     f'else {choice_to_raw}({conversion}, v)'),
+                ]
+
+            return lines
+
+        body: list[str] = []
+        scaled = raw_values(True)
+        unscaled = raw_values(False)
+
+        if scaled == unscaled:
+            body += scaled
+        else:
+            body += [
+                'if scaling:',
+                *[f'    {line}' for line in scaled],
+                'else:',
+                *[f'    {line}' for line in unscaled],
+            ]
+
+        big: list[str] = []
+        little: list[str] = []
+
+        for i, signal in enumerate(self._signals):
+            checks, bits = _pack_expression(signal,
+                                            f'r{i}',
+                                            offsets[signal.name],
+                                            namespace)
+            body += checks
+
+            if signal.byte_order == 'big_endian':
+                big.append(bits)
+            else:
+                little.append(bits)
+
+        if little:
+            little_bytes = (f'({" | ".join(little)})'
+                            f'.to_bytes({self._number_of_bytes}, "little")')
+            big.append(f'_from_bytes({little_bytes}, "big")')
+
+        body.append(f'encoded = {" | ".join(big)}')
+
+        return body
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The generated function cannot be pickled. Generate it again
+        # when unpickling.
+        return (self.__class__,
+                (self._signals,
+                 self._formats,
+                 self._number_of_bytes,
+                 self._multiplexers))
@@ -0,0 +1,287 @@
+# An on-disk cache of parsed databases, keyed by content.
+
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Any
+
+from ..typechecking import StringPathLike
+
+SUFFIX = '.pickle'
+
+# Increment when the pickled representation of the databases changes
+# in a way not covered by the cantools version, for example in
+# development versions.
+FORMAT_VERSION = 1
+
+
+class ContentCache:
+    """A bounded on-disk cache of parsed databases, keyed by a hash of
+    the database data and the options it was parsed with.
+
+    Unlike the cache selected by `cache_dir` in
+    :func:`~cantools.database.load_file()`, the key does not contain
+    the filename or its modification time, so identical files at
+    different paths, in fresh checkouts or in copied directories share
+    entries. Several processes may use the same directory.
+
+    Give a cache as `cache` to :func:`~cantools.database.load_file()`,
+    :func:`~cantools.database.load()` or
+    :func:`~cantools.database.load_string()`, or assign it to
+    :attr:`Database.content_cache
+    <cantools.database.can.Database.content_cache>` to cache the data
+    parsed by the ``add_*_string()`` methods of a database.
+
+    `maxsize` is the maximum total size of the entries in bytes. The
+    least recently used entries are removed when it is exceeded.
+
+    >>> cache = ContentCache('.cantools-cache')
+    >>> db = cantools.database.load_file('foo.dbc', cache=cache)
+    >>> cache.hits, cache.misses
+    (0, 1)
+
+    """
+
+    def __init__(self,
+                 directory: StringPathLike,
+                 maxsize: int = 256 * 1024 * 1024) -> None:
+        if maxsize < 1:
+            raise ValueError(f'Expected a maximum size of at least 1, but got {maxsize}.')
+
+        self._directory = os.fspath(directory)
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._bytes_read = 0
+        self._bytes_written = 0
+
+    @property
+    def directory(self) -> str:
+        """The directory of the cache files. It is created when the first
+        entry is added.
+
+        """
+
+        return self._directory
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum total size of the entries in bytes.
+
+        """
+
+        return self._maxsize
+
+    @property
+    def currsize(self) -> int:
+        """The current total size of the entries in bytes.
+
+        """
+
+        return sum(size for _, _, size in self._entries())
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found an entry.
+
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that did not find an entry.
+
+        """
+
+        return self._misses
+
+    @property
+    def bytes_read(self) -> int:
+        """The number of bytes read from found entries.
+
+        """
+
+        return self._bytes_read
+
+    @property
+    def bytes_written(self) -> int:
+        """The number of bytes written to added entries.
+
+        """
+
+        return self._bytes_written
+
+    def key(self, data: str | bytes, *options: Any) -> str | None:
+        """Return the key of given database data `data` parsed with given
+        options `options`, or ``None`` if the options can not be part
+        of a key.
+
+        Functions, for example `sort_signals`, are only accepted if
+        defined in :mod:`cantools.database.utils`, as the key must be
+        the same in all processes.
+
+        The key contains the cantools version and the cache format
+        version, as entries are pickled databases.
+
+        """
+
+        import cantools  # noqa: PLC0415
+
+        parts = [
+            repr(getattr(cantools, '__version__', None)),
+            repr(FORMAT_VERSION),
+        ]
+
+        for option in options:
+            if callable(option):
+                if getattr(option, '__module__', None) != 'cantools.database.utils':
+                    return None
+
+                option = option.__qualname__
+
+            parts.append(repr(option))
+
+        if isinstance(data, str):
+            data = data.encode('utf-8', 'surrogatepass')
+
+        digest = hashlib.blake2b(digest_size=20)
+        digest.update('\0'.join(parts).encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(data)
+
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the entry for given key `key`, or ``None`` if not found.
+
+        """
+
+        path = self._path(key)
+
+        try:
+            with open(path, 'rb') as fin:
+                data = fin.read()
+
+            value = pickle.loads(data)
+        except FileNotFoundError:
+            value = None
+        except Exception:
+            # Written by another version, or truncated.
+            self._remove(path)
+            value = None
+
+        if value is None:
+            self._misses += 1
+
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+        self._hits += 1
+        self._bytes_read += len(data)
+
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Add given value `value` for key `key`. The least recently used
+        entries are removed if the cache is full.
+
+        """
+
+        data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+        if len(data) > self._maxsize:
+            return
+
+        os.makedirs(self._directory, exist_ok=True)
+
+        # Write to a temporary file first, so that other processes
+        # never see partially written entries.
+        fd, temporary_path = tempfile.mkstemp(dir=self._directory)
+
+        try:
+            with os.fdopen(fd, 'wb') as fout:
+                fout.write(data)
+
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            self._remove(temporary_path)
+
+            raise
+
+        self._bytes_written += len(data)
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics.
+
+        """
+
+        for path, _, _ in self._entries():
+            self._remove(path)
+
+        self._hits = 0
+        self._misses = 0
+        self._bytes_read = 0
+        self._bytes_written = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, key + SUFFIX)
+
+    def _entries(self) -> list[tuple[str, float, int]]:
+        """Return the path, the access time and the size of all entries.
+
+        """
+
+        entries = []
+
+        try:
+            with os.scandir(self._directory) as it:
+                for entry in it:
+                    if not entry.name.endswith(SUFFIX):
+                        continue
+
+                    try:
+                        stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    entries.append((entry.path, stat.st_mtime, stat.st_size))
+        except FileNotFoundError:
+            pass
+
+        return entries
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        size = sum(size for _, _, size in entries)
+
+        if size <= self._maxsize:
+            return
+
+        entries.sort(key=lambda entry: entry[1])
+
+        for path, _, entry_size in entries:
+            if size <= self._maxsize:
+                break
+
+            self._remove(path)
+            size -= entry_size
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def __repr__(self) -> str:
+        return (f"ContentCache('{self._directory}', "
+                f'maxsize={self._maxsize}, '
+                f'hits={self._hits}, '
+                f'misses={self._misses})')
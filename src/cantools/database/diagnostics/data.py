@@ -1,5 +1,6 @@
 # DID data.
 
+from cantools.database.compiled import invalidate_compiled_codecs
 from cantools.database.conversion import BaseConversion, IdentityConversion
 from cantools.database.namedsignalvalue import NamedSignalValue
 from cantools.typechecking import ByteOrder, Choices, SignalValueType
@@ -94,6 +95,7 @@ class Data:
             choices=self.conversion.choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def offset(self) -> int | float:
@@ -108,6 +110,7 @@ class Data:
             choices=self.conversion.choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def choices(self) -> Choices | None:
@@ -123,6 +126,7 @@ class Data:
             choices=choices,
             is_float=self.conversion.is_float,
         )
+        invalidate_compiled_codecs()
 
     @property
     def is_float(self) -> bool:
@@ -137,6 +141,7 @@ class Data:
             choices=self.conversion.choices,
             is_float=is_float,
         )
+        invalidate_compiled_codecs()
 
     def __repr__(self) -> str:
         if self.choices is None:
@@ -4,8 +4,6 @@ from typing import TextIO
 from cantools.database.diagnostics.did import Did
 from cantools.typechecking import StringPathLike
 
-from .formats import cdd
-
 LOGGER = logging.getLogger(__name__)
 
 
@@ -58,6 +56,8 @@ class Database:
 
         """
 
+        from .formats import cdd  # noqa: PLC0415
+
         database = cdd.load_string(string)
         self._dids = database.dids
         self.refresh()
@@ -0,0 +1,136 @@
+# A process-wide registry of loaded databases.
+
+import inspect
+import os
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+from ..typechecking import StringPathLike
+
+if TYPE_CHECKING:
+    from . import can, diagnostics
+
+
+class Registry:
+    """A registry of databases loaded by :meth:`.load_file()`, which
+    returns the same database object for the same file and arguments
+    as long as the file is unchanged.
+
+    Databases are only weakly referenced, so they are removed from the
+    registry when no longer used elsewhere. A database is loaded again
+    if the modification time or the size of its file have changed, or
+    after :meth:`.invalidate()`.
+
+    Returned databases are shared by all callers and must not be
+    modified.
+
+    >>> registry = Registry()
+    >>> db = registry.load_file('foo.dbc')
+    >>> registry.load_file('foo.dbc') is db
+    True
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._databases: weakref.WeakValueDictionary[
+            tuple[Any, ...],
+            can.Database | diagnostics.Database] = weakref.WeakValueDictionary()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def hits(self) -> int:
+        """The number of loads that returned a registered database.
+
+        """
+
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of loads that loaded the file.
+
+        """
+
+        return self._misses
+
+    def load_file(self,
+                  filename: StringPathLike,
+                  *args: Any,
+                  **kwargs: Any) -> 'can.Database | diagnostics.Database':
+        """Return the registered database of given file `filename` loaded
+        with given arguments, or load it with
+        :func:`~cantools.database.load_file()` and register it.
+
+        Arguments are compared after applying defaults, so passing a
+        default value is the same as omitting it. Functions, for example
+        `sort_signals`, are compared by identity.
+
+        """
+
+        from . import load_file  # noqa: PLC0415
+
+        arguments = inspect.signature(load_file).bind(filename, *args, **kwargs)
+        arguments.apply_defaults()
+        path = os.path.realpath(filename)
+        options = dict(arguments.arguments)
+        del options['filename']
+        stat = os.stat(path)
+        key = (path, tuple(options.items()), stat.st_mtime_ns, stat.st_size)
+
+        try:
+            hash(key)
+        except TypeError:
+            return load_file(filename, *args, **kwargs)
+
+        with self._lock:
+            db = self._databases.get(key)
+
+            if db is not None:
+                self._hits += 1
+
+                return db
+
+        db = load_file(filename, *args, **kwargs)
+
+        with self._lock:
+            self._misses += 1
+
+            # Remove the database of the file before it was changed.
+            for other_key in list(self._databases.keys()):
+                if other_key[:2] == key[:2]:
+                    self._databases.pop(other_key, None)
+
+            self._databases[key] = db
+
+        return db
+
+    def invalidate(self, filename: StringPathLike | None = None) -> None:
+        """Remove the databases of given file `filename`, or all databases
+        if ``None``, so that they are loaded again by the next call
+        to :meth:`.load_file()`.
+
+        """
+
+        with self._lock:
+            if filename is None:
+                self._databases.clear()
+            else:
+                path = os.path.realpath(filename)
+
+                for key in list(self._databases.keys()):
+                    if key[0] == path:
+                        self._databases.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._databases)
+
+    def __repr__(self) -> str:
+        return (f'Registry(databases={len(self)}, '
+                f'hits={self._hits}, '
+                f'misses={self._misses})')
+
+
+REGISTRY = Registry()
@@ -410,19 +410,25 @@ def prune_signal_choices(signal: "Signal") -> None:
             choice.name = choice.name[n:]
 
 
+def prune_message_choices(message: "Message") -> None:
+    '''
+    Prune names of all named signal values of all signals of a message
+    '''
+    for signal in message.signals:
+        prune_signal_choices(signal)
+
+    if message.is_container:
+        for cm in message.contained_messages:
+            for cs in cm.signals:
+                prune_signal_choices(cs)
+
+
 def prune_database_choices(database: "Database") -> None:
     '''
     Prune names of all named signal values of all signals of a database
     '''
     for message in database.messages:
-
-        for signal in message.signals:
-            prune_signal_choices(signal)
-
-        if message.is_container:
-            for cm in message.contained_messages:
-                for cs in cm.signals:
-                    prune_signal_choices(cs)
+        prune_message_choices(message)
 
 
 SORT_SIGNALS_DEFAULT: Final = 'default'
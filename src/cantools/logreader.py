@@ -1,11 +1,24 @@
 import abc
+import array
 import binascii
+import bisect
 import datetime
 import enum
 import io
+import math
+import mmap
+import os
 import re
-from collections.abc import Iterator
-from typing import Literal, overload
+import struct
+import sys
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, Literal, NamedTuple, overload
+
+from .typechecking import StringPathLike
+
+if TYPE_CHECKING:
+    import numpy as np
+    from typing_extensions import Self
 
 TimestampType = datetime.datetime | datetime.timedelta | None
 TimezoneType = datetime.tzinfo | Literal['local'] | None
@@ -64,14 +77,31 @@ class BasePattern:
 
         return None
 
-    @abc.abstractmethod
     def unpack(self, match_object: re.Match[str]) -> DataFrame | None:
+        columns = self.unpack_columns(match_object)
+        if columns is None:
+            return None
+
+        channel, frame_id, is_extended_frame, data, is_remote_frame = columns
+        timestamp, timestamp_format = self.parse_timestamp(match_object)
+
+        return DataFrame(channel=channel, frame_id=frame_id, is_extended_frame=is_extended_frame, data=data, is_remote_frame=is_remote_frame, timestamp=timestamp, timestamp_format=timestamp_format)
+
+    @abc.abstractmethod
+    def unpack_columns(self, match_object: re.Match[str]) -> tuple[str, int, bool, bytes, bool] | None:
+        """Returns the channel, frame id, extended frame flag, data and
+        remote frame flag of a log entry, or None if the entry shall
+        be skipped. The timestamp is parsed separately."""
+        raise NotImplementedError()
+
+    @abc.abstractmethod
+    def parse_timestamp(self, match_object: re.Match[str]) -> tuple[TimestampType, TimestampFormat]:
         raise NotImplementedError()
 
 
 class CandumpBasePattern(BasePattern):
 
-    def unpack(self, match_object: re.Match[str]) -> DataFrame | None:
+    def unpack_columns(self, match_object: re.Match[str]) -> tuple[str, int, bool, bytes, bool] | None:
         if match_object.groupdict().get('error_frame'):
             # Error frames carry no payload. Skip them, mirroring how
             # PCANTracePatternV11 skips 'Error' rows.
@@ -88,13 +118,9 @@ class CandumpBasePattern(BasePattern):
             is_remote_frame = False
             data = data.replace(' ', '')
             data = binascii.unhexlify(data)
-        timestamp, timestamp_format = self.parse_timestamp(match_object)
 
-        return DataFrame(channel=channel, frame_id=frame_id, is_extended_frame=is_extended_frame, data=data, is_remote_frame=is_remote_frame, timestamp=timestamp, timestamp_format=timestamp_format)
+        return channel, frame_id, is_extended_frame, data, is_remote_frame
 
-    @abc.abstractmethod
-    def parse_timestamp(self, match_object: re.Match[str]) -> tuple[TimestampType, TimestampFormat]:
-        raise NotImplementedError()
 
 
 class CandumpDefaultPattern(CandumpBasePattern):
@@ -198,17 +224,20 @@ class PCANTracePatternV10(BasePattern):
     pattern = re.compile(
         r'^\s*?\d+\)\s*?(?P<timestamp>\d+)\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>RTR|[0-9A-F ]*)$')
 
-    def unpack(self, match_object: re.Match[str]) -> DataFrame | None:
+    def unpack_columns(self, match_object: re.Match[str]) -> tuple[str, int, bool, bytes, bool] | None:
         channel = self.parse_channel(match_object)
         frame_id = int(match_object.group('can_id'), 16)
         is_extended_frame = len(match_object.group('can_id')) > 4
         data, is_remote_frame = self.parse_data(match_object)
+
+        return channel, frame_id, is_extended_frame, data, is_remote_frame
+
+    def parse_timestamp(self, match_object: re.Match[str]) -> tuple[TimestampType, TimestampFormat]:
         millis = float(match_object.group('timestamp'))
         # timestamp = datetime.datetime.strptime(match_object.group('timestamp'), "%Y-%m-%d %H:%M:%S.%f")
         timestamp = datetime.timedelta(milliseconds=millis)
         timestamp_format = TimestampFormat.RELATIVE
-
-        return DataFrame(channel=channel, frame_id=frame_id, is_extended_frame=is_extended_frame, data=data, is_remote_frame=is_remote_frame, timestamp=timestamp, timestamp_format=timestamp_format)
+        return timestamp, timestamp_format
 
     def parse_channel(self, match_object: re.Match[str]) -> str:
         return 'pcanx'
@@ -236,11 +265,11 @@ class PCANTracePatternV11(PCANTracePatternV10):
     pattern = re.compile(
         r'^\s*?\d+\)\s*?(?P<timestamp>\d+.\d+)\s+(?P<type>\w+)\s+(?P<can_id>[0-9A-F]+)\s+(?P<dlc>[0-9])\s+(?P<can_data>RTR|[0-9A-F ]*)$')
 
-    def unpack(self, match_object: re.Match[str]) -> DataFrame | None:
+    def unpack_columns(self, match_object: re.Match[str]) -> tuple[str, int, bool, bytes, bool] | None:
         if match_object.group('type') in ('Error', 'Warng'):  # yes, they really spell Warning without the 'in'
             return None
 
-        return super().unpack(match_object)
+        return super().unpack_columns(match_object)
 
 class PCANTracePatternV12(PCANTracePatternV11):
     """
@@ -333,8 +362,12 @@ class Parser:
         self.pattern: BasePattern | None = None
         self.tz = tz
 
+    def patterns(self) -> list[BasePattern]:
+        """Returns all supported patterns in the order they are tried."""
+        return [CandumpDefaultPattern(), CandumpTimestampedPattern(self.tz), CandumpDefaultLogPattern(self.tz), CandumpAbsoluteLogPattern(), PCANTracePatternV21(), PCANTracePatternV20(), PCANTracePatternV13(), PCANTracePatternV12(), PCANTracePatternV11(), PCANTracePatternV10()]
+
     def detect_pattern(self, line: str) -> BasePattern | None:
-        for p in [CandumpDefaultPattern(), CandumpTimestampedPattern(self.tz), CandumpDefaultLogPattern(self.tz), CandumpAbsoluteLogPattern(), PCANTracePatternV21(), PCANTracePatternV20(), PCANTracePatternV13(), PCANTracePatternV12(), PCANTracePatternV11(), PCANTracePatternV10()]:
+        for p in self.patterns():
             mo = p.pattern.match(line)
             if mo:
                 return p
@@ -382,3 +415,546 @@ class Parser:
         discarded."""
         for _, frame in self.iterlines():
             yield frame
+
+
+class LogColumns(NamedTuple):
+    """All frames of a log file as columns, one row per frame. See
+    :func:`read_columns()`."""
+
+    #: The timestamps, as ``datetime64[us]`` if absolute, as seconds
+    #: in ``float64`` if relative, or NaN if missing.
+    timestamps: 'np.ndarray'
+    timestamp_format: TimestampFormat
+    channels: 'np.ndarray'
+    frame_ids: 'np.ndarray'
+    is_extended_frame: 'np.ndarray'
+    is_remote_frame: 'np.ndarray'
+    #: The number of data bytes of each frame.
+    dlc: 'np.ndarray'
+    #: The data as ``uint8`` rows, padded with zeros to the longest
+    #: frame in the log.
+    data: 'np.ndarray'
+
+
+# 1991-01-01 00:00:00, see CandumpTimestampedPattern.
+_ABSOLUTE_TIMESTAMP_LIMIT = 662688000
+
+
+def _parse_timestamps(pattern: BasePattern, timestamps: list[str]) -> 'np.ndarray':
+    """Returns the timestamps of given pattern as datetime64 values for
+    candump -tA logs and as seconds otherwise."""
+    import numpy as np  # noqa: PLC0415
+
+    if isinstance(pattern, CandumpAbsoluteLogPattern):
+        return np.array(timestamps, dtype='datetime64[us]')
+
+    seconds = np.array(timestamps, dtype=np.float64)
+
+    if isinstance(pattern, PCANTracePatternV10):
+        seconds /= 1000
+
+    return seconds
+
+
+def read_columns(source: StringPathLike | io.TextIOBase,
+                 chunk_size: int = 1 << 24) -> LogColumns:
+    """Reads all frames of a candump or PCAN trace log file into columns,
+    which can for example be decoded with
+    :meth:`Database.decode_many()<cantools.database.can.Database.decode_many>`.
+    Requires the optional ``numpy`` package.
+
+    `source` is the path of the log file or a text stream. The log is
+    read in chunks of `chunk_size` characters and every chunk is
+    converted to arrays right away, so no objects are kept per frame.
+
+    Absolute timestamps are UTC, except for `candump -tA` logs whose
+    timestamps are in the timezone where the log has been recorded.
+    Whether `candump -tz` timestamps are relative or absolute is
+    determined by the first frame of the log.
+
+    >>> columns = cantools.logreader.read_columns('candump.log') #doctest: +SKIP
+    >>> db.decode_many(columns.frame_ids, columns.data) #doctest: +SKIP
+    """
+    from .database.batch import require_numpy  # noqa: PLC0415
+
+    require_numpy()
+
+    import numpy as np  # noqa: PLC0415
+
+    if isinstance(source, io.TextIOBase):
+        stream = source
+    else:
+        stream = open(source, encoding='utf-8', errors='replace')  # noqa: SIM115
+
+    parser = Parser(tz=None)
+    pattern: BasePattern | None = None
+    chunk_pattern: re.Pattern[str] | None = None
+    chunks: list[tuple[np.ndarray, ...]] = []
+    remainder = ''
+
+    try:
+        while True:
+            block = stream.read(chunk_size)
+
+            if block:
+                # Only parse complete lines, the rest is parsed with the
+                # next chunk.
+                text = remainder + block
+                end = text.rfind('\n') + 1
+                remainder = text[end:]
+                text = text[:end]
+            else:
+                text = remainder
+
+            text = text.replace('\r\n', '\n')
+            position = 0
+
+            if pattern is None:
+                for line in text.splitlines(keepends=True):
+                    pattern = parser.detect_pattern(line.rstrip('\n'))
+
+                    if pattern is not None:
+                        # \s must not match line breaks when matching all
+                        # lines of a chunk at once.
+                        chunk_pattern = re.compile(
+                            pattern.pattern.pattern.replace(r'\s', r'[^\S\n]'),
+                            re.MULTILINE)
+                        break
+
+                    position += len(line)
+
+            channels: list[str] = []
+            frame_ids: list[int] = []
+            is_extended_frame: list[bool] = []
+            is_remote_frame: list[bool] = []
+            data: list[bytes] = []
+            timestamps: list[str] = []
+
+            if pattern is not None and chunk_pattern is not None:
+                has_timestamp = 'timestamp' in chunk_pattern.groupindex
+
+                for mo in chunk_pattern.finditer(text, position):
+                    columns = pattern.unpack_columns(mo)
+
+                    if columns is None:
+                        continue
+
+                    channels.append(columns[0])
+                    frame_ids.append(columns[1])
+                    is_extended_frame.append(columns[2])
+                    data.append(columns[3])
+                    is_remote_frame.append(columns[4])
+
+                    if has_timestamp:
+                        timestamps.append(mo.group('timestamp'))
+
+            if pattern is not None and data:
+                width = max(len(payload) for payload in data)
+                chunks.append((
+                    _parse_timestamps(pattern, timestamps),
+                    np.array(channels, dtype=str),
+                    np.array(frame_ids, dtype=np.uint32),
+                    np.array(is_extended_frame, dtype=bool),
+                    np.array(is_remote_frame, dtype=bool),
+                    np.array([len(payload) for payload in data], dtype=np.uint8),
+                    np.frombuffer(b''.join([payload.ljust(width, b'\x00')
+                                            for payload in data]),
+                                  dtype=np.uint8).reshape(len(data), width)
+                ))
+
+            if not block:
+                break
+    finally:
+        if stream is not source:
+            stream.close()
+
+    if not chunks:
+        return LogColumns(timestamps=np.zeros(0),
+                          timestamp_format=TimestampFormat.MISSING,
+                          channels=np.zeros(0, dtype=str),
+                          frame_ids=np.zeros(0, dtype=np.uint32),
+                          is_extended_frame=np.zeros(0, dtype=bool),
+                          is_remote_frame=np.zeros(0, dtype=bool),
+                          dlc=np.zeros(0, dtype=np.uint8),
+                          data=np.zeros((0, 0), dtype=np.uint8))
+
+    assert pattern is not None
+    (chunk_timestamps,
+     chunk_channels,
+     chunk_frame_ids,
+     chunk_is_extended_frame,
+     chunk_is_remote_frame,
+     chunk_dlc,
+     chunk_data) = zip(*chunks, strict=True)
+
+    # Pad the data of all chunks to the longest frame.
+    width = max(chunk_payloads.shape[1] for chunk_payloads in chunk_data)
+    payloads = np.zeros((sum(len(chunk_payloads) for chunk_payloads in chunk_data), width),
+                        dtype=np.uint8)
+    row = 0
+
+    for chunk_payloads in chunk_data:
+        payloads[row:row + len(chunk_payloads), :chunk_payloads.shape[1]] = chunk_payloads
+        row += len(chunk_payloads)
+
+    if 'timestamp' not in pattern.pattern.groupindex:
+        all_timestamps = np.full(len(payloads), np.nan)
+        timestamp_format = TimestampFormat.MISSING
+    else:
+        all_timestamps = np.concatenate(chunk_timestamps)
+
+        if isinstance(pattern, CandumpAbsoluteLogPattern):
+            timestamp_format = TimestampFormat.ABSOLUTE
+        elif (isinstance(pattern, PCANTracePatternV10)
+              or (isinstance(pattern, CandumpTimestampedPattern)
+                  and all_timestamps[0] < _ABSOLUTE_TIMESTAMP_LIMIT)):
+            timestamp_format = TimestampFormat.RELATIVE
+        else:
+            all_timestamps = np.round(all_timestamps * 1e6).astype(np.int64).astype('datetime64[us]')
+            timestamp_format = TimestampFormat.ABSOLUTE
+
+    return LogColumns(timestamps=all_timestamps,
+                      timestamp_format=timestamp_format,
+                      channels=np.concatenate(chunk_channels),
+                      frame_ids=np.concatenate(chunk_frame_ids),
+                      is_extended_frame=np.concatenate(chunk_is_extended_frame),
+                      is_remote_frame=np.concatenate(chunk_is_remote_frame),
+                      dlc=np.concatenate(chunk_dlc),
+                      data=payloads)
+
+
+# The index file starts with a header, followed by the timestamp
+# checkpoints and the line offsets of all frames of each frame id. All
+# values are little endian.
+INDEX_MAGIC = b'CANIDX01'
+_INDEX_HEADER = struct.Struct('<8sQqI32sQQ')
+_INDEX_FRAME_ID = struct.Struct('<IQ')
+
+
+def _timestamp_to_seconds(timestamp: TimestampType | float) -> float:
+    if isinstance(timestamp, datetime.datetime):
+        return timestamp.timestamp()
+    elif isinstance(timestamp, datetime.timedelta):
+        return timestamp.total_seconds()
+    elif timestamp is None:
+        return math.nan
+
+    return float(timestamp)
+
+
+def _read_array(typecode: str, data: bytes | mmap.mmap, offset: int, count: int) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(data[offset:offset + count * values.itemsize])
+    if sys.byteorder == 'big':
+        values.byteswap()
+    return values
+
+
+def _write_array(fout: io.BufferedWriter, values: array.array) -> None:
+    if sys.byteorder == 'big':
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    fout.write(values.tobytes())
+
+
+class LogIndex:
+    """An index of a log file with the byte offsets of the lines of each
+    frame id and timestamp checkpoints, which is stored in a sidecar
+    file next to the log. See :class:`IndexedLogReader`.
+
+    The timestamp checkpoints assume that the timestamps in the log
+    are not decreasing, which is the case for logs written by candump
+    and PCAN.
+    """
+
+    def __init__(self,
+                 log_size: int,
+                 log_mtime_ns: int,
+                 pattern_name: str,
+                 checkpoint_timestamps: array.array,
+                 checkpoint_offsets: array.array,
+                 frame_offsets: dict[int, array.array]) -> None:
+        self.log_size = log_size
+        self.log_mtime_ns = log_mtime_ns
+        #: The class name of the pattern matching the lines of the log.
+        self.pattern_name = pattern_name
+        #: The timestamps in seconds of every checkpoint.
+        self.checkpoint_timestamps = checkpoint_timestamps
+        #: The byte offset of the line of every checkpoint.
+        self.checkpoint_offsets = checkpoint_offsets
+        #: The byte offsets of the lines of each frame id.
+        self.frame_offsets = frame_offsets
+
+    @classmethod
+    def build(cls,
+              log_path: StringPathLike,
+              checkpoint_interval: int = 1024,
+              tz: TimezoneType = TZ_LOCAL) -> 'LogIndex':
+        """Scans given log file once and returns its index. A timestamp
+        checkpoint is added every `checkpoint_interval` frames.
+        """
+        stat = os.stat(log_path)
+        parser = Parser(tz=tz)
+        pattern: BasePattern | None = None
+        checkpoint_timestamps = array.array('d')
+        checkpoint_offsets = array.array('Q')
+        frame_offsets: dict[int, array.array] = {}
+        number_of_frames = 0
+
+        with open(log_path, 'rb') as fin:
+            offset = 0
+
+            for raw_line in fin:
+                line = raw_line.decode('utf-8', 'replace').rstrip('\r\n')
+                line_offset = offset
+                offset += len(raw_line)
+
+                if pattern is None:
+                    pattern = parser.detect_pattern(line)
+
+                    if pattern is None:
+                        continue
+
+                mo = pattern.pattern.match(line)
+
+                if mo is None:
+                    continue
+
+                columns = pattern.unpack_columns(mo)
+
+                if columns is None:
+                    continue
+
+                if number_of_frames % checkpoint_interval == 0:
+                    timestamp, _ = pattern.parse_timestamp(mo)
+                    checkpoint_timestamps.append(_timestamp_to_seconds(timestamp))
+                    checkpoint_offsets.append(line_offset)
+
+                frame_id = columns[1]
+
+                if frame_id not in frame_offsets:
+                    frame_offsets[frame_id] = array.array('Q')
+
+                frame_offsets[frame_id].append(line_offset)
+                number_of_frames += 1
+
+        return cls(stat.st_size,
+                   stat.st_mtime_ns,
+                   '' if pattern is None else type(pattern).__name__,
+                   checkpoint_timestamps,
+                   checkpoint_offsets,
+                   frame_offsets)
+
+    @classmethod
+    def load(cls, index_path: StringPathLike) -> 'LogIndex':
+        """Loads an index from given sidecar file."""
+        with open(index_path, 'rb') as fin:
+            data = fin.read()
+
+        if len(data) < _INDEX_HEADER.size:
+            raise ValueError(f'{index_path} is not a log index file')
+
+        (magic,
+         log_size,
+         log_mtime_ns,
+         _,
+         pattern_name,
+         number_of_checkpoints,
+         number_of_frame_ids) = _INDEX_HEADER.unpack_from(data)
+
+        if magic != INDEX_MAGIC:
+            raise ValueError(f'{index_path} is not a log index file')
+
+        offset = _INDEX_HEADER.size
+        checkpoint_timestamps = _read_array('d', data, offset, number_of_checkpoints)
+        offset += 8 * number_of_checkpoints
+        checkpoint_offsets = _read_array('Q', data, offset, number_of_checkpoints)
+        offset += 8 * number_of_checkpoints
+        frame_offsets: dict[int, array.array] = {}
+
+        for _ in range(number_of_frame_ids):
+            frame_id, count = _INDEX_FRAME_ID.unpack_from(data, offset)
+            offset += _INDEX_FRAME_ID.size
+            frame_offsets[frame_id] = _read_array('Q', data, offset, count)
+            offset += 8 * count
+
+        return cls(log_size,
+                   log_mtime_ns,
+                   pattern_name.rstrip(b'\x00').decode('ascii'),
+                   checkpoint_timestamps,
+                   checkpoint_offsets,
+                   frame_offsets)
+
+    def save(self, index_path: StringPathLike) -> None:
+        """Saves the index to given sidecar file."""
+        with open(index_path, 'wb') as fout:
+            fout.write(_INDEX_HEADER.pack(INDEX_MAGIC,
+                                          self.log_size,
+                                          self.log_mtime_ns,
+                                          0,
+                                          self.pattern_name.encode('ascii'),
+                                          len(self.checkpoint_offsets),
+                                          len(self.frame_offsets)))
+            _write_array(fout, self.checkpoint_timestamps)
+            _write_array(fout, self.checkpoint_offsets)
+
+            for frame_id, offsets in sorted(self.frame_offsets.items()):
+                fout.write(_INDEX_FRAME_ID.pack(frame_id, len(offsets)))
+                _write_array(fout, offsets)
+
+    def is_up_to_date(self, log_path: StringPathLike) -> bool:
+        """Returns True if given log file has not changed since the index
+        was built."""
+        stat = os.stat(log_path)
+        return (stat.st_size == self.log_size
+                and stat.st_mtime_ns == self.log_mtime_ns)
+
+    def byte_range(self, start: float | None, end: float | None) -> tuple[int, int]:
+        """Returns the byte range of the log that contains all frames with
+        timestamps between `start` and `end` seconds."""
+        begin = 0
+        stop = self.log_size
+
+        if start is not None:
+            # The last checkpoint before start.
+            i = bisect.bisect_left(self.checkpoint_timestamps, start)
+            if i > 0:
+                begin = self.checkpoint_offsets[i - 1]
+
+        if end is not None:
+            # The first checkpoint after end.
+            i = bisect.bisect_right(self.checkpoint_timestamps, end)
+            if i < len(self.checkpoint_offsets):
+                stop = self.checkpoint_offsets[i]
+
+        return begin, stop
+
+
+class IndexedLogReader:
+    """Random access to the frames of a large log file, using a
+    :class:`LogIndex` stored in a sidecar file. The log is memory mapped
+    and only the lines of the requested frames are parsed, with the
+    same patterns as :class:`Parser`.
+
+    The index is built and saved to `index_path`, by default the log
+    path with ``.idx`` appended, if it is missing or if the log has
+    changed.
+
+    >>> with IndexedLogReader('candump.log') as reader: #doctest: +SKIP
+    ...     for frame in reader.frames([0x1a0], start=3600, end=3700):
+    ...         print(frame.timestamp, frame.data.hex())
+    """
+
+    def __init__(self,
+                 log_path: StringPathLike,
+                 index_path: StringPathLike | None = None,
+                 *,
+                 checkpoint_interval: int = 1024,
+                 tz: TimezoneType = TZ_LOCAL) -> None:
+        if index_path is None:
+            index_path = os.fspath(log_path) + '.idx'
+
+        index: LogIndex | None = None
+
+        if os.path.exists(index_path):
+            try:
+                index = LogIndex.load(index_path)
+            except (OSError, ValueError, struct.error):
+                index = None
+
+            if index is not None and not index.is_up_to_date(log_path):
+                index = None
+
+        if index is None:
+            index = LogIndex.build(log_path, checkpoint_interval, tz)
+            index.save(index_path)
+
+        self.index = index
+        self.pattern: BasePattern | None = None
+
+        for pattern in Parser(tz=tz).patterns():
+            if type(pattern).__name__ == index.pattern_name:
+                self.pattern = pattern
+                break
+
+        self._file = open(log_path, 'rb')  # noqa: SIM115
+
+        if index.log_size > 0:
+            self._mmap: mmap.mmap | None = mmap.mmap(self._file.fileno(),
+                                                     0,
+                                                     access=mmap.ACCESS_READ)
+        else:
+            self._mmap = None
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'Self':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def frame_ids(self) -> list[int]:
+        """All frame ids in the log."""
+        return sorted(self.index.frame_offsets)
+
+    def _parse_line(self, offset: int) -> DataFrame | None:
+        assert self._mmap is not None and self.pattern is not None
+        end = self._mmap.find(b'\n', offset)
+        if end == -1:
+            end = len(self._mmap)
+        line = self._mmap[offset:end].decode('utf-8', 'replace').rstrip('\r')
+        return self.pattern.match(line)
+
+    def frames(self,
+               frame_ids: Iterable[int] | None = None,
+               start: TimestampType | float = None,
+               end: TimestampType | float = None) -> Iterator[DataFrame]:
+        """Yields all frames with given frame ids, or of all frame ids if
+        None, and timestamps between `start` and `end`, in log order.
+
+        `start` and `end` are seconds in the same scale as the
+        timestamps of the log, i.e. seconds since the epoch for
+        absolute timestamps, or a datetime or timedelta respectively.
+        """
+        if self._mmap is None or self.pattern is None:
+            return
+
+        start_seconds = None if start is None else _timestamp_to_seconds(start)
+        end_seconds = None if end is None else _timestamp_to_seconds(end)
+        begin, stop = self.index.byte_range(start_seconds, end_seconds)
+
+        if frame_ids is None:
+            frame_ids = self.index.frame_offsets
+
+        offsets: list[int] = []
+
+        for frame_id in frame_ids:
+            frame_offsets = self.index.frame_offsets.get(frame_id)
+
+            if frame_offsets is None:
+                continue
+
+            offsets.extend(frame_offsets[bisect.bisect_left(frame_offsets, begin):
+                                         bisect.bisect_left(frame_offsets, stop)])
+
+        for offset in sorted(offsets):
+            frame = self._parse_line(offset)
+
+            if frame is None:
+                continue
+
+            if start_seconds is not None or end_seconds is not None:
+                seconds = _timestamp_to_seconds(frame.timestamp)
+
+                if start_seconds is not None and seconds < start_seconds:
+                    continue
+
+                if end_seconds is not None and seconds > end_seconds:
+                    continue
+
+            yield frame
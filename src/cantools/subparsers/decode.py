@@ -1,5 +1,9 @@
 import argparse
+import collections
+import concurrent.futures
+import itertools
 import logging
+import os
 import sys
 
 from argparse_addons import Integer  # type: ignore
@@ -9,37 +13,139 @@ from .__utils__ import format_message_by_frame_id
 
 logging.basicConfig(level=logging.WARNING)
 
+# Number of lines decoded by a worker process at a time when running
+# with more than one job.
+CHUNK_SIZE = 4096
+
+# The database and decode options of a worker process, set once by
+# _init_worker() when the process is started.
+_worker_state: dict = {}
+
+
+def _format_line(dbase, line, frame, options):
+    if frame is not None:
+        decode_choices, single_line, decode_containers, no_strict = options
+        line += ' ::'
+        line += format_message_by_frame_id(dbase,
+                                           frame.frame_id,
+                                           frame.data,
+                                           decode_choices,
+                                           single_line,
+                                           decode_containers,
+                                           allow_truncated=no_strict,
+                                           allow_excess=no_strict)
+
+    return line
+
+
+def _init_worker(dbase, options):
+    _worker_state['database'] = dbase
+    _worker_state['options'] = options
+
+
+def _decode_chunk(pattern, lines):
+    """Decode given lines in a worker process and return the output as
+    a single string.
+
+    """
+
+    dbase = _worker_state['database']
+    options = _worker_state['options']
+    parser = logreader.Parser()
+    parser.pattern = pattern
+    output = []
+
+    for line in lines:
+        output.append(_format_line(dbase, line, parser.parse(line), options))
+
+    return '\n'.join(output) + '\n'
+
+
+def _read_chunks(stream):
+    """Yield ``(pattern, lines)`` tuples of up to ``CHUNK_SIZE`` lines,
+    where `pattern` is the log file pattern detected before the first
+    line of the chunk, if any.
+
+    """
+
+    parser = logreader.Parser()
+    lines = (line.strip('\r\n') for line in iter(stream.readline, ''))
+
+    while True:
+        chunk = list(itertools.islice(lines, CHUNK_SIZE))
+
+        if not chunk:
+            return
+
+        pattern = parser.pattern
+
+        for line in chunk:
+            if parser.pattern is not None:
+                break
+
+            parser.pattern = parser.detect_pattern(line)
+
+        yield pattern, chunk
+
+
+def _decode_parallel(stream, dbase, options, jobs):
+    """Decode chunks of lines in a process pool and print the output in
+    the same order as the lines were read.
+
+    """
+
+    with concurrent.futures.ProcessPoolExecutor(
+            jobs,
+            initializer=_init_worker,
+            initargs=(dbase, options)) as executor:
+        # Limit the number of chunks in flight to bound the memory
+        # usage for large inputs.
+        pending = collections.deque()
+
+        for pattern, lines in _read_chunks(stream):
+            if len(pending) >= 2 * jobs:
+                sys.stdout.write(pending.popleft().result())
+
+            pending.append(executor.submit(_decode_chunk, pattern, lines))
+
+        while pending:
+            sys.stdout.write(pending.popleft().result())
+
+
+def _decode_stream(stream, dbase, options, jobs):
+    if jobs > 1:
+        _decode_parallel(stream, dbase, options, jobs)
+    else:
+        parser = logreader.Parser(stream)
+
+        for line, frame in parser.iterlines(keep_unknowns=True):
+            print(_format_line(dbase, line, frame, options))
+
+
 def _do_decode(args):
     dbase = database.load_file(args.database,
                                encoding=args.encoding,
                                frame_id_mask=args.frame_id_mask,
                                prune_choices=args.prune,
                                strict=not args.no_strict)
-    decode_choices = not args.no_decode_choices
-    decode_containers = not args.no_decode_containers
-    allow_truncated = args.no_strict
-    allow_excess = args.no_strict
-    parser = logreader.Parser(sys.stdin)
-    for line, frame in parser.iterlines(keep_unknowns=True):
-        if frame is not None:
-            line += ' ::'
-            line += format_message_by_frame_id(dbase,
-                                               frame.frame_id,
-                                               frame.data,
-                                               decode_choices,
-                                               args.single_line,
-                                               decode_containers,
-                                               allow_truncated=allow_truncated,
-                                               allow_excess=allow_excess)
-
-        print(line)
+    options = (not args.no_decode_choices,
+               args.single_line,
+               not args.no_decode_containers,
+               args.no_strict)
+    jobs = args.jobs or os.cpu_count() or 1
+
+    if args.input is None:
+        _decode_stream(sys.stdin, dbase, options, jobs)
+    else:
+        with open(args.input) as fin:
+            _decode_stream(fin, dbase, options, jobs)
 
 
 def add_subparser(subparsers):
     decode_parser = subparsers.add_parser(
         'decode',
         description=('Decode "candump" CAN frames read from standard input '
-                     'and print them in a human readable format.'),
+                     'or a file and print them in a human readable format.'),
         formatter_class=argparse.ArgumentDefaultsHelpFormatter)
     decode_parser.add_argument(
         '-c', '--no-decode-choices',
@@ -70,6 +176,16 @@ def add_subparser(subparsers):
         help=('Only compare selected frame id bits to find the message in the '
               'database. By default the candump and database frame ids must '
               'be equal for a match.'))
+    decode_parser.add_argument(
+        '-i', '--input',
+        help='Log file to decode instead of standard input.')
+    decode_parser.add_argument(
+        '-j', '--jobs',
+        type=Integer(0),
+        default=1,
+        help=('Number of processes decoding frames in parallel, or 0 to '
+              'use one process per CPU. The output is printed in input '
+              'order.'))
     decode_parser.add_argument(
         'database',
         help='Database file.')
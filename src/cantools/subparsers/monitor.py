@@ -1,24 +1,33 @@
 import argparse
 import bisect
 import curses
+import datetime
+import math
 import queue
 import re
+import threading
 import time
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import can.cli
 from argparse_addons import Integer  # type: ignore
 
 from cantools.database.errors import DecodeError
 
-from .. import database
+from .. import database, logreader
 from ..typechecking import SignalDictType
 from .__utils__ import (
     format_multiplexed_name,
     format_signals,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Characters of increasing height to draw histograms.
+HISTOGRAM_CHARACTERS = ' .:-=+*#'
+
 
 class QuitError(Exception):
     pass
@@ -28,8 +37,320 @@ class MessageFormattingResult(Enum):
     UnknownMessage = 1
     DecodeError = 2
 
+def frame_duration(raw_message: can.Message,
+                   bitrate: int,
+                   data_bitrate: int | None) -> float:
+    """Return the time in seconds given frame occupies the bus, without
+    stuff bits. The data phase of CAN FD frames with bit rate switch
+    is transmitted with `data_bitrate`, if given.
+
+    """
+
+    size = len(raw_message.data)
+
+    if not raw_message.is_fd:
+        return ((67 if raw_message.is_extended_id else 47) + 8 * size) / bitrate
+
+    # The arbitration phase, including the ACK, EOF and IFS bits.
+    arbitration_bits = 49 if raw_message.is_extended_id else 30
+    # The data phase, including DLC, stuff count and CRC.
+    data_bits = 8 * size + (26 if size <= 16 else 30)
+
+    if raw_message.bitrate_switch and data_bitrate:
+        return arbitration_bits / bitrate + data_bits / data_bitrate
+
+    return (arbitration_bits + data_bits) / bitrate
+
+
+class MessageStatistics:
+    """Running timing statistics of the frames with one frame id, updated
+    in constant time per frame.
+
+    """
+
+    __slots__ = (
+        'count',
+        'cycle_time',
+        'histogram',
+        'last_timestamp',
+        'max_jitter',
+        'min_jitter',
+        'missing',
+        'period',
+    )
+
+    # Weight of the latest period in the exponentially weighted moving
+    # average.
+    PERIOD_WEIGHT = 0.1
+
+    # The jitter histogram has HISTOGRAM_BINS bins of equal width from
+    # -50 % to +50 % of the cycle time. Jitter outside of this range is
+    # counted in the first or last bin.
+    HISTOGRAM_BINS = 10
+
+    def __init__(self, cycle_time: float | None) -> None:
+        self.count = 0
+        # The cycle time of the message in seconds, if known.
+        self.cycle_time = cycle_time
+        self.last_timestamp: float | None = None
+        self.period: float | None = None
+        self.min_jitter: float | None = None
+        self.max_jitter: float | None = None
+        self.missing = 0
+        self.histogram = [0] * self.HISTOGRAM_BINS
+
+    def update(self, timestamp: float) -> None:
+        self.count += 1
+
+        if self.last_timestamp is not None:
+            period = timestamp - self.last_timestamp
+
+            if self.period is None:
+                self.period = period
+            else:
+                self.period += self.PERIOD_WEIGHT * (period - self.period)
+
+            if self.cycle_time:
+                self.update_jitter(period)
+
+        self.last_timestamp = timestamp
+
+    def update_jitter(self, period: float) -> None:
+        assert self.cycle_time is not None
+
+        # Frames are missing if the period is closer to a multiple of
+        # the cycle time.
+        missing = round(period / self.cycle_time) - 1
+
+        if missing > 0:
+            self.missing += missing
+            return
+
+        jitter = period - self.cycle_time
+
+        if self.min_jitter is None or jitter < self.min_jitter:
+            self.min_jitter = jitter
+
+        if self.max_jitter is None or jitter > self.max_jitter:
+            self.max_jitter = jitter
+
+        index = int((jitter / self.cycle_time + 0.5) * self.HISTOGRAM_BINS)
+        self.histogram[min(max(index, 0), self.HISTOGRAM_BINS - 1)] += 1
+
+
+class BusStatistics:
+    """The load of the bus, computed once per INTERVAL seconds of received
+    frames from the time they occupied the bus.
+
+    """
+
+    INTERVAL = 1.0
+
+    def __init__(self, bitrate: int | None, data_bitrate: int | None) -> None:
+        self.bitrate = bitrate
+        self.data_bitrate = data_bitrate
+        self.load: float | None = None
+        self._interval_start: float | None = None
+        self._busy = 0.0
+
+    def update(self, raw_message: can.Message) -> None:
+        if not self.bitrate:
+            return
+
+        if self._interval_start is None:
+            self._interval_start = raw_message.timestamp
+
+        self._busy += frame_duration(raw_message, self.bitrate, self.data_bitrate)
+        elapsed = raw_message.timestamp - self._interval_start
+
+        if elapsed >= self.INTERVAL:
+            self.load = min(self._busy / elapsed, 1.0)
+            self._interval_start = raw_message.timestamp
+            self._busy = 0.0
+
+
+class ReplayBus(can.BusABC):
+    """A bus receiving the frames of a candump or PCAN log file, read
+    with :class:`~cantools.logreader.Parser`.
+
+    Frames are received when their timestamps are reached on the replay
+    clock, which runs `speed` times faster than real time, or as fast
+    as possible if `speed` is 0. The replay can be paused and moved
+    with :meth:`seek()`. Frames without timestamps are received as fast
+    as possible.
+
+    """
+
+    def __init__(self,
+                 channel: str,
+                 speed: float = 1.0,
+                 can_filters: Any = None,
+                 **kwargs: Any) -> None:
+        if speed < 0:
+            raise ValueError(f'invalid replay speed {speed}')
+
+        self.channel_info = f'replay of {channel}'
+        self.speed = speed
+        self.paused = False
+        # The timestamp of the first frame in the log.
+        self.start: float | None = None
+        self._condition = threading.Condition()
+        # The replay clock was at _position at monotonic time _anchor.
+        self._position: float | None = None
+        self._anchor = 0.0
+        # The next frame to receive and the timestamp of the last frame
+        # read from the log.
+        self._next: tuple[float, can.Message] | None = None
+        self._last = math.nan
+        self._file = open(channel, encoding='utf-8', errors='replace')  # noqa: SIM115
+        self._rewind()
+        super().__init__(channel, can_filters, **kwargs)
+
+    @property
+    def position(self) -> float | None:
+        """The timestamp on the replay clock, or ``None`` if the log has no
+        timestamps."""
+
+        if self._position is None or self.paused or self.speed == 0:
+            return self._position
+
+        return self._position + (time.monotonic() - self._anchor) * self.speed
+
+    @property
+    def finished(self) -> bool:
+        """True if all frames in the log have been received."""
+
+        return self._next is None
+
+    def _set_position(self, position: float) -> None:
+        self._position = position
+        self._anchor = time.monotonic()
+
+    def _rewind(self) -> None:
+        self._file.seek(0)
+        self._frames: Iterator[logreader.DataFrame] = iter(logreader.Parser(self._file))
+        self._next = self._read_frame()
+
+        if (self._next is not None
+                and self.start is None
+                and not math.isnan(self._next[0])):
+            self.start = self._next[0]
+            self._set_position(self.start)
+
+    def _read_frame(self) -> tuple[float, can.Message] | None:
+        frame = next(self._frames, None)
+
+        if frame is None:
+            return None
+
+        if isinstance(frame.timestamp, datetime.datetime):
+            timestamp = frame.timestamp.timestamp()
+        elif isinstance(frame.timestamp, datetime.timedelta):
+            timestamp = frame.timestamp.total_seconds()
+        else:
+            timestamp = math.nan
+
+        self._last = timestamp
+        message = can.Message(timestamp=timestamp,
+                              arbitration_id=frame.frame_id,
+                              is_extended_id=frame.is_extended_frame,
+                              is_remote_frame=frame.is_remote_frame,
+                              is_fd=len(frame.data) > 8,
+                              data=frame.data,
+                              channel=frame.channel)
+
+        return timestamp, message
+
+    def _recv_internal(self, timeout: float | None) -> tuple[can.Message | None, bool]:
+        if timeout is not None:
+            deadline = time.monotonic() + timeout
+
+        with self._condition:
+            while True:
+                delay = None
+
+                if not self.paused and self._next is not None:
+                    timestamp, message = self._next
+
+                    if math.isnan(timestamp):
+                        message.timestamp = time.time()
+                        delay = 0.0
+                    elif self.speed == 0:
+                        self._set_position(timestamp)
+                        delay = 0.0
+                    else:
+                        position = self.position
+                        assert position is not None
+                        delay = (timestamp - position) / self.speed
+
+                    if delay <= 0:
+                        self._next = self._read_frame()
+
+                        return message, False
+
+                if timeout is not None:
+                    remaining = deadline - time.monotonic()
+
+                    if remaining <= 0:
+                        return None, False
+
+                    if delay is None or remaining < delay:
+                        delay = remaining
+
+                self._condition.wait(delay)
+
+    def send(self, msg: can.Message, timeout: float | None = None) -> None:
+        raise can.CanOperationError('Cannot send frames to a replayed log.')
+
+    def shutdown(self) -> None:
+        super().shutdown()
+        self._file.close()
+
+    def pause(self) -> None:
+        with self._condition:
+            self._position = self.position
+            self.paused = True
+
+    def resume(self) -> None:
+        with self._condition:
+            self.paused = False
+            self._anchor = time.monotonic()
+            self._condition.notify_all()
+
+    def seek(self, offset: float) -> None:
+        """Move the replay clock by `offset` seconds, but not before the
+        first frame. Frames before the new position are skipped.
+
+        """
+
+        with self._condition:
+            position = self.position
+
+            if position is None:
+                return
+
+            assert self.start is not None
+            target = max(position + offset, self.start)
+
+            if target < position:
+                self._rewind()
+
+            while self._next is not None and self._next[0] < target:
+                self._next = self._read_frame()
+
+            if self._next is None:
+                target = min(target, self._last)
+
+            self._set_position(target)
+            self._condition.notify_all()
+
+
 class Monitor(can.Listener):
 
+    # Seconds to move the replay of a log with the left and right arrow
+    # keys.
+    SEEK_STEP = 10.0
+
     def __init__(self, stdscr: Any, args: argparse.Namespace):
         self._stdscr = stdscr
         print(f'Reading bus description file "{args.database}"...\r')
@@ -40,6 +361,10 @@ class Monitor(can.Listener):
                                          strict=not args.no_strict)
         self._single_line = args.single_line
         self._filtered_sorted_message_names: list[str] = []
+        # The lines of all displayed messages, rebuilt by get_lines() if
+        # None, and the index of the first line of each message in it.
+        self._lines: list[str] | None = None
+        self._line_offsets: dict[str, int] = {}
         self._filter = args.filter_regex or ''
         self._filter_cursor_pos = 0
         self._compiled_filter = None
@@ -51,14 +376,36 @@ class Monitor(can.Listener):
         self._playing = True
         self._modified = True
         self._show_filter = False
-        self._queue: queue.Queue = queue.Queue()
+        self._show_statistics = False
+        self._queue: queue.Queue = queue.Queue(args.queue_size)
         self._nrows, self._ncols = stdscr.getmaxyx()
         self._received = 0
         self._discarded = 0
         self._errors = 0
+        self._dropped = 0
+        # (frame id, is extended) -> (message, decoder of its
+        # multiplexers) or None if unknown
+        self._frame_messages: dict[tuple[int, bool], tuple[database.Message, Any] | None] = {}
         self._basetime: float | None = None
         self._page_first_row = 0
-        bus = can.cli.create_bus_from_namespace(args)
+        # Updated by the notifier thread for every received frame, also
+        # if dropped, coalesced or paused.
+        self._statistics: dict[tuple[int, bool], MessageStatistics] = {}
+        # The python-can bus arguments are missing if not given.
+        self._bus_statistics = BusStatistics(getattr(args, 'bitrate', None),
+                                             getattr(args, 'data_bitrate', None))
+
+        if args.replay is None:
+            self._replay: ReplayBus | None = None
+            bus = can.cli.create_bus_from_namespace(args)
+        else:
+            self._replay = ReplayBus(args.replay,
+                                     args.speed,
+                                     can_filters=getattr(args, 'can_filters', None))
+            bus = self._replay
+            # Show timestamps relative to the start of the log.
+            self._basetime = self._replay.start
+
         self._notifier = can.Notifier(bus, [self])
 
         if self._filter is not None:
@@ -97,7 +444,10 @@ class Monitor(can.Listener):
         self.draw_stats(0)
         self.draw_title(1)
 
-        lines = [line for name in self._filtered_sorted_message_names for line in self._formatted_messages[name]]
+        if self._show_statistics:
+            lines = self.get_statistics_lines()
+        else:
+            lines = self.get_lines()
 
         # Only render the visible screen. We only have (self._nrows - 3)
         # available rows to draw on, due to the persistent TUI features that
@@ -124,17 +474,92 @@ class Monitor(can.Listener):
         # Refresh the screen.
         self._stdscr.refresh()
 
+    def get_lines(self):
+        if self._lines is None:
+            self._lines = []
+            self._line_offsets = {}
+
+            for name in self._filtered_sorted_message_names:
+                self._line_offsets[name] = len(self._lines)
+                self._lines += self._formatted_messages[name]
+
+        return self._lines
+
+    def invalidate_lines(self):
+        self._lines = None
+        self._line_offsets = {}
+
+    def get_statistics_lines(self):
+        rows = []
+
+        for key, statistics in list(self._statistics.items()):
+            try:
+                name = self._dbase.get_message_by_frame_id(*key).name
+            except KeyError:
+                name = f'0x{key[0]:x}'
+
+            rows.append((name, self.format_statistics(name, statistics)))
+
+        return [line for _, line in sorted(rows)]
+
+    @staticmethod
+    def format_statistics(name, statistics):
+        def milliseconds(value):
+            return '-' if value is None else f'{1000 * value:.1f}'
+
+        if statistics.cycle_time is None or statistics.min_jitter is None:
+            jitter = '-'
+            histogram = ''
+        else:
+            jitter = f'{milliseconds(statistics.min_jitter)}/{milliseconds(statistics.max_jitter)}'
+            most = max(statistics.histogram)
+            histogram = ''.join(HISTOGRAM_CHARACTERS[(len(HISTOGRAM_CHARACTERS) - 1) * count // most]
+                                for count in statistics.histogram)
+
+        return (f'{name[:20]:<20} '
+                f'{statistics.count:>7} '
+                f'{milliseconds(statistics.period):>8} '
+                f'{milliseconds(statistics.cycle_time):>7} '
+                f'{jitter:>12} '
+                f'{statistics.missing:>7} '
+                f'{histogram}')
+
     def draw_stats(self, row):
         status_text = \
             f'Received: {self._received}, Discarded: {self._discarded}, Errors: {self._errors}'
+        if self._dropped:
+            status_text += f', Dropped: {self._dropped}'
+        if self._bus_statistics.load is not None:
+            status_text += f', Bus load: {100 * self._bus_statistics.load:.1f}%'
         if self._filter:
             status_text += f', Filter: {self._filter}'
+        if self._replay is not None:
+            status_text += f', Replay: {self.format_replay_position()}'
         self.addstr(row, 0, status_text)
 
+    def format_replay_position(self):
+        assert self._replay is not None
+
+        if self._replay.finished:
+            return 'end'
+
+        position = self._replay.position
+
+        if position is None:
+            return '-'
+
+        return f'{position - self._replay.start:.1f} s'
+
     def draw_title(self, row):
+        if self._show_statistics:
+            title = (f"{'MESSAGE':<20} {'COUNT':>7} {'PERIOD':>8} {'CYCLE':>7} "
+                     f"{'JITTER':>12} {'MISSING':>7} HISTOGRAM")
+        else:
+            title = '   TIMESTAMP  MESSAGE'
+
         self.addstr_color(row,
                           0,
-                          self.stretch('   TIMESTAMP  MESSAGE'),
+                          self.stretch(title),
                           curses.color_pair(1))
 
     def draw_menu(self, row):
@@ -176,7 +601,10 @@ class Monitor(can.Listener):
                               ' '*(self._ncols - col),
                               curses.color_pair(2))
         else:
-            text = 'q: Quit, f: Filter, p: Play/Pause, r: Reset'
+            text = 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics'
+
+            if self._replay is not None:
+                text += ', Left/Right: Seek'
 
             self.addstr_color(row,
                               0,
@@ -216,26 +644,46 @@ class Monitor(can.Listener):
             raise QuitError()
         elif key == 'p':
             self._playing = not self._playing
+
+            if self._replay is not None:
+                if self._playing:
+                    self._replay.resume()
+                else:
+                    self._replay.pause()
         elif key == 'r':
             self._playing = True
             self._filtered_sorted_message_names = []
             self._formatted_messages = {}
+            self.invalidate_lines()
             self._received = 0
             self._discarded = 0
-            self._basetime = None
+            self._dropped = 0
+            self.reset_statistics()
+            self._basetime = None if self._replay is None else self._replay.start
             self._filter = ''
             self._compiled_filter = None
             self._modified = True
             self._page = 0
 
+            if self._replay is not None:
+                self._replay.resume()
+
             while not self._queue.empty():
                 self._queue.get()
+        elif key == 's':
+            self._show_statistics = not self._show_statistics
+            self._page_first_row = 0
+            self._modified = True
         elif key in ['f', '/']:
             self._old_filter = self._filter
             self._show_filter = True
             self._filter_cursor_pos = len(self._filter)
             self._modified = True
             curses.curs_set(True)
+        elif key == 'KEY_LEFT' and self._replay is not None:
+            self.seek(-self.SEEK_STEP)
+        elif key == 'KEY_RIGHT' and self._replay is not None:
+            self.seek(self.SEEK_STEP)
         elif key == 'KEY_UP':
             self.line_up()
         elif key == 'KEY_DOWN':
@@ -245,6 +693,23 @@ class Monitor(can.Listener):
         elif key == 'KEY_NPAGE':
             self.page_down()
 
+    def reset_statistics(self):
+        self._statistics = {}
+        self._bus_statistics = BusStatistics(self._bus_statistics.bitrate,
+                                             self._bus_statistics.data_bitrate)
+
+    def seek(self, offset):
+        assert self._replay is not None
+        self._replay.seek(offset)
+
+        # Frames received before seeking are not shown, and the timing
+        # statistics start over at the new position.
+        while not self._queue.empty():
+            self._queue.get()
+
+        self.reset_statistics()
+        self._modified = True
+
     def line_down(self):
         # Increment line
         self._page_first_row += 1
@@ -336,6 +801,7 @@ class Monitor(can.Listener):
         self._filtered_sorted_message_names.clear()
         self._message_signals.clear()
         self._formatted_messages.clear()
+        self.invalidate_lines()
         for msg in self._raw_messages.values():
             self.try_update_message(msg)
 
@@ -456,6 +922,16 @@ class Monitor(can.Listener):
 
         self._formatted_messages[msg_name] = formatted
 
+        # Only replace the lines of the message if its number of lines
+        # is unchanged, otherwise all lines are rebuilt.
+        offset = self._line_offsets.get(msg_name)
+
+        if offset is not None and self._lines is not None:
+            if len(formatted) == len(old_formatted):
+                self._lines[offset:offset + len(formatted)] = formatted
+            else:
+                self.invalidate_lines()
+
         if is_error:
             self._messages_with_error.add(msg_name)
         else:
@@ -473,22 +949,86 @@ class Monitor(can.Listener):
         )
         self._update_formatted_message(msg_name, formatted, is_error=True)
 
-    def update_messages(self):
-        modified = False
+    def update_messages(self) -> bool:
+        # Only the most recently received frame of each message (and
+        # multiplexer ids) is decoded, together with its number of
+        # received frames.
+        latest: dict[Any, tuple[can.Message, int]] = {}
+        received = self._received
 
         try:
             while True:
-                result = self.try_update_message(self._queue.get_nowait())
+                raw_message = self._queue.get_nowait()
                 self._received += 1
-                if result == MessageFormattingResult.UnknownMessage:
+
+                if self._basetime is None:
+                    self._basetime = raw_message.timestamp
+
+                key = self._coalescing_key(raw_message)
+
+                if key is None:
                     self._discarded += 1
-                elif result == MessageFormattingResult.DecodeError:
-                    self._errors += 1
-                modified = True
+                    continue
+
+                _, count = latest.pop(key, (None, 0))
+                # Move to the end to decode frames in order of arrival.
+                latest[key] = (raw_message, count + 1)
         except queue.Empty:
             pass
 
-        return modified
+        for raw_message, count in latest.values():
+            result = self.try_update_message(raw_message)
+
+            if result == MessageFormattingResult.UnknownMessage:
+                self._discarded += count
+            elif result == MessageFormattingResult.DecodeError:
+                self._errors += count
+
+        return bool(latest) or self._received != received
+
+    def _coalescing_key(self, raw_message: can.Message) -> Any:
+        """Return the key of the frames which are shown in the same
+        lines as given frame, or ``None`` if its message is unknown.
+        Frames with a unique key are always decoded.
+
+        """
+
+        frame_key = (raw_message.arbitration_id, raw_message.is_extended_id)
+
+        try:
+            entry = self._frame_messages[frame_key]
+        except KeyError:
+            try:
+                message = self._dbase.get_message_by_frame_id(*frame_key) # type: ignore[union-attr]
+            except KeyError:
+                entry = None
+            else:
+                if message.is_multiplexed() and not message.is_container:
+                    entry = (message, message.create_decoder([]))
+                else:
+                    entry = (message, None)
+
+            self._frame_messages[frame_key] = entry
+
+        if entry is None:
+            return None
+
+        message, decoder = entry
+
+        if message.is_container or len(raw_message.data) < message.length:
+            # Containers and errors are shown as they arrive.
+            return object()
+
+        if decoder is None:
+            return frame_key
+
+        # Multiplexed messages are shown in one line per multiplexer id.
+        try:
+            mux_ids = decoder(bytes(raw_message.data), False, False)
+        except DecodeError:
+            return object()
+
+        return (*frame_key, *mux_ids.values())
 
     def update(self):
         if self._playing:
@@ -534,9 +1074,39 @@ class Monitor(can.Listener):
         if name in self._messages_with_error or self._message_matches_filter(name):
             bisect.insort(self._filtered_sorted_message_names,
                           name)
+            self.invalidate_lines()
 
     def on_message_received(self, msg):
-        self._queue.put(msg)
+        self.update_statistics(msg)
+
+        # A replayed log waits for the queue instead.
+        if self._replay is not None:
+            self._queue.put(msg)
+            return
+
+        # Drop frames instead of using more and more memory if they are
+        # received faster than displayed.
+        try:
+            self._queue.put_nowait(msg)
+        except queue.Full:
+            self._dropped += 1
+
+
+    def update_statistics(self, raw_message: can.Message) -> None:
+        key = (raw_message.arbitration_id, raw_message.is_extended_id)
+        statistics = self._statistics.get(key)
+
+        if statistics is None:
+            try:
+                cycle_time = self._dbase.get_message_by_frame_id(*key).cycle_time # type: ignore[union-attr]
+            except KeyError:
+                cycle_time = None
+
+            statistics = MessageStatistics(None if cycle_time is None else cycle_time / 1000)
+            self._statistics[key] = statistics
+
+        statistics.update(raw_message.timestamp)
+        self._bus_statistics.update(raw_message)
 
 
 def _do_monitor(args):
@@ -549,6 +1119,16 @@ def _do_monitor(args):
         pass
 
 
+def _speed(string):
+    value = float(string)
+
+    # Also rejects NaN.
+    if not value >= 0:
+        raise argparse.ArgumentTypeError(f'{string} is not in the range 0..inf')
+
+    return value
+
+
 def add_subparser(subparsers):
     monitor_parser = subparsers.add_parser(
         'monitor',
@@ -581,6 +1161,26 @@ def add_subparser(subparsers):
     monitor_parser.add_argument(
         '--filter-regex',
         help='Use given filter regex.')
+    monitor_parser.add_argument(
+        '--queue-size',
+        type=Integer(1),
+        default=65536,
+        help=('Maximum number of received frames waiting to be displayed. '
+              'Frames received when the queue is full are dropped.'))
+
+    replay_group = monitor_parser.add_argument_group('replay arguments')
+    replay_group.add_argument(
+        '--replay',
+        metavar='LOGFILE',
+        help=('Replay given candump or PCAN log file instead of receiving '
+              'from a bus. The bus arguments except filters and bitrates are '
+              'ignored. Use the left and right arrow keys to seek.'))
+    replay_group.add_argument(
+        '--speed',
+        type=_speed,
+        default=1.0,
+        help=('Replay speed relative to real time, or 0 to replay as fast as '
+              'possible.'))
     can.cli.add_bus_arguments(monitor_parser, filter_arg=True, group_title="bus arguments (python-can)")
 
     monitor_parser.set_defaults(func=_do_monitor)
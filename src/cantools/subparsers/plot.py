@@ -59,6 +59,7 @@ import sys
 from argparse_addons import Integer  # type: ignore
 
 try:
+    import numpy as np
     from matplotlib import pyplot as plt
 except ImportError:
     plt = None  # type: ignore[assignment,unused-ignore]
@@ -355,7 +356,10 @@ def _do_decode(args):
     if args.style is not None:
         plt.style.use(args.style)
 
-    plotter = Plotter(dbase, args)
+    if args.max_points is None:
+        plotter = Plotter(dbase, args)
+    else:
+        plotter = ArrayPlotter(dbase, args)
 
     line_number = 1
     while True:
@@ -422,26 +426,71 @@ class Plotter:
         self.ignore_unknown_frames = args.ignore_unknown_frames
         self.ignore_invalid_data = args.ignore_invalid_data
         self.output_filename = args.output_file
-        self.signals = Signals(args.signals, args.case_sensitive, args.break_time, args, args.auto_color_ylabels, dbase)
+        self.signals = self.create_signals(dbase, args)
 
         self.x_invalid_syntax = []
         self.x_unknown_frames = []
         self.x_invalid_data = []
 
+        # Resolve the signals to be plotted up front, so that only they
+        # are decoded and frames of other messages are skipped.
+        # frame id -> (message, names of displayed signals, decoder of them) or None if unknown
+        self.messages = {}
+        for message in dbase.messages:
+            self.get_message(message.frame_id)
+
+    def create_signals(self, dbase, args):
+        return Signals(args.signals, args.case_sensitive, args.break_time, args, args.auto_color_ylabels, dbase)
+
     # ------- while reading data -------
 
-    def add_msg(self, timestamp, frame_id, data):
+    def get_message(self, frame_id):
+        try:
+            return self.messages[frame_id]
+        except KeyError:
+            pass
+
         try:
             message = self.dbase.get_message_by_frame_id(frame_id)
         except KeyError:
+            entry = None
+        else:
+            names = [signal.name for signal in message.signals
+                     if self.signals.is_displayed_signal(message.name + '.' + signal.name)]
+            if message.is_container:
+                decoder = None
+            else:
+                # Decodes nothing but the multiplexers if no signal is displayed,
+                # which is enough to find invalid data.
+                decoder = message.create_decoder(names)
+            entry = (message, names, decoder)
+
+        self.messages[frame_id] = entry
+
+        return entry
+
+    def add_msg(self, timestamp, frame_id, data):
+        entry = self.get_message(frame_id)
+
+        if entry is None:
             if self.show_unknown_frames:
                 self.x_unknown_frames.append(timestamp)
             if not self.ignore_unknown_frames:
                 print(f'Unknown frame id {frame_id} (0x{frame_id:x})')
             return
 
+        message, names, decoder = entry
+
+        if not names and self.ignore_invalid_data and not self.show_invalid_data:
+            # None of the signals of this message is plotted
+            # and invalid data is not reported.
+            return
+
         try:
-            decoded_signals = message.decode(data, self.decode_choices)
+            if decoder is None:
+                decoded_signals = message.decode(data, self.decode_choices)
+            else:
+                decoded_signals = decoder(data, self.decode_choices)
         except Exception as e:
             if self.show_invalid_data:
                 self.x_invalid_data.append(timestamp)
@@ -473,6 +522,108 @@ class Plotter:
         else:
             plt.show()
 
+class ArrayPlotter(Plotter):
+
+    '''
+    A Plotter for huge logs, selected by --max-points.
+    Collects the frames received from _do_decode and decodes them
+    in batches of CHUNK_SIZE frames with Message.decode_many.
+    The values of the displayed signals are stored in NumPy arrays in an ArraySignals object.
+    Frames which cannot be decoded in a batch are decoded one by one by Plotter.add_msg.
+    '''
+
+    CHUNK_SIZE = 65536
+
+    # ------- initialization -------
+
+    def __init__(self, dbase, args):
+        super().__init__(dbase, args)
+        self.timestamps = []
+        self.frame_ids = []
+        self.data = []
+
+    def create_signals(self, dbase, args):
+        return ArraySignals(args.signals, args.case_sensitive, args.break_time, args, args.auto_color_ylabels, dbase)
+
+    # ------- while reading data -------
+
+    def add_msg(self, timestamp, frame_id, data):
+        self.timestamps.append(timestamp)
+        self.frame_ids.append(frame_id)
+        self.data.append(data)
+
+        if len(self.frame_ids) >= self.CHUNK_SIZE:
+            self.flush()
+
+    def flush(self):
+        '''
+        Decodes the collected frames.
+        '''
+        timestamps = self.timestamps
+        frame_ids = self.frame_ids
+        data = self.data
+        self.timestamps = []
+        self.frame_ids = []
+        self.data = []
+
+        # Several frame ids may belong to the same message if a frame id mask is used.
+        rows_by_message = {}
+
+        for row, frame_id in enumerate(frame_ids):
+            entry = self.get_message(frame_id)
+
+            if entry is not None and entry[1]:
+                rows_by_message.setdefault(entry[0].name, (entry, []))[1].append(row)
+            else:
+                # Let Plotter.add_msg report unknown frames and invalid data of other messages.
+                super().add_msg(timestamps[row], frame_id, data[row])
+
+        if not rows_by_message:
+            return
+
+        x = timestamps_to_array(timestamps)
+
+        for (message, names, _), rows in rows_by_message.values():
+            try:
+                decoded_signals = self.decode_many(message, names, [data[row] for row in rows])
+            except Exception:
+                # Let Plotter.add_msg report the frames with invalid data.
+                for row in rows:
+                    super().add_msg(timestamps[row], frame_ids[row], data[row])
+                continue
+
+            xs = x[rows]
+            for signal, y in decoded_signals.items():
+                # Signals of multiplexed branches are only present in selected frames.
+                valid = ~np.ma.getmaskarray(y)
+                self.signals.add_values(message.name + '.' + signal, xs[valid], np.ma.getdata(y)[valid])
+
+    def decode_many(self, message, names, payloads):
+        decoded_signals = message.decode_many(payloads)
+        decoded_signals = {name: decoded_signals[name] for name in names}
+        choice_signals = [message.get_signal_by_name(name) for name in names
+                          if message.get_signal_by_name(name).choices]
+
+        if self.decode_choices and choice_signals:
+            codes = message.decode_many(payloads, decode_choices=True)
+
+            for signal in choice_signals:
+                labels = np.array([str(choice) for choice in signal.choices.values()], dtype=object)
+                code = np.ma.getdata(codes[signal.name])
+                y = decoded_signals[signal.name]
+                # Values without a choice are plotted as numbers, like in Plotter.add_msg.
+                decoded_signals[signal.name] = np.ma.masked_array(
+                    np.where(code >= 0, labels[code], np.ma.getdata(y).astype(object)),
+                    mask=np.ma.getmaskarray(y))
+
+        return decoded_signals
+
+    # ------- at end -------
+
+    def plot(self, xlabel):
+        self.flush()
+        super().plot(xlabel)
+
 class Signals:
 
     '''
@@ -630,6 +781,9 @@ class Signals:
 
     # ------- at end -------
 
+    def get_values(self, graph):
+        return graph.x, graph.y
+
     SUBPLOT_DIRECT_NAMES = ('title', 'ylabel')
     def plot(self, xlabel, x_invalid_syntax, x_unknown_frames, x_invalid_data):
         self.default_xlabel = xlabel
@@ -668,9 +822,8 @@ class Signals:
                 else:
                     graph.plotted_signal = sgo
 
-                x = graph.x
-                y = graph.y
-                if axis_format_uninitialized and x:
+                x, y = self.get_values(graph)
+                if axis_format_uninitialized and len(x):
                     if isinstance(x[0], float):
                         splot.axes.xaxis.set_major_formatter(lambda x,pos: str(datetime.timedelta(seconds=x)))
                     axis_format_uninitialized = False
@@ -759,6 +912,48 @@ class Signals:
         msg, signal = re.split(self.SEP_SG, signal_name)
         return self.dbase.get_message_by_name(msg).get_signal_by_name(signal).unit
 
+class ArraySignals(Signals):
+
+    '''
+    A Signals object which saves the values in ArrayGraph objects
+    and reduces them to about max_points points per signal before plotting them.
+    The break_time is applied after reducing the values.
+    '''
+
+    def __init__(self, signals, case_sensitive, break_time, global_subplot_args, auto_color_ylabels, dbase):
+        super().__init__(signals, case_sensitive, break_time, global_subplot_args, auto_color_ylabels, dbase)
+        self.max_points = global_subplot_args.max_points
+
+    # ------- while reading data -------
+
+    def add_value(self, signal, x, y):
+        self.add_values(signal,
+                        timestamps_to_array([x]),
+                        np.array([y], dtype=object if isinstance(y, str) else None))
+
+    def add_values(self, signal, x, y):
+        if not self.is_displayed_signal(signal):
+            return
+
+        if signal not in self.values:
+            self.values[signal] = ArrayGraph()
+
+        self.values[signal].extend(x, y)
+
+    # ------- at end -------
+
+    def get_values(self, graph):
+        x = graph.x
+
+        if self.break_time <= 0:
+            break_time = None
+        elif x.dtype.kind == 'M':
+            break_time = np.timedelta64(round(self.break_time * 1e6), 'us')
+        else:
+            break_time = self.break_time
+
+        return decimate(x, graph.y, self.max_points, break_time)
+
 class Signal:
 
     '''
@@ -813,6 +1008,155 @@ class Graph:
         self.plotted_signal = None
 
 
+class ArrayGraph:
+
+    '''
+    A container for the values to be plotted like Graph,
+    but in NumPy arrays which grow as values are added.
+    '''
+
+    __slots__ = ('_x', '_y', 'length', 'plotted_signal')
+
+    INITIAL_CAPACITY = 1024
+
+    def __init__(self):
+        self._x = None
+        self._y = None
+        self.length = 0
+        self.plotted_signal = None
+
+    def extend(self, x, y):
+        if self._x is None:
+            capacity = max(len(x), self.INITIAL_CAPACITY)
+            self._x = np.empty(capacity, dtype=x.dtype)
+            self._y = np.empty(capacity, dtype=y.dtype)
+
+        end = self.length + len(x)
+
+        if end > len(self._x):
+            capacity = max(end, 2 * len(self._x))
+            self._x = self.resize(self._x, capacity, x.dtype)
+            self._y = self.resize(self._y, capacity, y.dtype)
+        else:
+            self._x = self.resize(self._x, len(self._x), x.dtype)
+            self._y = self.resize(self._y, len(self._y), y.dtype)
+
+        self._x[self.length:end] = x
+        self._y[self.length:end] = y
+        self.length = end
+
+    def resize(self, array, capacity, dtype):
+        '''
+        Returns array if it is big enough and can hold values of dtype,
+        otherwise a copy of it with given capacity.
+        '''
+        if 'O' in (array.dtype.kind, dtype.kind):
+            dtype = np.dtype(object)
+        else:
+            dtype = np.result_type(array.dtype, dtype)
+
+        if capacity == len(array) and dtype == array.dtype:
+            return array
+
+        out = np.empty(capacity, dtype=dtype)
+        out[:self.length] = array[:self.length]
+
+        return out
+
+    @property
+    def x(self):
+        if self._x is None:
+            return np.empty(0)
+
+        return self._x[:self.length]
+
+    @property
+    def y(self):
+        if self._y is None:
+            return np.empty(0)
+
+        return self._y[:self.length]
+
+
+def timestamps_to_array(timestamps):
+    '''
+    Converts values of the horizontal axis as returned by TimestampParser to a NumPy array.
+    '''
+    if isinstance(timestamps[0], datetime.datetime):
+        return np.array(timestamps, dtype='datetime64[us]')
+
+    return np.array(timestamps)
+
+
+def decimate(x, y, max_points, break_time):
+    '''
+    Reduces the values of a signal to about max_points points, so that drawing them is fast.
+
+    Numeric values are reduced by splitting the horizontal axis into max_points/4
+    intervals of equal length and keeping the first, last, minimum and maximum value
+    of each interval, so that the plot looks the same and peaks are not lost.
+    Other values, e.g. choices, are reduced to the first and last value
+    of each run of equal values.
+
+    If break_time is not None a NaN (or None) value is inserted wherever the horizontal distance
+    between two consecutive values is longer than break_time, like Signals.add_value does.
+    '''
+    n = len(x)
+
+    if n < 2:
+        return x, y
+
+    if break_time is None:
+        breaks = np.zeros(n - 1, dtype=bool)
+    else:
+        breaks = np.diff(x) > break_time
+
+    if n > max_points:
+        if y.dtype.kind in 'biuf':
+            if x.dtype.kind == 'M':
+                xf = x.astype('datetime64[us]').astype(np.int64).astype(np.float64)
+            else:
+                xf = x.astype(np.float64)
+
+            intervals = max(max_points // 4, 1)
+            span = xf.max() - xf.min()
+
+            if span > 0:
+                interval = ((xf - xf.min()) * (intervals / span)).astype(np.int64)
+            else:
+                interval = np.zeros(n, dtype=np.int64)
+
+            starts = np.flatnonzero(np.concatenate(([True], (interval[1:] != interval[:-1]) | breaks)))
+            ends = np.append(starts[1:], n) - 1
+            # Sort the values of each interval, the groups stay in place.
+            groups = np.repeat(np.arange(len(starts)), ends - starts + 1)
+            order = np.lexsort((y, groups))
+            keep = np.unique(np.concatenate((starts, ends, order[starts], order[ends])))
+        else:
+            starts = np.flatnonzero(np.concatenate(([True], (y[1:] != y[:-1]) | breaks)))
+            ends = np.append(starts[1:], n) - 1
+            keep = np.unique(np.concatenate((starts, ends)))
+
+        x = x[keep]
+        y = y[keep]
+        breaks = np.add.reduceat(breaks, keep[:-1]) if len(keep) > 1 else breaks[:0]
+        breaks = breaks.astype(bool)
+
+    positions = np.flatnonzero(breaks) + 1
+
+    if len(positions):
+        if y.dtype.kind == 'O':
+            gap = None
+        else:
+            gap = np.nan
+            y = y.astype(np.result_type(y.dtype, np.float64))
+
+        x = np.insert(x, positions, x[positions - 1] + break_time / 2)
+        y = np.insert(y, positions, gap)
+
+    return x, y
+
+
 class RawDescriptionArgumentDefaultsHelpFormatter(
     argparse.RawDescriptionHelpFormatter, argparse.ArgumentDefaultsHelpFormatter):
     pass
@@ -924,6 +1268,13 @@ def add_subparser(subparsers):
         '--no-strict',
         action='store_true',
         help='Skip database consistency checks.')
+    plot_parser.add_argument(
+        '--max-points',
+        type=Integer(1),
+        help=('Decode the frames in batches, keep only the values of the signals to be plotted '
+              'and reduce each signal to about this number of points before plotting it, '
+              'keeping minima and maxima. This is much faster and uses much less memory '
+              'for huge logs.'))
 
     plot_parser.add_argument(
         'database',
@@ -14,6 +14,7 @@ from bitstruct import CompiledFormatDict  # type: ignore
 
 if TYPE_CHECKING:
     from .database import Message, Signal
+    from .database.compiled import CompiledDecoder, CompiledEncoder
     from .database.namedsignalvalue import NamedSignalValue
 
 
@@ -28,6 +29,8 @@ Comments = dict[str | None, str]
 class Codec(TypedDict):
     signals: list["Signal"]
     formats: Formats
+    decoder: "CompiledDecoder"
+    encoder: "CompiledEncoder"
     multiplexers: Mapping[str, Mapping[int, Any]]
 
 ByteOrder = Literal["little_endian", "big_endian"]
@@ -0,0 +1,309 @@
+import os
+import random
+import unittest
+
+import cantools
+from cantools.database.errors import DecodeError, EncodeError
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _file(name):
+    return os.path.join(os.path.dirname(__file__), 'files', name)
+
+
+@unittest.skipIf(np is None, 'numpy is not installed')
+class CanToolsBatchTest(unittest.TestCase):
+
+    def random_payloads(self, message, count=200):
+        generator = random.Random(message.name)
+
+        return [bytes(generator.getrandbits(8) for _ in range(message.length))
+                for _ in range(count)]
+
+    def assert_decode_many(self, message, decode_choices, scaling):
+        payloads = self.random_payloads(message)
+        columns = message.decode_many(payloads, decode_choices, scaling)
+
+        for row, payload in enumerate(payloads):
+            try:
+                expected = message.decode(payload,
+                                          decode_choices,
+                                          scaling)
+            except DecodeError:
+                continue
+
+            for signal in message.signals:
+                name = signal.name
+                column = columns[name]
+
+                if name not in expected:
+                    self.assertTrue(np.ma.getmaskarray(column)[row])
+                    continue
+
+                self.assertFalse(np.ma.getmaskarray(column)[row])
+                value = column[row]
+
+                if decode_choices and signal.choices:
+                    choices = list(signal.choices.values())
+                    code = int(value)
+
+                    if code == -1:
+                        self.assertNotIn(expected[name], choices)
+                    else:
+                        self.assertEqual(str(choices[code]),
+                                         str(expected[name]))
+                elif isinstance(expected[name], float):
+                    if np.isnan(expected[name]):
+                        self.assertTrue(np.isnan(value))
+                    else:
+                        self.assertAlmostEqual(float(value),
+                                               expected[name])
+                else:
+                    self.assertEqual(value, expected[name])
+
+    def test_decode_many(self):
+        for filename in ['dbc/vehicle.dbc',
+                         'dbc/multiplex_2.dbc',
+                         'dbc/choices.dbc',
+                         'dbc/floating_point.dbc',
+                         'dbc/motohawk.dbc',
+                         'kcd/the_homer.kcd']:
+            db = cantools.database.load_file(_file(filename))
+
+            for message in db.messages:
+                if message.is_container:
+                    continue
+
+                for decode_choices in [False, True]:
+                    for scaling in [False, True]:
+                        with self.subTest(message=message.name,
+                                          decode_choices=decode_choices,
+                                          scaling=scaling):
+                            self.assert_decode_many(message,
+                                                    decode_choices,
+                                                    scaling)
+
+    def test_decode_many_multiplexed(self):
+        db = cantools.database.load_file(_file('dbc/multiplex_2.dbc'))
+        message = db.get_message_by_name('Extended')
+        payloads = np.array([
+            list(bytes.fromhex('2001000002030000')),
+            list(bytes.fromhex('ff00000000000000')),
+        ], dtype=np.uint8)
+        columns = message.decode_many(payloads)
+
+        # The second payload has an invalid multiplexer id, so the
+        # multiplexed signals are masked.
+        self.assertEqual(columns['S0'].tolist(), [0, -1])
+        self.assertEqual(columns['S6'].tolist(), [2, 0])
+        self.assertEqual(columns['S1'].tolist(), [2, None])
+        self.assertEqual(columns['S4'].tolist(), [1, None])
+        self.assertEqual(columns['S8'].tolist(), [3, None])
+
+    def test_decode_many_choices(self):
+        db = cantools.database.load_file(_file('dbc/choices.dbc'))
+        message = db.get_message_by_name('Foo')
+        keys = list(message.get_signal_by_name('Foo').choices)
+        payloads = [message.encode({'Foo': value}, strict=False)
+                    for value in [-5, 0, 6, 7]]
+        columns = message.decode_many(payloads, decode_choices=True)
+
+        self.assertEqual(columns['Foo'].dtype, np.int32)
+        self.assertEqual(columns['Foo'].tolist(),
+                         [keys.index(-5), keys.index(0), keys.index(6), -1])
+
+    def test_decode_many_errors(self):
+        db = cantools.database.load_file(_file('dbc/motohawk.dbc'))
+        message = db.get_message_by_name('ExampleMessage')
+
+        with self.assertRaises(DecodeError) as cm:
+            message.decode_many([b'\x00' * 8, b'\x00' * 7])
+
+        self.assertEqual(str(cm.exception),
+                         'Wrong data size: 7 instead of 8 bytes')
+
+        # Excess data is ignored.
+        columns = message.decode_many(np.zeros((3, 10), dtype=np.uint8))
+        self.assertEqual(len(columns['Temperature']), 3)
+
+    def test_database_decode_many(self):
+        db = cantools.database.load_file(_file('dbc/foobar.dbc'))
+        fum = db.get_message_by_name('Fum')
+        bar = db.get_message_by_name('Bar')
+        frames = [
+            (fum.frame_id, fum.encode({'Fum': 1, 'Fam': 2})),
+            (0x7ff, b''),
+            (bar.frame_id, bar.encode({'Binary32': 3})),
+            (fum.frame_id, fum.encode({'Fum': 5, 'Fam': 6}, strict=False)),
+        ]
+        frame_ids = [frame_id for frame_id, _ in frames]
+        payloads = [payload for _, payload in frames]
+        decoded = db.decode_many(frame_ids, payloads)
+
+        self.assertEqual(sorted(decoded), ['Bar', 'Fum'])
+        rows, columns = decoded['Fum']
+        self.assertEqual(rows.tolist(), [0, 3])
+        self.assertEqual(columns['Fum'].tolist(), [1, 5])
+        self.assertEqual(columns['Fam'].tolist(), [2, 6])
+        rows, columns = decoded['Bar']
+        self.assertEqual(rows.tolist(), [2])
+        self.assertEqual(columns['Binary32'].tolist(), [3])
+
+
+    def test_encode_many(self):
+        for filename in ['dbc/vehicle.dbc',
+                         'dbc/multiplex_2.dbc',
+                         'dbc/choices.dbc',
+                         'dbc/floating_point.dbc',
+                         'dbc/motohawk.dbc',
+                         'kcd/the_homer.kcd']:
+            db = cantools.database.load_file(_file(filename))
+
+            for message in db.messages:
+                if message.is_container or not message.signals:
+                    continue
+
+                for scaling in [False, True]:
+                    for padding in [False, True]:
+                        with self.subTest(message=message.name,
+                                          scaling=scaling,
+                                          padding=padding):
+                            self.assert_encode_many(message, scaling, padding)
+
+    def assert_encode_many(self, message, scaling, padding):
+        rows = []
+
+        for payload in self.random_payloads(message):
+            try:
+                rows.append(message.decode(payload, False, scaling))
+            except DecodeError:
+                pass
+
+        if not rows:
+            return
+
+        names = {name for row in rows for name in row}
+        columns = {name: [row.get(name, 0) for row in rows]
+                   for name in names}
+        encoded = message.encode_many(columns,
+                                      scaling,
+                                      padding,
+                                      strict=False)
+
+        self.assertEqual(encoded.shape, (len(rows), message.length))
+
+        for row, expected in zip(rows, encoded, strict=True):
+            self.assertEqual(message.encode(row,
+                                            scaling,
+                                            padding,
+                                            strict=False),
+                             expected.tobytes())
+
+    def test_encode_many_multiplexed(self):
+        db = cantools.database.load_file(_file('dbc/multiplex_2.dbc'))
+        message = db.get_message_by_name('Extended')
+        encoded = message.encode_many({
+            'S0': [0, 0],
+            'S1': [2, 0],
+            'S2': [0, 5],
+            'S3': [0, 7],
+            'S4': [1, 0],
+            'S6': [2, 1],
+            'S7': [0, 9],
+            'S8': [3, 0]
+        })
+
+        self.assertEqual(encoded[0].tobytes(),
+                         bytes.fromhex('2001000002030000'))
+        self.assertEqual(encoded[1].tobytes(),
+                         message.encode({'S0': 0,
+                                         'S1': 0,
+                                         'S2': 5,
+                                         'S3': 7,
+                                         'S6': 1,
+                                         'S7': 9}))
+
+        with self.assertRaises(EncodeError) as cm:
+            message.encode_many({'S0': [0, 3],
+                                 'S1': 0,
+                                 'S2': 0,
+                                 'S3': 0,
+                                 'S6': 1,
+                                 'S7': 0})
+
+        self.assertEqual(str(cm.exception),
+                         'A valid value for the multiplexer selector signal '
+                         '"S0" is required: Expected one of {0 or 1}, but '
+                         'got 3')
+
+    def test_encode_many_choices(self):
+        db = cantools.database.load_file(_file('dbc/choices.dbc'))
+        message = db.get_message_by_name('Foo')
+        values = ['A negative value', 0, 'unused 2', -1]
+        encoded = message.encode_many({'Foo': values})
+
+        self.assertEqual([row.tobytes() for row in encoded],
+                         [message.encode({'Foo': value}) for value in values])
+
+        with self.assertRaises(KeyError):
+            message.encode_many({'Foo': ['With space', 'Bad']})
+
+    def test_encode_many_strict(self):
+        db = cantools.database.load_file(_file('dbc/motohawk.dbc'))
+        message = db.get_message_by_name('ExampleMessage')
+        columns = {
+            'Temperature': np.array([250.1, 229.52, 260.0]),
+            'AverageRadius': [3.2, 0.0, 5.0],
+            'Enable': 1
+        }
+
+        # Values are within their allowed ranges, with a small
+        # tolerance.
+        encoded = message.encode_many(columns, padding=True)
+        self.assertEqual(encoded[0].tobytes(),
+                         message.encode({'Temperature': 250.1,
+                                         'AverageRadius': 3.2,
+                                         'Enable': 1},
+                                        padding=True))
+
+        columns['Temperature'][2] = 270.5
+
+        with self.assertRaises(EncodeError) as cm:
+            message.encode_many(columns)
+
+        self.assertEqual(str(cm.exception),
+                         'Expected signal "Temperature" value smaller than '
+                         'or equal to 270.47 in message "ExampleMessage", '
+                         'but got 270.5.')
+
+        # Not strict, but the value does not fit in the signal.
+        columns['Enable'] = [1, 1, 1000]
+
+        with self.assertRaises(OverflowError) as cm:
+            message.encode_many(columns, strict=False)
+
+        self.assertEqual(str(cm.exception),
+                         'Unsigned integer value 1000 out of range.')
+
+        with self.assertRaises(EncodeError) as cm:
+            message.encode_many({**columns, 'Foo': 1})
+
+        with self.assertRaises(KeyError):
+            message.encode_many({'Temperature': 250.0}, strict=False)
+
+        with self.assertRaises(EncodeError) as cm:
+            message.encode_many({'Temperature': [250.0, 251.0],
+                                 'AverageRadius': [1.0, 2.0, 3.0],
+                                 'Enable': 1})
+
+        self.assertEqual(str(cm.exception),
+                         'All columns must have the same length, but got '
+                         '2 or 3')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -115,6 +115,43 @@ IO_DEBUG(
             actual_output = stdout.getvalue()
             self.assertEqual(actual_output, expected_output)
 
+    def test_decode_jobs(self):
+        input_data = """\
+  vcan0  ERROR
+  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+  vcan0  064   [10]  F0 01 FF FF FF FF FF FF FF FF
+
+  vcan0  1F4   [4]  01 02 03 04
+  vcan0  1F3   [3]  01 02 03
+  vcan0  0C8   [8]  F1 00 00 00 00 00 00 00
+"""
+
+        def decode(*args):
+            argv = ['cantools', 'decode', *args, 'tests/files/dbc/socialledge.dbc']
+            stdout = StringIO()
+
+            with patch('sys.stdin', StringIO(input_data)), patch('sys.stdout', stdout), patch('sys.argv', argv):
+                cantools._main()
+
+            return stdout.getvalue()
+
+        expected_output = decode()
+
+        # Small chunks to spread the lines over several workers.
+        with patch('cantools.subparsers.decode.CHUNK_SIZE', 2):
+            self.assertEqual(decode('--jobs', '2'), expected_output)
+            self.assertEqual(decode('-s', '-j', '3'),
+                             decode('--single-line'))
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'candump.log')
+
+            with open(filename, 'w') as fout:
+                fout.write(input_data)
+
+            self.assertEqual(decode('--input', filename, '--jobs', '2'),
+                             expected_output)
+
     def test_decode_timestamp_absolute(self):
         argv = [
             'cantools',
@@ -1266,6 +1303,27 @@ BATTERY_VT(
             db.add_dbc_file(dbc_out_path)
             self.assertEqual(db.version, '1.0')
 
+            # DBC to CDB.
+            cdb_out_path = os.path.join(tmpdir, 'test_command_line_convert.cdb')
+            argv = [
+                'cantools',
+                'convert',
+                dbc_out_path,
+                cdb_out_path
+            ]
+
+            with patch('sys.argv', argv):
+                cantools._main()
+
+            db = cantools.database.Database()
+
+            with open(cdb_out_path, 'rb') as fin:
+                db.add_cdb(fin)
+
+            self.assertEqual(db.version, '1.0')
+            self.assertEqual(db.get_message_by_name('ExampleMessage').frame_id,
+                             0x1f0)
+
     def test_convert_bad_outfile(self):
         argv = [
             'cantools',
@@ -1,6 +1,7 @@
 
 import logging
 import math
+import multiprocessing
 import os
 import pickle
 import re
@@ -18,8 +19,15 @@ from parameterized import parameterized  # type: ignore
 import cantools.autosar
 import cantools.database
 from cantools.database import Message, Signal
+from cantools.database.can.decode_cache import DecodeCache
 from cantools.database.can.formats import dbc
 from cantools.database.can.formats.dbc import LongNamesConverter
+from cantools.database.can.frame_id_resolver import (
+    FrameIdResolver,
+    J1939FrameIdResolver,
+)
+from cantools.database.can.shared_database import SharedDatabase
+from cantools.database.content_cache import ContentCache
 from cantools.database.errors import (
     DecodeError,
     EncodeError,
@@ -27,9 +35,14 @@ from cantools.database.errors import (
     ParseError,
     UnsupportedDatabaseFormatError,
 )
+from cantools.database.registry import Registry
 from cantools.database.utils import sort_choices_by_value, sort_signals_by_name
 
 
+def decode_shared(shared, frame_id, data):
+    return dict(shared.database.decode_message(frame_id, data))
+
+
 class CanToolsDatabaseTest(unittest.TestCase):
 
     maxDiff = None
@@ -698,6 +711,144 @@ class CanToolsDatabaseTest(unittest.TestCase):
         # partial message with omitted multiplexor signal
         self.assertEqual(msg.decode(b'', allow_truncated=True), {})
 
+    def test_compiled_decoder(self):
+        filenames = [
+            'tests/files/dbc/vehicle.dbc',
+            'tests/files/dbc/multiplex_2.dbc',
+            'tests/files/dbc/choices.dbc',
+            'tests/files/dbc/floating_point.dbc',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/kcd/the_homer.kcd',
+        ]
+
+        for filename in filenames:
+            db = cantools.database.load_file(filename)
+
+            for message in db.messages:
+                for i in range(8):
+                    data = bytes((37 * i + j) % 256
+                                 for j in range(message.length))
+
+                    for decode_choices in [False, True]:
+                        for scaling in [False, True]:
+                            try:
+                                expected = message._decode(message._codecs,
+                                                           data,
+                                                           decode_choices,
+                                                           scaling,
+                                                           False,
+                                                           True)
+                            except DecodeError as e:
+                                with self.assertRaises(DecodeError) as cm:
+                                    message.decode(data,
+                                                   decode_choices,
+                                                   scaling)
+
+                                self.assertEqual(str(cm.exception), str(e))
+                                continue
+
+                            actual = message.decode(data,
+                                                    decode_choices,
+                                                    scaling)
+                            self.assertEqual(list(actual), list(expected))
+
+                            for name, value in expected.items():
+                                if isinstance(value, float) and math.isnan(value):
+                                    self.assertTrue(math.isnan(actual[name]))
+                                else:
+                                    self.assertEqual(actual[name], value)
+                                    self.assertIs(type(actual[name]), type(value))
+
+        # The generated decoder is recreated when unpickling.
+        db = cantools.database.load_file('tests/files/dbc/multiplex_2.dbc')
+        message = db.get_message_by_name('Extended')
+        data = bytes.fromhex('2001000002030000')
+        unpickled = pickle.loads(pickle.dumps(message))
+        self.assertEqual(unpickled.decode(data),
+                         {'S0': 0, 'S6': 2, 'S1': 2, 'S4': 1, 'S8': 3})
+
+        # The generated decoder follows changes of the signals.
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+        data = bytes.fromhex('8006e00000000000')
+        self.assertEqual(message.decode(data)['Temperature'], 250.55)
+        signal = message.get_signal_by_name('Temperature')
+        signal.scale = 1.0
+        signal.offset = 0
+        self.assertEqual(message.decode(data)['Temperature'], 55)
+        signal.choices = {0: 'Zero'}
+        self.assertEqual(message.decode(bytes(8))['Temperature'], 'Zero')
+
+    def test_compiled_encoder(self):
+        filenames = [
+            'tests/files/dbc/vehicle.dbc',
+            'tests/files/dbc/multiplex_2.dbc',
+            'tests/files/dbc/choices.dbc',
+            'tests/files/dbc/floating_point.dbc',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/kcd/the_homer.kcd',
+        ]
+
+        for filename in filenames:
+            db = cantools.database.load_file(filename)
+
+            for message in db.messages:
+                for i in range(8):
+                    data = bytes((37 * i + j) % 256
+                                 for j in range(message.length))
+
+                    for decode_choices in [False, True]:
+                        for scaling in [False, True]:
+                            try:
+                                decoded = message.decode(data,
+                                                         decode_choices,
+                                                         scaling)
+                            except DecodeError:
+                                continue
+
+                            # Encoding the decoded signals gives the
+                            # original payload, except for the padding.
+                            actual, padding_mask = \
+                                message._codecs['encoder'].encode(decoded,
+                                                                  scaling)
+                            expected = int.from_bytes(data, 'big')
+                            self.assertEqual(actual & padding_mask, 0)
+                            self.assertEqual(actual,
+                                             expected & ~padding_mask)
+
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        message = db.get_message_by_name('ExampleMessage')
+
+        # Out of range raw values are not silently truncated.
+        with self.assertRaises(OverflowError):
+            message.encode({'Temperature': 250.1,
+                            'AverageRadius': 0.0,
+                            'Enable': 1000},
+                           strict=False)
+
+        with self.assertRaises(KeyError):
+            message.encode({'Temperature': 250.1, 'AverageRadius': 0.0},
+                           strict=False)
+
+        # The generated encoder is recreated when unpickling.
+        unpickled = pickle.loads(pickle.dumps(message))
+        self.assertEqual(
+            unpickled.encode({'Temperature': 250.1,
+                              'AverageRadius': 3.2,
+                              'Enable': 1}),
+            b'\xc0\x01@\x00\x00\x00\x00\x00')
+
+        # The generated encoder follows changes of the signals.
+        signal = message.get_signal_by_name('Temperature')
+        signal.offset = 0.0
+        signal.scale = 0.5
+        self.assertEqual(
+            message.encode({'Temperature': 100.0,
+                            'AverageRadius': 0.0,
+                            'Enable': 0},
+                           strict=False),
+            bytes.fromhex('0019000000000000'))
+
     def test_big_endian_no_decode_choices(self):
         """Decode a big endian signal with `decode_choices` set to False.
 
@@ -2804,6 +2955,38 @@ class CanToolsDatabaseTest(unittest.TestCase):
 
         self.assert_dbc_dump(db, 'tests/files/dbc/multiplex_choices_dumped.dbc')
 
+    def test_create_decoder(self):
+        db = cantools.database.load_file('tests/files/dbc/multiplex_choices.dbc',
+                                         prune_choices=False)
+        message = db.messages[0]
+        decode = message.create_decoder(['BIT_A', 'BIT_L'])
+
+        self.assertEqual(decode(b'\x20\x00\x8c\x01\x00\x00\x00\x00'),
+                         {'Multiplexor': 'MULTIPLEXOR_8', 'BIT_L': 'On'})
+        self.assertEqual(decode(b'\x60\x00\x8c\x35\xc3\x00\x00\x00', decode_choices=False),
+                         {'Multiplexor': 24, 'BIT_A': 1, 'BIT_L': 1})
+        # Excess data is ignored.
+        self.assertEqual(decode(b'\x20\x00\x8c\x01\x00\x00\x00\x00\x00'),
+                         {'Multiplexor': 'MULTIPLEXOR_8', 'BIT_L': 'On'})
+
+        # Only the multiplexer is decoded, which is enough to find
+        # invalid data.
+        decode = message.create_decoder([])
+        self.assertEqual(decode(b'\x20\x00\x8c\x01\x00\x00\x00\x00'),
+                         {'Multiplexor': 'MULTIPLEXOR_8'})
+
+        with self.assertRaises(cantools.database.DecodeError) as cm:
+            decode(b'\x30\x00\x00\x00\x00\x00\x00\x00')
+
+        self.assertEqual(str(cm.exception),
+                         'expected multiplexer id 8, 16 or 24, but got 12')
+
+        with self.assertRaises(cantools.database.DecodeError) as cm:
+            decode(b'\x20\x00')
+
+        self.assertEqual(str(cm.exception),
+                         'Wrong data size: 2 instead of 8 bytes')
+
     def test_multiplex_2(self):
         db = cantools.database.load_file('tests/files/dbc/multiplex_2.dbc')
 
@@ -3071,6 +3254,133 @@ class CanToolsDatabaseTest(unittest.TestCase):
             "error: line 1, column 0\", SYM: \"Only SYM version 6.0 is "
             "supported.\", CDD: \"syntax error: line 1, column 0\"")
 
+    def test_dbc_streaming_parser(self):
+        filenames = [
+            'tests/files/dbc/foobar.dbc',
+            'tests/files/dbc/motohawk.dbc',
+            'tests/files/dbc/multiplex_choices.dbc',
+            'tests/files/dbc/vehicle.dbc',
+            'tests/files/dbc/attributes.dbc',
+            'tests/files/dbc/issue_184_extended_mux_multiple_values.dbc'
+        ]
+
+        for filename in filenames:
+            with self.subTest(filename=filename):
+                db = cantools.database.load_file(filename)
+                db_streaming = cantools.database.load_file(
+                    filename,
+                    dbc_parser='streaming')
+
+                self.assertEqual(db_streaming.as_dbc_string(),
+                                 db.as_dbc_string())
+
+                # Tokens split at chunk boundaries.
+                with open(filename, encoding='cp1252') as fin:
+                    string = fin.read()
+
+                tokens = dbc.DbcStreamParser(chunk_size=7).parse(
+                    StringIO(string))
+                self.assertEqual(tokens, dbc.DbcParser().parse(string))
+
+        db_streaming = cantools.database.Database()
+        db_streaming.add_dbc_string(string, parser='streaming')
+        self.assertEqual(db_streaming.as_dbc_string(), db.as_dbc_string())
+
+        with self.assertRaises(ValueError) as cm:
+            cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                        dbc_parser='foo')
+
+        self.assertEqual(
+            str(cm.exception),
+            "expected DBC parser 'textparser' or 'streaming', but got 'foo'")
+
+        # Syntax errors.
+        with self.assertRaises(ParseError) as cm:
+            dbc.load(StringIO('VERSION "1.0"\n'
+                                 'BO_ dssd\n'))
+
+        self.assertEqual(str(cm.exception),
+                         "Invalid syntax at line 2: unexpected 'dssd'.")
+
+        with self.assertRaises(ParseError) as cm:
+            dbc.load(StringIO('VERSION "1.0"\n'
+                                 'BO_ 546 EMV_Stati: 8'))
+
+        self.assertEqual(str(cm.exception),
+                         'Invalid syntax at line 2: unexpected end of data.')
+
+        with self.assertRaises(UnsupportedDatabaseFormatError):
+            cantools.database.load_string('CM_ BO_ "Foo.";',
+                                          database_format='dbc',
+                                          dbc_parser='streaming')
+
+    def test_dbc_lazy_loading(self):
+        filename = 'tests/files/dbc/vehicle.dbc'
+        db = cantools.database.load_file(filename)
+
+        with open(filename, encoding='cp1252') as fin:
+            index = dbc.DbcMessageIndex(fin.read())
+
+        self.assertEqual(len(index), len(db.messages))
+        self.assertEqual(index.names, [message.name for message in db.messages])
+        self.assertFalse(index.is_loaded(3))
+        self.assertEqual(index.load(3).name, db.messages[3].name)
+        self.assertTrue(index.is_loaded(3))
+        self.assertEqual(index.database.version, db.version)
+
+        for dbc_parser in ['textparser', 'streaming']:
+            with self.subTest(dbc_parser=dbc_parser):
+                db_lazy = cantools.database.load_file(filename,
+                                                      dbc_parser=dbc_parser,
+                                                      lazy=True)
+
+                # Messages are loaded on first lookup.
+                message = db_lazy.get_message_by_name('RT_SB_INS_Vel_Body_Axes')
+                self.assertIs(
+                    db_lazy.get_message_by_frame_id(message.frame_id),
+                    message)
+                self.assertEqual(db_lazy.decode_message(0x9588322, b'\x01' * 8),
+                                 db.decode_message(0x9588322, b'\x01' * 8))
+                decoded = db.decode_message('RT_SB_INS_Vel_Body_Axes', b'\x01' * 8)
+                speed = {'Speed': 5.0, 'Accuracy_Speed': 1, 'Validity_Speed': 1}
+                self.assertEqual(db_lazy.encode_message('RT_DL1MK3_Speed', speed),
+                                 db.encode_message('RT_DL1MK3_Speed', speed))
+                self.assertEqual(
+                    db_lazy.encode_message('RT_SB_INS_Vel_Body_Axes', decoded),
+                    b'\x01' * 8)
+
+                with self.assertRaises(KeyError):
+                    db_lazy.get_message_by_name('Missing')
+
+                with self.assertRaises(KeyError):
+                    db_lazy.get_message_by_frame_id(0x123)
+
+                # All messages are loaded when the list is accessed.
+                self.assertEqual(len(db_lazy.messages), len(db.messages))
+                self.assertIn(message, db_lazy.messages)
+                self.assertEqual(db_lazy.as_dbc_string(), db.as_dbc_string())
+
+        # Long names, pruned choices and frame id masks.
+        db = cantools.database.load_file('tests/files/dbc/long_names.dbc')
+        db_lazy = cantools.database.load_file('tests/files/dbc/long_names.dbc',
+                                              lazy=True)
+        self.assertEqual(
+            db_lazy.get_message_by_name('SS12345678901234567890123458789012345').frame_id,
+            9)
+        self.assertEqual(db_lazy.as_dbc_string(), db.as_dbc_string())
+
+        db_lazy = cantools.database.load_file('tests/files/dbc/choices.dbc',
+                                              prune_choices=True,
+                                              lazy=True)
+        self.assertEqual(
+            db_lazy.get_message_by_name('Foo').signals[0].choices[4],
+            'unused 2')
+
+        db_lazy = cantools.database.load_file('tests/files/dbc/foobar.dbc',
+                                              frame_id_mask=0xff,
+                                              lazy=True)
+        self.assertEqual(db_lazy.get_message_by_frame_id(0x12331).name, 'Fum')
+
     def test_get_node_by_name(self):
         db = cantools.database.load_file('tests/files/kcd/the_homer.kcd')
 
@@ -3955,6 +4265,169 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(db.get_message_by_name('M1').frame_id, 2)
         self.assertEqual(db.get_message_by_frame_id(2).name, 'M1')
 
+    def test_cdb(self):
+        filenames = [
+            'tests/files/dbc/vehicle.dbc',
+            'tests/files/dbc/multiplex_choices.dbc',
+            'tests/files/arxml/system-4.2.arxml',
+            'tests/files/kcd/the_homer.kcd',
+            'tests/files/sym/jopp-6.0.sym'
+        ]
+
+        for filename in filenames:
+            db = cantools.database.load_file(filename)
+            db_cdb = cantools.database.Database()
+            db_cdb.add_cdb_bytes(db.as_cdb_bytes())
+
+            # Messages are created when first used.
+            message = db.messages[-1]
+            self.assertFalse(db_cdb._lazy_messages.is_loaded(len(db.messages) - 1))
+            self.assertEqual(repr(db_cdb.get_message_by_name(message.name)),
+                             repr(message))
+            self.assertTrue(db_cdb._lazy_messages.is_loaded(len(db.messages) - 1))
+            self.assertEqual(repr(db_cdb), repr(db))
+            self.assertTrue(db.is_similar(db_cdb,
+                                          include_format_specifics=False))
+
+        # Container messages and multiplexers with choices.
+        db = cantools.database.load_file('tests/files/arxml/system-4.2.arxml')
+        db_cdb = cantools.database.Database()
+        db_cdb.add_cdb_bytes(db.as_cdb_bytes())
+        message = db_cdb.get_message_by_name('OneToContainThemAll')
+        self.assertEqual([m.name for m in message.contained_messages],
+                         [
+                             'message1',
+                             'message2',
+                             'message3',
+                             'message3_secured',
+                             'multiplexed_message'
+                         ])
+        message = db_cdb.get_message_by_name('MultiplexedMessage')
+        signal = message.get_signal_by_name('MultiplexedMessage_selector1')
+        self.assertIsNone(signal.raw_invalid)
+        self.assertEqual(signal.invalid, 7)
+        data = b'\x01\x02\x03\x04\x05\x06\x07\x08'
+        self.assertEqual(message.decode(data),
+                         db.decode_message('MultiplexedMessage', data))
+
+        # Files are memory mapped, and choices are pruned when the
+        # messages are created.
+        filename = 'tests/files/dbc/choices_issue_with_name_dump.cdb'
+        db = cantools.database.load_file(
+            'tests/files/dbc/choices_issue_with_name.dbc')
+        cantools.database.dump_file(db, filename)
+        db_cdb = cantools.database.load_file(filename, prune_choices=True)
+        signal = db_cdb.messages[0].signals[0]
+        self.assertEqual(signal.choices[0].name, 'CmdRespErr')
+        self.assertEqual(signal.choices[1].name, 'CmdRespOK')
+
+        # Lazily loaded messages are pickled without the memory map.
+        db_cdb = cantools.database.load_file(filename)
+        db_pickled = pickle.loads(pickle.dumps(db_cdb))
+        self.assertEqual(repr(db_pickled), repr(db))
+
+        # The memory map is closed once all messages are loaded.
+        data = db_cdb._lazy_messages._data
+        self.assertFalse(data.closed)
+        self.assertEqual(repr(db_cdb.messages), repr(db.messages))
+        self.assertTrue(data.closed)
+        db_cdb = cantools.database.Database()
+        db_cdb.add_cdb_file(filename)
+        data = db_cdb._lazy_messages._data
+        self.assertEqual(len(db_cdb.messages), len(db.messages))
+        self.assertTrue(data.closed)
+        self.assertEqual(repr(pickle.loads(pickle.dumps(db_cdb))), repr(db))
+        os.remove(filename)
+
+        # Invalid data.
+        datas = [
+            (b'CDB', 'CDB data is truncated.'),
+            (b'CDB\x01' + bytes(100), 'Invalid CDB magic.'),
+            (b'CDB\x00\x02' + bytes(100),
+             'Expected CDB format version 1, but got 2.'),
+            (db.as_cdb_bytes()[:-1], 'CDB data is truncated.')
+        ]
+
+        for data, message in datas:
+            with self.assertRaises(ParseError) as cm:
+                cantools.database.Database().add_cdb_bytes(data)
+
+            self.assertEqual(str(cm.exception), message)
+
+    def test_shared_database(self):
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+
+        with SharedDatabase.create(db) as shared:
+            self.assertEqual(shared.size, len(db.as_cdb_bytes()))
+            self.assertEqual(repr(shared),
+                             f"SharedDatabase('{shared.name}', size={shared.size})")
+
+            # Only the name is pickled, and each process attaches once.
+            pickled = pickle.dumps(shared)
+            self.assertLess(len(pickled), 200)
+            self.assertIs(pickle.loads(pickled), shared)
+
+            shared_db = shared.database
+            self.assertIs(shared.database, shared_db)
+            self.assertEqual(len(shared_db._lazy_name_to_index), 1)
+            self.assertEqual(len(shared_db.messages), 1)
+            self.assertTrue(shared_db.is_similar(db, include_format_specifics=False))
+
+            # Decode in another process.
+            data = b'\xc0\x06\xe0\x00\x00\x00\x00\x00'
+
+            with multiprocessing.Pool(1) as pool:
+                decoded = pool.apply(decode_shared, (shared, 496, data))
+
+            self.assertEqual(decoded, db.decode_message(496, data))
+
+        # The shared memory block is removed.
+        with self.assertRaises(FileNotFoundError):
+            SharedDatabase.attach(shared.name)
+
+    def test_load_files(self):
+        filenames = [
+            'tests/files/dbc/add_two_dbc_files_1.dbc',
+            'tests/files/arxml/system-4.2.arxml',
+            'tests/files/kcd/the_homer.kcd',
+            'tests/files/dbc/add_two_dbc_files_2.dbc'
+        ]
+        expected = cantools.database.Database(frame_id_mask=0x7ff)
+        expected.add_dbc_file(filenames[0])
+        expected.add_arxml_file(filenames[1])
+        expected.add_kcd_file(filenames[2])
+        expected.add_dbc_file(filenames[3])
+
+        for jobs in [1, 2, 0]:
+            db = cantools.database.load_files(filenames,
+                                              frame_id_mask=0x7ff,
+                                              jobs=jobs)
+            self.assertEqual(repr(db), repr(expected))
+            self.assertTrue(db.is_similar(expected))
+            self.assertIsNotNone(db.autosar)
+            self.assertEqual(db.get_message_by_name('M1').frame_id, 2)
+            self.assertEqual(db.get_message_by_frame_id(2).name, 'M1')
+            self.assertEqual(db.get_message_by_frame_id(0x65).name,
+                             'Message4')
+
+        # Errors of worker processes are raised.
+        for jobs in [1, 2]:
+            with self.assertRaises(UnsupportedDatabaseFormatError) as cm:
+                cantools.database.load_files(
+                    [filenames[0], 'tests/files/kcd/the_homer.kcd'],
+                    database_format='dbc',
+                    jobs=jobs)
+
+            self.assertEqual(
+                str(cm.exception),
+                "DBC: \"Invalid syntax at line 1, column 1: \">>!<<<!--\"\"")
+
+        with self.assertRaises(cantools.database.Error) as cm:
+            cantools.database.load_files(['tests/files/cdd/example.cdd'])
+
+        self.assertEqual(str(cm.exception),
+                         "'tests/files/cdd/example.cdd' is not a CAN database.")
+
     def test_empty_ns_dbc(self):
         """Test loading a DBC-file with empty NS_.
 
@@ -4012,6 +4485,157 @@ class CanToolsDatabaseTest(unittest.TestCase):
         signal = db.messages[1].signals[0]
         self.assertEqual(signal.spn, 0)
 
+    def test_j1939_frame_id_resolver(self):
+        db = cantools.database.load_file('tests/files/dbc/j1939.dbc')
+        message_1 = db.get_message_by_name('Message1')
+        message_2 = db.get_message_by_name('Message2')
+
+        # No resolver by default.
+        self.assertIsNone(db.frame_id_resolver)
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x15340242)
+
+        db.frame_id_resolver = J1939FrameIdResolver()
+
+        # Exact frame ids.
+        self.assertIs(db.get_message_by_frame_id(0x15340201), message_1)
+        self.assertIs(db.get_message_by_frame_id(0x15f01002), message_2)
+
+        # Other priority, destination address and source address.
+        self.assertIs(db.get_message_by_frame_id(0x19347faa), message_1)
+        self.assertIs(db.get_message_by_frame_id(0x0df010ab), message_2)
+        self.assertEqual(
+            db.decode_message(0x0df010ab, b'\x00' * 8),
+            db.decode_message(0x15f01002, b'\x00' * 8))
+
+        # The PDU specific field is part of the PGN in PDU format 2.
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x15f01102)
+
+        # J1939 frames are always extended frames.
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x7ff)
+
+        # The resolver is refreshed with the database.
+        message_2.frame_id = 0x15f02002
+        db.refresh()
+        self.assertIs(db.get_message_by_frame_id(0x0df020ab), message_2)
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x0df010ab)
+
+        # Given when created.
+        db = cantools.database.can.Database(
+            db.messages,
+            frame_id_resolver=J1939FrameIdResolver())
+        self.assertIs(db.get_message_by_frame_id(0x0df020ab), message_2)
+
+    def test_frame_id_resolver_cache(self):
+        class Resolver(FrameIdResolver):
+            def __init__(self):
+                super().__init__(cache_size=2)
+                self.frame_ids = []
+
+            def _resolve(self, frame_id, is_extended_frame):
+                self.frame_ids.append(frame_id)
+
+                return messages.get(frame_id & 0xff)
+
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc')
+        messages = {message.frame_id & 0xff: message
+                    for message in db.messages}
+        resolver = Resolver()
+        db.frame_id_resolver = resolver
+        foo = db.get_message_by_name('Foo')
+
+        self.assertIs(db.get_message_by_frame_id(0x1200 | foo.frame_id & 0xff),
+                      foo)
+        self.assertIs(db.get_message_by_frame_id(0x1200 | foo.frame_id & 0xff),
+                      foo)
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x7ff)
+
+        with self.assertRaises(KeyError):
+            db.get_message_by_frame_id(0x7ff)
+
+        # Once the cache is full it starts over.
+        self.assertIs(db.get_message_by_frame_id(0x1300 | foo.frame_id & 0xff),
+                      foo)
+        self.assertIs(db.get_message_by_frame_id(0x1200 | foo.frame_id & 0xff),
+                      foo)
+        self.assertEqual(resolver.frame_ids,
+                         [0x1200 | foo.frame_id & 0xff,
+                          0x7ff,
+                          0x1300 | foo.frame_id & 0xff,
+                          0x1200 | foo.frame_id & 0xff])
+
+    def test_decode_cache(self):
+        db = cantools.database.load_file('tests/files/dbc/foobar.dbc')
+        foo = db.get_message_by_name('Foo')
+        data = foo.encode({'Foo': 250, 'Bar': 2})
+        expected = foo.decode(data)
+        cache = DecodeCache(maxsize=2)
+        db.decode_cache = cache
+
+        self.assertIs(foo.decode_cache, cache)
+
+        decoded = db.decode_message(foo.frame_id, data)
+        self.assertEqual(decoded, expected)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+        # The same read-only mapping is returned for repeated payloads.
+        self.assertIs(db.decode_message(foo.frame_id, bytearray(data)),
+                      decoded)
+        self.assertIs(foo.decode(data), decoded)
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        with self.assertRaises(TypeError):
+            decoded['Foo'] = 3
+
+        # Decode flags are part of the key.
+        self.assertEqual(foo.decode(data, scaling=False),
+                         foo.decode_simple(data, scaling=False))
+        self.assertEqual((cache.hits, cache.misses), (3, 2))
+
+        # The least recently used entry is dropped.
+        foo.decode(foo.encode({'Foo': 251, 'Bar': 2}))
+        self.assertEqual(cache.currsize, 2)
+        foo.decode(data)
+        self.assertEqual((cache.hits, cache.misses), (3, 4))
+
+        # Errors are not cached.
+        with self.assertRaises(DecodeError):
+            foo.decode(data[:-1])
+
+        self.assertEqual(cache.misses, 5)
+
+        # Refreshing a message or changing a signal makes its cached
+        # results unreachable, without dropping the results of other
+        # messages.
+        fum = db.get_message_by_name('Fum')
+        fum_data = fum.encode({'Fum': 5, 'Fam': 5})
+        fum.decode(fum_data)
+        self.assertEqual((cache.hits, cache.misses), (3, 6))
+        foo.refresh()
+        self.assertEqual(foo.decode(data), expected)
+        self.assertIs(fum.decode(fum_data), fum.decode(fum_data))
+        self.assertEqual((cache.hits, cache.misses), (5, 7))
+        foo.get_signal_by_name('Bar').scale = 1
+        self.assertEqual(foo.decode(data)['Bar'], 20)
+        self.assertEqual((cache.hits, cache.misses), (5, 8))
+
+        # Pickling drops the cached results.
+        db = pickle.loads(pickle.dumps(db))
+        self.assertEqual(db.decode_cache.maxsize, 2)
+        self.assertEqual(db.decode_cache.currsize, 0)
+        self.assertIs(db.get_message_by_name('Foo').decode_cache,
+                      db.decode_cache)
+
+        with self.assertRaises(ValueError):
+            DecodeCache(maxsize=0)
+
     def test_j1939_frame_id_pack_unpack(self):
         Data = namedtuple('Data',
                           [
@@ -5314,12 +5938,97 @@ class CanToolsDatabaseTest(unittest.TestCase):
         foo = loader._follow_arxml_reference(loader._root, "/CanFrame/Message1", "CAN-FRAME")
         bar = loader._follow_arxml_reference(loader._root, "/CanFrame/Message1", "CAN-FRAME")
         self.assertEqual(foo, bar)
+        self.assertEqual(loader.reference_cache_misses, 1)
+        self.assertEqual(loader.reference_cache_hits, 1)
+
+        # references to nodes of unexpected kind are memoized as well
+        self.assertIsNone(
+            loader._follow_arxml_reference(loader._root, "/CanFrame/Message1", "I-SIGNAL"))
+        self.assertIsNone(
+            loader._follow_arxml_reference(loader._root, "/CanFrame/Message1", "I-SIGNAL"))
+        self.assertEqual(loader.reference_cache_misses, 2)
+        self.assertEqual(loader.reference_cache_hits, 2)
+
+        # the senders and receivers are found using the PDU index
+        loader.load()
+        self.assertGreater(loader.reference_cache_hits, 2)
+        message = loader._pdu_path_to_messages['/ISignalIPdu/message1'][0]
+        self.assertEqual(message.name, 'Message1')
+        self.assertEqual(message.senders, ['DJ'])
 
         # test non-unique location while assuming that it is unique
         with self.assertRaises(ValueError) as cm:
             loader._get_unique_arxml_child(loader._root, ["AR-PACKAGES", "*AR-PACKAGE"])
         self.assertEqual(str(cm.exception), "['AR-PACKAGES', '*AR-PACKAGE'] does not resolve into a unique node")
 
+    def test_system_arxml_iterparse(self):
+        with open('tests/files/arxml/system-4.2.arxml', encoding='utf-8') as fin:
+            string = fin.read()
+
+        # Software components are not used and dropped while parsing.
+        string = string.replace(
+            '<ELEMENTS>',
+            '<ELEMENTS>'
+            '<APPLICATION-SW-COMPONENT-TYPE>'
+            '<SHORT-NAME>Swc</SHORT-NAME>'
+            '<PORTS>'
+            '<P-PORT-PROTOTYPE>'
+            '<SHORT-NAME>Port</SHORT-NAME>'
+            '</P-PORT-PROTOTYPE>'
+            '</PORTS>'
+            '</APPLICATION-SW-COMPONENT-TYPE>'
+            '<UNKNOWN-TYPE>'
+            '<SHORT-NAME>Unknown</SHORT-NAME>'
+            '</UNKNOWN-TYPE>',
+            1)
+        root = cantools.database.can.formats.arxml._iterparse(StringIO(string))
+        namespaces = {'ns': 'http://autosar.org/schema/r4.0'}
+        self.assertIsNone(root.find('.//ns:APPLICATION-SW-COMPONENT-TYPE',
+                                    namespaces))
+        self.assertIsNotNone(root.find('.//ns:CAN-FRAME', namespaces))
+
+        # Elements of unknown kinds are kept.
+        self.assertIsNotNone(root.find('.//ns:UNKNOWN-TYPE', namespaces))
+
+        db = cantools.database.load_string(string, database_format='arxml')
+        db_iterparse = cantools.database.load(StringIO(string),
+                                              database_format='arxml')
+        self.assertTrue(db.is_similar(db_iterparse))
+        self.assertEqual(repr(db_iterparse), repr(db))
+
+        with self.assertRaises(UnsupportedDatabaseFormatError) as cm:
+            cantools.database.load(StringIO('<AUTOSAR'),
+                                   database_format='arxml')
+
+        self.assertEqual(str(cm.exception),
+                         'ARXML: "unclosed token: line 1, column 0"')
+
+    def test_system_arxml_iterparse_dropped_kinds(self):
+        # No dropped elements are used by the loaders, neither by tag
+        # nor as destination of a reference.
+        arxml = cantools.database.can.formats.arxml
+        dropped = set(arxml.DROPPED_ELEMENT_KINDS)
+
+        for kinds in arxml.DROPPED_CHILDREN.values():
+            dropped.update(kinds)
+
+        used = set()
+        directory = os.path.dirname(arxml.__file__)
+
+        for filename in os.listdir(directory):
+            if filename.endswith('.py') and filename != '__init__.py':
+                with open(os.path.join(directory, filename)) as fin:
+                    used.update(re.findall(r'[A-Z][A-Z0-9]*(?:-[A-Z0-9]+)*',
+                                           fin.read()))
+
+        for filename in os.listdir('tests/files/arxml'):
+            with open(os.path.join('tests/files/arxml', filename),
+                      encoding='utf-8') as fin:
+                used.update(re.findall(r'DEST="([A-Z0-9-]+)"', fin.read()))
+
+        self.assertIn('CAN-FRAME', used)
+        self.assertEqual(dropped & used, set())
+
     def test_no_compu_method_category_arxml(self):
         db = cantools.database.load_file('tests/files/arxml/compu_method_no_category.arxml')
 
@@ -6073,6 +6782,16 @@ class CanToolsDatabaseTest(unittest.TestCase):
         self.assertEqual(sig.choices[1], 'DRIVER_HEARTBEAT_cmd_SYNC')
         self.assertEqual(sig.choices[2], 'DRIVER_HEARTBEAT_cmd_REBOOT')
 
+    def test_cache_lazy(self):
+        filename = 'tests/files/dbc/motohawk.dbc'
+        db = cantools.database.load_file(filename, cache_dir=self.cache_dir, lazy=True)
+        self.assertIsNotNone(db._lazy_messages)
+
+        # A lazily loaded database is not returned by an eager load.
+        db = cantools.database.load_file(filename, cache_dir=self.cache_dir)
+        self.assertIsNone(db._lazy_messages)
+        self.assertEqual(len(db._messages), 1)
+
     @unittest.mock.patch.dict(os.environ, {'CANTOOLS_CACHE_DIR': 'tests/cache_dir'})
     def test_cache_env_var(self):
         cache_dir_path = Path(__file__).parent / "cache_dir"
@@ -6101,6 +6820,164 @@ class CanToolsDatabaseTest(unittest.TestCase):
             self.assertIn('diskcache', str(cm.warning))
         self.assertFalse(os.path.exists(self.cache_dir))
 
+    def test_content_cache(self):
+        cache = ContentCache(self.cache_dir)
+        copy_filename = os.path.join(self.cache_dir, 'copy', 'motohawk.dbc')
+        os.makedirs(os.path.dirname(copy_filename))
+        shutil.copyfile('tests/files/dbc/motohawk.dbc', copy_filename)
+
+        # The key is the contents, not the path, so the copy is found.
+        db = cantools.database.load_file('tests/files/dbc/motohawk.dbc',
+                                         cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+        self.assertGreater(cache.bytes_written, 0)
+        self.assertEqual(cache.currsize, cache.bytes_written)
+        cached_db = cantools.database.load_file(copy_filename, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.bytes_read, cache.bytes_written)
+        self.assertIsNot(cached_db, db)
+        self.assertTrue(db.is_similar(cached_db))
+
+        # Other options are other entries.
+        db = cantools.database.load_file(copy_filename,
+                                         prune_choices=True,
+                                         cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+        # Strings, also with the streaming parser.
+        with open(copy_filename, encoding='cp1252') as fin:
+            string = fin.read()
+
+        cantools.database.load_string(string,
+                                      'dbc',
+                                      dbc_parser='streaming',
+                                      cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        cantools.database.load_string(string + '\n', 'dbc', cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+        # User-defined functions and lazily loaded databases are not
+        # cached.
+        cantools.database.load_string(string,
+                                      sort_signals=lambda signals: signals,
+                                      cache=cache)
+        cantools.database.load_string(string, lazy=True, cache=cache)
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+
+        # The add_*_string() methods.
+        with open('tests/files/kcd/the_homer.kcd') as fin:
+            kcd_string = fin.read()
+
+        db = cantools.database.Database()
+        db.content_cache = cache
+        db.add_kcd_string(kcd_string)
+        db.add_dbc_string(string)
+        self.assertEqual((cache.hits, cache.misses), (2, 5))
+        cached_db = cantools.database.Database()
+        cached_db.content_cache = cache
+        cached_db.add_kcd_string(kcd_string)
+        cached_db.add_dbc_string(string)
+        self.assertEqual((cache.hits, cache.misses), (4, 5))
+        self.assertTrue(db.is_similar(cached_db))
+
+        # Corrupt entries are misses.
+        for entry in os.listdir(self.cache_dir):
+            if entry.endswith('.pickle'):
+                with open(os.path.join(self.cache_dir, entry), 'wb') as fout:
+                    fout.write(b'corrupt')
+
+        db = cantools.database.load_file(copy_filename, cache=cache)
+        self.assertEqual(db.get_message_by_name('ExampleMessage').frame_id,
+                         496)
+        self.assertEqual((cache.hits, cache.misses), (4, 6))
+
+        cache.clear()
+        self.assertEqual(cache.currsize, 0)
+        self.assertEqual((cache.hits, cache.misses), (0, 0))
+
+        # The least recently used entries are removed when full.
+        cantools.database.load_string(string, cache=cache)
+        maxsize = cache.currsize
+        small_cache = ContentCache(self.cache_dir, maxsize=maxsize)
+        cantools.database.load_string(string, prune_choices=True,
+                                      cache=small_cache)
+        self.assertLessEqual(small_cache.currsize, maxsize)
+        cantools.database.load_string(string, prune_choices=True,
+                                      cache=small_cache)
+        self.assertEqual((small_cache.hits, small_cache.misses), (1, 1))
+
+        with self.assertRaises(ValueError):
+            ContentCache(self.cache_dir, maxsize=0)
+
+        # Entries of other cantools versions and cache formats are not
+        # used.
+        key = cache.key(string, False)
+
+        with unittest.mock.patch.object(cantools,
+                                        '__version__',
+                                        '0.0.0',
+                                        create=True):
+            self.assertNotEqual(cache.key(string, False), key)
+
+        with unittest.mock.patch(
+                'cantools.database.content_cache.FORMAT_VERSION',
+                0):
+            self.assertNotEqual(cache.key(string, False), key)
+
+        self.assertEqual(cache.key(string, False), key)
+
+    @unittest.mock.patch.dict(os.environ,
+                              {'CANTOOLS_CONTENT_CACHE_DIR': '__cache_dir'})
+    def test_content_cache_env_var(self):
+        cantools.database.load_file('tests/files/dbc/motohawk.dbc')
+        self.assertGreater(ContentCache(self.cache_dir).currsize, 0)
+
+    def test_registry(self):
+        registry = Registry()
+        filename = os.path.join(self.cache_dir, 'motohawk.dbc')
+        os.makedirs(self.cache_dir)
+        shutil.copyfile('tests/files/dbc/motohawk.dbc', filename)
+
+        # Same file and arguments, also if defaults are given.
+        db = registry.load_file(filename)
+        self.assertIs(registry.load_file(filename), db)
+        self.assertIs(registry.load_file(filename, prune_choices=False), db)
+        self.assertIs(registry.load_file(Path(filename)), db)
+        self.assertEqual((registry.hits, registry.misses), (3, 1))
+
+        # Other arguments.
+        pruned_db = registry.load_file(filename, prune_choices=True)
+        self.assertIsNot(pruned_db, db)
+        self.assertEqual(len(registry), 2)
+
+        # Changed files are loaded again.
+        with open(filename, 'a') as fout:
+            fout.write('\n')
+
+        changed_db = registry.load_file(filename)
+        self.assertIsNot(changed_db, db)
+        self.assertEqual(registry.misses, 3)
+
+        # Invalidated files are loaded again.
+        registry.invalidate(filename)
+        self.assertEqual(len(registry), 0)
+        self.assertIsNot(registry.load_file(filename), changed_db)
+        registry.invalidate()
+        self.assertEqual(len(registry), 0)
+
+        # Unused databases are removed.
+        del db
+        del pruned_db
+        del changed_db
+        registry.load_file(filename)
+        self.assertEqual(len(registry), 0)
+
+        # The process-wide registry.
+        db = cantools.database.cached_load_file('tests/files/dbc/motohawk.dbc')
+        self.assertIs(
+            cantools.database.cached_load_file('tests/files/dbc/motohawk.dbc'),
+            db)
+
     def test_sort_signals_by_name(self):
         filename = 'tests/files/dbc/vehicle.dbc'
         def sort_signals(signals):
@@ -0,0 +1,103 @@
+import subprocess
+import sys
+import unittest
+
+# Modules that must not be imported by a DBC decode, as they make
+# `import cantools` slow.
+UNUSED_BY_DBC_DECODE = [
+    'argparse',
+    'can',
+    'cantools.database.can.formats.arxml.ecu_extract_loader',
+    'cantools.database.can.formats.arxml.system_loader',
+    'cantools.database.can.formats.cdb',
+    'cantools.database.can.formats.kcd',
+    'cantools.database.can.formats.sym',
+    'cantools.database.content_cache',
+    'cantools.database.diagnostics.formats.cdd',
+    'cantools.database.registry',
+    'cantools.logreader',
+    'cantools.tester',
+    'diskcache',
+    'xml.etree.ElementTree',
+]
+
+
+def import_times(code):
+    """Run given Python code in a new interpreter with ``-X importtime``
+    and return a dictionary of imported module names and their
+    cumulative import times in microseconds.
+
+    Modules imported with importlib.import_module() are not shown by
+    ``-X importtime``. They are taken from sys.modules instead, with a
+    time of zero.
+
+    """
+
+    code += '\nimport sys\nprint("\\n".join(sys.modules))\n'
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True,
+                            text=True,
+                            check=True)
+    times = dict.fromkeys(result.stdout.splitlines(), 0)
+
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        try:
+            times[name.strip()] = int(cumulative)
+        except ValueError:
+            # The header.
+            pass
+
+    return times
+
+
+class CanToolsImportTimeTest(unittest.TestCase):
+
+    def assert_not_imported(self, times, modules):
+        imported = [module for module in modules if module in times]
+
+        self.assertEqual(imported,
+                         [],
+                         f'Imported in {times["cantools"] / 1000:.1f} ms.')
+
+    def test_import_cantools(self):
+        times = import_times('import cantools')
+
+        self.assert_not_imported(times,
+                                 [
+                                     *UNUSED_BY_DBC_DECODE,
+                                     'cantools.database',
+                                     'cantools.j1939',
+                                     'importlib.metadata',
+                                 ])
+
+    def test_dbc_decode(self):
+        times = import_times(
+            'import cantools\n'
+            'db = cantools.database.load_file("tests/files/dbc/motohawk.dbc")\n'
+            'db.decode_message(496, b"\\xc0\\x06\\xe0\\x00\\x00\\x00\\x00\\x00")\n')
+
+        self.assertIn('cantools.database.can.formats.dbc', times)
+        self.assert_not_imported(times, UNUSED_BY_DBC_DECODE)
+
+    def test_formats_attribute_access(self):
+        # The lazily imported formats are still available as attributes
+        # of their packages.
+        code = ('import cantools\n'
+                'formats = cantools.database.can.formats\n'
+                'assert formats.arxml.SystemLoader\n'
+                'assert formats.arxml.EcuExtractLoader\n'
+                'assert formats.cdb.load_bytes\n'
+                'assert formats.dbc.load_string\n'
+                'assert formats.kcd.load_string\n'
+                'assert formats.sym.load_string\n')
+
+        subprocess.run([sys.executable, '-c', code], check=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
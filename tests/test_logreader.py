@@ -1,5 +1,7 @@
 import datetime
 import io
+import os
+import tempfile
 import unittest
 
 import pytest
@@ -7,6 +9,11 @@ from freezegun import freeze_time
 
 import cantools
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 def utc_plus(offset: int) -> datetime.timezone:
     return datetime.timezone(datetime.timedelta(hours=offset))
@@ -970,6 +977,217 @@ class TestLogreaderStreams(unittest.TestCase):
             next(frame_iter)
 
 
+@unittest.skipIf(np is None, 'numpy is not installed')
+class TestLogreaderColumns(unittest.TestCase):
+    def assert_columns_equal_to_frames(self, log):
+        frames = list(cantools.logreader.Parser(io.StringIO(log),
+                                                tz=datetime.timezone.utc))
+
+        # Small chunks split lines, which must not make a difference.
+        for chunk_size in [5, 64, 1 << 24]:
+            columns = cantools.logreader.read_columns(io.StringIO(log),
+                                                      chunk_size=chunk_size)
+            self.assertEqual(len(columns.frame_ids), len(frames))
+            self.assertEqual(columns.frame_ids.dtype, np.uint32)
+            self.assertEqual(columns.data.dtype, np.uint8)
+
+            for i, frame in enumerate(frames):
+                self.assertEqual(columns.channels[i], frame.channel)
+                self.assertEqual(columns.frame_ids[i], frame.frame_id)
+                self.assertEqual(columns.is_extended_frame[i],
+                                 frame.is_extended_frame)
+                self.assertEqual(columns.is_remote_frame[i],
+                                 frame.is_remote_frame)
+                self.assertEqual(columns.dlc[i], len(frame.data))
+                self.assertEqual(columns.data[i, :columns.dlc[i]].tobytes(),
+                                 frame.data)
+                self.assertEqual(columns.timestamp_format,
+                                 frame.timestamp_format)
+
+        return columns
+
+    def test_candump(self):
+        columns = self.assert_columns_equal_to_frames("""\
+  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+  vcan0  20000004   [8]  00 00 00 00 00 00 00 00   ERRORFRAME
+  vcan0  064   [10]  F0 01 FF FF FF FF FF FF FF FF
+  vcan0  ERROR
+
+  vcan0  1F4   [4]  01 02 03 04
+  vcan0  1F3   [3]  01 02 03
+""")
+        self.assertEqual(columns.timestamp_format,
+                         cantools.logreader.TimestampFormat.MISSING)
+        self.assertTrue(np.isnan(columns.timestamps).all())
+        self.assertEqual(columns.data.shape, (4, 10))
+        self.assertEqual(columns.data[3].tolist(),
+                         [1, 2, 3, 0, 0, 0, 0, 0, 0, 0])
+
+    def test_candump_time_since_start(self):
+        columns = self.assert_columns_equal_to_frames("""\
+ (000.000000)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+ (002.047817)  vcan0  064   [8]  F0 01 FF FF FF FF FF FF
+ (012.831664)  vcan0  1F4   [4]  01 02 03 04
+ (015.679614)  vcan0  1F3   [3]  01 02 03
+""")
+        self.assertEqual(columns.timestamps.tolist(),
+                         [0.0, 2.047817, 12.831664, 15.679614])
+
+    def test_candump_absolute_timestamp(self):
+        columns = self.assert_columns_equal_to_frames("""\
+ (2020-12-19 12:04:45.485261)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+ (2020-12-19 12:04:48.597222)  vcan0  064   [8]  F0 01 FF FF FF FF FF FF
+""")
+        self.assertEqual(columns.timestamps.tolist(),
+                         [datetime.datetime(2020, 12, 19, 12, 4, 45, 485261),
+                          datetime.datetime(2020, 12, 19, 12, 4, 48, 597222)])
+
+    def test_candump_log(self):
+        columns = self.assert_columns_equal_to_frames("""\
+(1594172461.968006) vcan0 0C8#F000000000000000\r
+(1594172462.126542) vcan0 064#F001FFFFFFFFFFFFFFFF\r
+(1594172462.127684) vcan0 ERROR\r
+(1594172462.356874) vcan1 18EFC034#01020304\r
+(1594172462.688432) vcan0 1F3#R\r
+  (1613656104.493702) can2 102##1150B7F0102010010000064A0020000100000000000E41F000000000090D1FF000020A600000000210100000000000000
+""")
+        self.assertEqual(columns.timestamps[0],
+                         np.datetime64('2020-07-08T01:41:01.968006'))
+        self.assertEqual(columns.channels.tolist(),
+                         ['vcan0', 'vcan0', 'vcan1', 'vcan0', 'can2'])
+        self.assertEqual(columns.is_extended_frame.tolist(),
+                         [False, False, True, False, False])
+        self.assertEqual(columns.is_remote_frame.tolist(),
+                         [False, False, False, True, False])
+        self.assertEqual(columns.dlc.tolist(), [8, 10, 4, 0, 48])
+        self.assertEqual(columns.data.shape, (5, 48))
+
+    def test_pcan_traceV21(self):
+        columns = self.assert_columns_equal_to_frames("""\
+;$FILEVERSION=2.1
+;   Message   Time    Type    ID     Rx/Tx
+;   Number    Offset  |  Bus  [hex]  |  Reserved
+;   |         [ms]    |  |    |      |  |  Data Length Code
+;   |         |       |  |    |      |  |  |    Data [hex] ...
+;   |         |       |  |    |      |  |  |    |
+;---+-- ------+------ +- +- --+----- +- +- +--- +- -- -- -- -- -- -- --
+      1      1059.900 DT 1     0300 Rx -  7    00 00 00 00 04 00 00
+      2      1283.231 DT 1     0300 Rx -  7    00 00 00 00 04 00 00
+      3      1298.037 ER 1        - Rx -  5    00 00 00 00 00
+      4      1323.884 RR 1     0300 Rx -  7
+""")
+        self.assertEqual(columns.timestamps.tolist(),
+                         [1.0599, 1.283231, 1.323884])
+
+    def test_empty(self):
+        columns = cantools.logreader.read_columns(io.StringIO('foo\n'))
+        self.assertEqual(columns.frame_ids.shape, (0, ))
+        self.assertEqual(columns.data.shape, (0, 0))
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, 'candump.log')
+
+            with open(filename, 'w') as fout:
+                fout.write('(1594172461.968006) vcan0 0C8#F000000000000000\n'
+                           '(1594172462.126542) vcan0 064#F001\n')
+
+            columns = cantools.logreader.read_columns(filename)
+
+        self.assertEqual(columns.frame_ids.tolist(), [0xc8, 0x64])
+        self.assertEqual(columns.dlc.tolist(), [8, 2])
+
+
+class TestIndexedLogReader(unittest.TestCase):
+    CANDUMP_LOG = """\
+(1594172461.000000) vcan0 0C8#F000000000000000
+(1594172462.000000) vcan0 064#F001
+(1594172463.000000) vcan0 ERROR
+(1594172463.500000) vcan0 0C8#F100000000000000
+(1594172464.000000) vcan0 1F4#01020304
+(1594172465.000000) vcan0 0C8#F200000000000000
+(1594172466.000000) vcan0 064#F002
+(1594172467.000000) vcan0 0C8#F300000000000000
+"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.log_path = os.path.join(self.directory.name, 'candump.log')
+        self.write_log(self.CANDUMP_LOG)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_log(self, log):
+        with open(self.log_path, 'w') as fout:
+            fout.write(log)
+
+    def read_frames(self, *args, **kwargs):
+        with cantools.logreader.IndexedLogReader(self.log_path,
+                                                 checkpoint_interval=2,
+                                                 tz=utc_plus(0)) as reader:
+            return list(reader.frames(*args, **kwargs))
+
+    def test_all_frames(self):
+        frames = self.read_frames()
+        expected = list(cantools.logreader.Parser(io.StringIO(self.CANDUMP_LOG),
+                                                  tz=utc_plus(0)))
+
+        self.assertEqual([(frame.frame_id, frame.data, frame.timestamp)
+                          for frame in frames],
+                         [(frame.frame_id, frame.data, frame.timestamp)
+                          for frame in expected])
+        self.assertTrue(os.path.exists(self.log_path + '.idx'))
+
+    def test_frame_ids(self):
+        frames = self.read_frames([0x64, 0x1f4, 0x123])
+
+        self.assertEqual([(frame.frame_id, frame.data) for frame in frames],
+                         [(0x64, b'\xf0\x01'),
+                          (0x1f4, b'\x01\x02\x03\x04'),
+                          (0x64, b'\xf0\x02')])
+
+    def test_time_range(self):
+        frames = self.read_frames([0xc8], start=1594172463.5, end=1594172466)
+        self.assertEqual([frame.data[0] for frame in frames], [0xf1, 0xf2])
+
+        frames = self.read_frames(
+            start=datetime.datetime(2020, 7, 8, 1, 41, 6, tzinfo=utc_plus(0)))
+        self.assertEqual([frame.frame_id for frame in frames], [0x64, 0xc8])
+
+        frames = self.read_frames(end=1594172462)
+        self.assertEqual([frame.frame_id for frame in frames], [0xc8, 0x64])
+
+    def test_index_file(self):
+        with cantools.logreader.IndexedLogReader(self.log_path) as reader:
+            self.assertEqual(reader.frame_ids, [0x64, 0xc8, 0x1f4])
+
+        index = cantools.logreader.LogIndex.load(self.log_path + '.idx')
+        self.assertEqual(index.pattern_name, 'CandumpDefaultLogPattern')
+        self.assertEqual(list(index.frame_offsets[0x64]), [47, 247])
+        self.assertTrue(index.is_up_to_date(self.log_path))
+
+        # The index is rebuilt when the log changes.
+        self.write_log('(1594172461.000000) vcan0 123#F0\n')
+        self.assertFalse(index.is_up_to_date(self.log_path))
+        self.assertEqual([frame.frame_id for frame in self.read_frames()],
+                         [0x123])
+
+    def test_relative_timestamps(self):
+        self.write_log("""\
+ (000.000000)  vcan0  0C8   [8]  F0 00 00 00 00 00 00 00
+ (002.047817)  vcan0  064   [8]  F0 01 FF FF FF FF FF FF
+ (012.831664)  vcan0  1F4   [4]  01 02 03 04
+ (015.679614)  vcan0  1F3   [3]  01 02 03
+""")
+        frames = self.read_frames(start=datetime.timedelta(seconds=2),
+                                  end=13)
+        self.assertEqual([frame.frame_id for frame in frames], [0x64, 0x1f4])
+
+    def test_empty_log(self):
+        self.write_log('')
+        self.assertEqual(self.read_frames(), [])
+
 def test_data_frame_repr() -> None:
         parser = cantools.logreader.Parser()
         outp = parser.parse("vcan0  0C8   [8]  F0 00 00 00 00 00 00 00")
@@ -1,4 +1,6 @@
 import argparse
+import os
+import tempfile
 import traceback
 import unittest
 
@@ -16,7 +18,7 @@ from unittest.mock import Mock, call, patch
 import can
 
 if have_curses:
-    from cantools.subparsers.monitor import Monitor
+    from cantools.subparsers.monitor import Monitor, add_subparser
 
 
 class Args(argparse.Namespace):
@@ -34,6 +36,9 @@ class Args(argparse.Namespace):
             "fd": False,
             "channel": 'vcan0',
             "filter_regex": '',
+            "queue_size": 65536,
+            "replay": None,
+            "speed": 1.0,
             "interface": "socketcan",
             "bitrate": None,
             "bus_kwargs": [],
@@ -131,7 +136,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      'green'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -208,7 +213,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -257,7 +262,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      "AverageRadius: 3.2 m, Temperature: 250.55 degK)"),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -297,7 +302,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 1'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '       0.000  BATTERY_VT(undecoded, expected multiplexer id 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34 or 35, but got 36: 0x240098980b00)'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -345,7 +350,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -394,7 +399,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      "MODULE_VOLTAGE_00: 39064, MODULE_TEMP_00: 11)"),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -467,7 +472,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                      "       2.000  Extended :: S0=1 :: S1=0 :: S6=1(S0: 1, S5: 0, S6: 1, S7: 0)"),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -522,7 +527,299 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
+                     'cyan')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.cli.create_bus_from_namespace')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_coalesce_frames(self,
+                             _use_default_colors,
+                             _curs_set,
+                             _init_pair,
+                             is_term_resized,
+                             color_pair,
+                             _create_bus,
+                             _notifier):
+        # Prepare mocks.
+        stdscr = StdScr()
+        args = Args('tests/files/dbc/motohawk.dbc')
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        for timestamp in range(100):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                is_extended_id=False,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00' + bytes([timestamp]),
+                timestamp=timestamp))
+
+        monitor.on_message_received(can.Message(
+            arbitration_id=497,
+            is_extended_id=False,
+            data=b'\x00'))
+
+        with patch.object(monitor,
+                          'try_update_message',
+                          wraps=monitor.try_update_message) as try_update_message:
+            monitor.run(1)
+
+        # Only the most recently received frame is decoded.
+        self.assertEqual(try_update_message.call_count, 1)
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 101, Discarded: 1, Errors: 0'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '      99.000  ExampleMessage('),
+                call(3, 0, "                  Enable: Enabled,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
+                     'cyan')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.cli.create_bus_from_namespace')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_queue_full(self,
+                        _use_default_colors,
+                        _curs_set,
+                        _init_pair,
+                        is_term_resized,
+                        color_pair,
+                        _create_bus,
+                        _notifier):
+        # Prepare mocks.
+        stdscr = StdScr()
+        args = Args('tests/files/dbc/motohawk.dbc')
+        args.queue_size = 2
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+
+        for timestamp in range(5):
+            monitor.on_message_received(can.Message(
+                arbitration_id=496,
+                is_extended_id=False,
+                data=b'\xc0\x06\xe0\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        monitor.run(1)
+
+        # The frames received when the queue was full are dropped.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 2, Discarded: 0, Errors: 0, Dropped: 3'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '       1.000  ExampleMessage('),
+                call(3, 0, "                  Enable: Enabled,"),
+                call(4, 0, '                  AverageRadius: 3.2 m,'),
+                call(5, 0, '                  Temperature: 250.55 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
+                     'cyan')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.cli.create_bus_from_namespace')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_replay(self,
+                    _use_default_colors,
+                    _curs_set,
+                    _init_pair,
+                    is_term_resized,
+                    color_pair,
+                    create_bus,
+                    notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=['KEY_RIGHT', 'q'])
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, 'candump.log')
+
+            with open(log_path, 'w') as fout:
+                fout.write('(1000.000000) vcan0 1F0#0000000000000000\n'
+                           '(1010.000000) vcan0 1F0#0000000000000000\n'
+                           '(1030.000000) vcan0 1F0#0000000000000000\n')
+
+            args = Args('tests/files/dbc/motohawk.dbc')
+            args.replay = log_path
+            args.speed = 0
+            monitor = Monitor(stdscr, args)
+            bus = monitor._replay
+            self.assert_called(create_bus, [])
+            self.assert_called(notifier, [call(bus, [monitor])])
+
+            # As fast as possible.
+            self.assertEqual(bus.position, 1000.0)
+            self.assertEqual(bus.recv(0).timestamp, 1000.0)
+            self.assertEqual(bus.recv(0).timestamp, 1010.0)
+
+            # Seeking skips frames or rewinds the log.
+            bus.seek(15.0)
+            self.assertEqual(bus.position, 1025.0)
+            monitor.on_message_received(bus.recv(0))
+            self.assertTrue(bus.finished)
+            self.assertIsNone(bus.recv(0))
+            bus.seek(-100.0)
+            self.assertEqual(bus.position, 1000.0)
+            self.assertFalse(bus.finished)
+
+            # No frames are received when paused.
+            bus.pause()
+            self.assertIsNone(bus.recv(0))
+            bus.resume()
+            self.assertEqual(bus.recv(0).timestamp, 1000.0)
+
+            # Run monitor.
+            monitor.run(1)
+            bus.shutdown()
+
+        self.assertEqual(bus.position, 1010.0)
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Replay: 0.0 s'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '      30.000  ExampleMessage('),
+                call(3, 0, '                  Enable: Disabled,'),
+                call(4, 0, '                  AverageRadius: 0.0 m,'),
+                call(5, 0, '                  Temperature: 250.0 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics, Left/Right: Seek',
+                     'cyan'),
+
+                # Seeked 10 seconds forward.
+                call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Replay: 10.0 s'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                           ',
+                     'green'),
+                call(2, 0, '      30.000  ExampleMessage('),
+                call(3, 0, '                  Enable: Disabled,'),
+                call(4, 0, '                  AverageRadius: 0.0 m,'),
+                call(5, 0, '                  Temperature: 250.0 degK'),
+                call(6, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics, Left/Right: Seek',
+                     'cyan')
+            ])
+
+    @patch('can.Notifier')
+    @patch('can.cli.create_bus_from_namespace')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_statistics(self,
+                        _use_default_colors,
+                        _curs_set,
+                        _init_pair,
+                        is_term_resized,
+                        color_pair,
+                        _create_bus,
+                        _notifier):
+        # Prepare mocks.
+        stdscr = StdScr(user_input=['s', 'q'], resolution=[(30, 80)])
+        args = Args('tests/files/dbc/abs.dbc')
+        args.bitrate = 500000
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Run monitor.
+        monitor = Monitor(stdscr, args)
+        monitor.on_message_received(can.Message(
+            arbitration_id=0x7ff,
+            is_extended_id=False,
+            data=b'\x00\x00\x00\x00\x00\x00\x00\x00',
+            timestamp=0.0))
+
+        # A cycle time of 10 ms and one missing frame.
+        for timestamp in [0.0, 0.010, 0.021, 0.030, 0.050]:
+            monitor.on_message_received(can.Message(
+                arbitration_id=0x343,
+                is_extended_id=False,
+                data=b'\x00\x00\x00\x00\x00\x00\x00\x00',
+                timestamp=timestamp))
+
+        monitor.on_message_received(can.Message(
+            arbitration_id=0x7ff,
+            is_extended_id=False,
+            data=b'\x00\x00\x00\x00\x00\x00\x00\x00',
+            timestamp=1.0))
+        monitor.run(1)
+
+        # Check mocks.
+        self.assert_called(
+            stdscr.addstr,
+            [
+                call(0, 0, 'Received: 7, Discarded: 2, Errors: 0, Bus load: 0.2%'),
+                call(1,
+                     0,
+                     '   TIMESTAMP  MESSAGE                                                           ',
+                     'green'),
+                call(2, 0, '       0.050  BREMSE_33('),
+                call(3, 0, '                  whlspeed_FL: 0.0 m/s,'),
+                call(4, 0, '                  whlspeed_FR: 0.0 m/s,'),
+                call(5, 0, '                  whlspeed_RL: 0.0 m/s,'),
+                call(6, 0, '                  whlspeed_RR: 0.0 m/s'),
+                call(7, 0, '              )'),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics                      ',
+                     'cyan'),
+
+                # Statistics view.
+                call(0, 0, 'Received: 7, Discarded: 2, Errors: 0, Bus load: 0.2%'),
+                call(1,
+                     0,
+                     'MESSAGE                COUNT   PERIOD   CYCLE       JITTER MISSING HISTOGRAM    ',
+                     'green'),
+                call(2, 0, '0x7ff                      2   1000.0       -            -       0 '),
+                call(3, 0, 'BREMSE_33                  5     11.0    10.0     -1.0/1.0       1    # ##   '),
+                call(29,
+                     0,
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics                      ',
                      'cyan')
             ])
 
@@ -569,7 +866,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
@@ -612,7 +909,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 # Hit enter to hide filter prompt.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed again.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0, Filter: Y'),
@@ -665,7 +962,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -725,7 +1022,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(10, 0, '                  Fum: 0,'),
                 call(11, 0, '                  Fam: Disabled'),
                 call(12, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed to start filtering
                 call(0, 0, 'Received: 3, Discarded: 0, Errors: 0'),
@@ -776,7 +1073,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(2, 0, '       0.000  Fum('),
                 call(3, 0, '                  Fam: Disabled'),
                 call(4, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -830,7 +1127,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(9, 0, '                  MODULE_VOLTAGE_01: 39064,'),
                 call(10, 0, '                  MODULE_TEMP_01: 11'),
                 call(11, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed to start filtering
                 call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
@@ -910,7 +1207,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(2, 0, '       0.000  BATTERY_VT :: BATTERY_VT_INDEX=1('),
                 call(3, 0, '                  MODULE_VOLTAGE_01: 39064'),
                 call(4, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -979,7 +1276,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  message3_CRC: 45,'),
                 call(27, 0, '                  message3_SeqCounter: 4,'),
                 call(28, 0, '                  message3_secured_Freshness: 29,'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed to start filtering
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
@@ -1119,7 +1416,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(5, 0, '       0.000  OneToContainThemAll :: message3_secured('),
                 call(6, 0, '                  message3_CRC: 45'),
                 call(7, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -1189,7 +1486,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(23, 0, '                  OneToContainThemAll_selector1: SELECT_WORLD,'),
                 call(24, 0, '                  MultiplexedStatic2: 2'),
                 call(25, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -1243,7 +1540,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(13, 0, '                  signal1: 5 m,'),
                 call(14, 0, '                  signal5: 3.1414999961853027'),
                 call(15, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -1294,7 +1591,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(3, 0, '      10.000  OneToContainThemAll :: message1(message1_SeqCounter: 321, message1_CRC: 654, signal6: zero, signal1: 0 m, signal5: 4.0)'),
                 call(4, 0, '       0.000  OneToContainThemAll :: multiplexed_message :: OneToContainThemAll_selector1=SELECT_HELLO(MultiplexedStatic: 1, Hello: 2, OneToContainThemAll_selector1: SELECT_HELLO, MultiplexedStatic2: 2)'),
                 call(5, 0, '      10.000  OneToContainThemAll :: multiplexed_message :: OneToContainThemAll_selector1=SELECT_WORLD(MultiplexedStatic: 1, World2: 0, World1: 1, OneToContainThemAll_selector1: SELECT_WORLD, MultiplexedStatic2: 2)'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
             ])
 
     @patch('can.Notifier')
@@ -1380,7 +1677,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'f' pressed.
                 call(0, 0, 'Received: 2, Discarded: 1, Errors: 0'),
@@ -1414,14 +1711,14 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.54 degK'),
                 call(6, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # 'p' pressed. Input frame not displayed.
 
                 # 'r' pressed.
                 call(0, 0, 'Received: 0, Discarded: 0, Errors: 0'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Input after reset. 'f' pressed.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
@@ -1443,7 +1740,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.48 degK'),
                 call(6, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
 
                 # 'q' pressed, no redraw.
             ])
@@ -1516,7 +1813,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 call(0, 0, 'Received: 2, Discarded: 0, Errors: 0'),
@@ -1531,7 +1828,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 call(0, 0, 'Received: 3, Discarded: 0, Errors: 0'),
@@ -1546,7 +1843,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # Received when paused, displayed at unpause.
@@ -1562,7 +1859,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 # Received when playing.
@@ -1578,7 +1875,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29
                      ,
-                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan'),
 
                 call(0, 0, 'Received: 6, Discarded: 0, Errors: 0'),
@@ -1593,7 +1890,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(6, 0, '              )'),
                 call(29,
                      0,
-                     'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ',
+                     'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ',
                      'cyan')
             ])
 
@@ -1643,7 +1940,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
+                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics', 'cyan'),
 
                 # 25 x 35.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
@@ -1653,7 +1950,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan'),
+                call(24, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics', 'cyan'),
 
                 # 20 x 30.
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 0'),
@@ -1663,7 +1960,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(4, 0, '                  AverageRadius: 3.2 m,'),
                 call(5, 0, '                  Temperature: 250.55 degK'),
                 call(6, 0, '              )'),
-                call(19, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset', 'cyan')
+                call(19, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -1826,7 +2123,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '              )'),
                 call(27, 0, '      13.000  BATTERY_VT :: BATTERY_VT_INDEX=13('),
                 call(28, 0, '                  BATTERY_VT_INDEX: 13,'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Move to page 2
                 call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
@@ -1858,7 +2155,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  BATTERY_VT_INDEX: 18,'),
                 call(27, 0, '                  MODULE_VOLTAGE_18: 39064,'),
                 call(28, 0, '                  MODULE_TEMP_18: 11'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Move to page 3
                 call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
@@ -1890,7 +2187,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  MODULE_TEMP_06: 11'),
                 call(27, 0, '              )'),
                 call(28, 0, '       7.000  BATTERY_VT :: BATTERY_VT_INDEX=7('),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Move to page 4
                 call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
@@ -1922,7 +2219,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '                  MODULE_VOLTAGE_09: 39064,'),
                 call(27, 0, '                  MODULE_TEMP_09: 11'),
                 call(28, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
 
                 # Move back to page 3
                 call(0, 0, 'Received: 19, Discarded: 0, Errors: 0'),
@@ -1954,7 +2251,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(26, 0, '       4.000  BATTERY_VT :: BATTERY_VT_INDEX=4('),
                 call(27, 0, '                  BATTERY_VT_INDEX: 4,'),
                 call(28, 0, '                  MODULE_VOLTAGE_04: 39064,'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
             ])
 
     @patch('can.Notifier')
@@ -1994,7 +2291,7 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 1'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '       0.000  Message1(undecoded, unpacking failed: 0x24)'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -2044,14 +2341,14 @@ class CanToolsMonitorTest(unittest.TestCase):
                 call(0, 0, 'Received: 1, Discarded: 0, Errors: 1'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '       0.000  Bar(undecoded, 3 bytes too short: 0x00)'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan'),
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan'),
                 # correct message replaces the error
                 call(0, 0, 'Received: 2, Discarded: 0, Errors: 1'),
                 call(1, 0, '   TIMESTAMP  MESSAGE                                           ', 'green'),
                 call(2, 0, '       0.000  Bar('),
                 call(3, 0, '                  Binary32: 716.5322875976562'),
                 call(4, 0, '              )'),
-                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset                     ', 'cyan')
+                call(29, 0, 'q: Quit, f: Filter, p: Play/Pause, r: Reset, s: Statistics      ', 'cyan')
             ])
 
     @patch('can.Notifier')
@@ -2087,5 +2384,88 @@ class CanToolsMonitorTest(unittest.TestCase):
                                       host='192.168.0.10', port=29536, bitrate=None, fd=False)])
 
 
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_command_line_parsing(self,
+                                  _use_default_colors,
+                                  _curs_set,
+                                  _init_pair,
+                                  is_term_resized,
+                                  color_pair,
+                                  bus,
+                                  _notifier):
+        parser = argparse.ArgumentParser()
+        add_subparser(parser.add_subparsers())
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        # Bus arguments which are not given are missing in the
+        # namespace.
+        for argv, bitrate in [
+                ([], None),
+                (['--bitrate', '500000'], 500000),
+                (['--bitrate', '500000', '--data-bitrate', '2000000'], 500000)
+        ]:
+            bus.reset_mock()
+            args = parser.parse_args(['monitor',
+                                      '-i', 'virtual',
+                                      '-c', 'vcan0',
+                                      *argv,
+                                      'tests/files/dbc/motohawk.dbc'])
+            monitor = Monitor(StdScr(), args)
+            monitor.run(1)
+            self.assertEqual(bus.call_args.kwargs['interface'], 'virtual')
+            self.assertEqual(bus.call_args.kwargs.get('bitrate'), bitrate)
+
+    @patch('can.Notifier')
+    @patch('can.Bus')
+    @patch('curses.color_pair')
+    @patch('curses.is_term_resized')
+    @patch('curses.init_pair')
+    @patch('curses.curs_set')
+    @patch('curses.use_default_colors')
+    def test_replay_command_line_parsing(self,
+                                         _use_default_colors,
+                                         _curs_set,
+                                         _init_pair,
+                                         is_term_resized,
+                                         color_pair,
+                                         bus,
+                                         _notifier):
+        parser = argparse.ArgumentParser()
+        add_subparser(parser.add_subparsers())
+        color_pair.side_effect = lambda i: self.color_pair_side_effect[i]
+        is_term_resized.return_value = False
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_path = os.path.join(tmpdir, 'candump.log')
+
+            with open(log_path, 'w') as fout:
+                fout.write('(1000.000000) vcan0 1F0#0000000000000000\n')
+
+            args = parser.parse_args(['monitor',
+                                      '--replay', log_path,
+                                      '--speed', '0',
+                                      'tests/files/dbc/motohawk.dbc'])
+            monitor = Monitor(StdScr(), args)
+            monitor.run(1)
+            monitor._replay.shutdown()
+
+        self.assertEqual(args.speed, 0.0)
+        self.assert_called(bus, [])
+
+        # Negative and invalid speeds are rejected by the parser.
+        for speed in ['-1', 'nan', 'fast']:
+            with patch('sys.stderr'), self.assertRaises(SystemExit):
+                parser.parse_args(['monitor',
+                                   '--replay', 'candump.log',
+                                   '--speed', speed,
+                                   'tests/files/dbc/motohawk.dbc'])
+
 if __name__ == '__main__':
     unittest.main()
@@ -2050,6 +2050,45 @@ Failed to parse line: 'invalid syntax'
             for i in range(len(expected_subplot_calls)):
                 self.assertListEqual(subplots[i].mock_calls, expected_subplot_calls[i], msg=f"calls don't match for subplot {i}")
 
+    def test_max_points(self):
+        argv = ['cantools', 'plot', '--no-units', '--max-points', '100', self.DBC_FILE_CHOICES, 'Foo:|']
+        input_data = """\
+ (2020-12-29 08:48:04.568726)  vcan0  00000000   [8]  01 00 00 00 00 00 00 00
+ (2020-12-29 08:48:08.733416)  vcan0  00000000   [8]  02 00 00 00 00 00 00 00
+ (2020-12-29 08:48:12.317636)  vcan0  00000000   [8]  FB 00 00 00 00 00 00 00
+ (2020-12-29 08:48:14.590522)  vcan0  00000000   [8]  05 00 00 00 00 00 00 00
+ (2020-12-29 08:48:16.000000)  vcan0  00000001   [8]  05 00 00 00 00 00 00 00
+ (2020-12-29 08:48:18.555082)  vcan0  00000000   [8]  00 00 00 00 00 00 00 00
+ (2020-12-29 08:48:21.305794)  vcan0  00000000   [8]  02 00 00 00 00 00 00 00
+ (2020-12-29 08:48:22.807889)  vcan0  00000000   [8]  05 00 00 00 00 00 00 00
+ (2020-12-29 08:48:25.879604)  vcan0  00000000   [8]  00 00 00 00 00 00 00 00
+ (2020-12-29 08:48:30.484820)  vcan0  00000000   [8]  02 00 00 00 00 00 00 00
+ (2020-12-29 08:48:34.369165)  vcan0  00000000   [8]  06 00 00 00 00 00 00 00
+"""
+
+        db = cantools.database.load_file(self.DBC_FILE_CHOICES)
+        choices = db.get_message_by_name("Foo").get_signal_by_name("Foo").choices
+
+        xs  = self.parse_time(input_data, self.parse_absolute_time)
+        del xs[4]
+        ys = [1, 2, -5, 5, 0, 2, 5, 0, 2, 6]
+        ys = [str(choices[y]) for y in ys]
+
+        subplots = [SubplotMock()]
+        plt = PyplotMock()
+        plt.subplot.side_effect = subplots
+        stdout = StringIO()
+
+        with mock.patch('sys.stdin', StringIO(input_data)), mock.patch('sys.stdout', stdout), mock.patch('sys.argv', argv), plt:
+            cantools._main()
+
+        self.assertEqual(stdout.getvalue(), 'Unknown frame id 1 (0x1)\n')
+        stem = subplots[0].mock_calls[0]
+        self.assertEqual(stem.args[0].tolist(), xs)
+        self.assertEqual(stem.args[1].tolist(), ys)
+        self.assertEqual(stem.args[2:], ('',))
+        self.assertEqual(stem.kwargs, {'label': 'Foo.Foo'})
+
     def test_do_replot(self):
         argv = ['cantools', 'plot', self.DBC_FILE_CHOICES, "Foo:b-", "Foo:rd"]
         input_data = """\
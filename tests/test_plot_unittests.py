@@ -3,6 +3,8 @@
 import datetime
 import unittest
 
+import numpy as np
+
 from cantools.subparsers import plot
 
 
@@ -70,6 +72,54 @@ class CanToolsPlotUnittests(unittest.TestCase):
             actual = sut.parse_user_input_relative_time(user_input, first_timestamp=0)
             self.assertEqual(actual, expected, f"unexpected result for {user_input!r}")
 
+    def test_decimate(self):
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 50)
+        y[500] = 10
+
+        # Nothing to do.
+        actual_x, actual_y = plot.decimate(x, y, 1000, None)
+        np.testing.assert_array_equal(actual_x, x)
+        np.testing.assert_array_equal(actual_y, y)
+
+        # The first, last, minimum and maximum value of 25 intervals.
+        actual_x, actual_y = plot.decimate(x, y, 100, None)
+        self.assertLessEqual(len(actual_x), 100)
+        self.assertTrue(np.all(np.diff(actual_x) > 0))
+        self.assertEqual(actual_x[0], 0)
+        self.assertEqual(actual_x[-1], 999)
+        self.assertEqual(actual_y.max(), 10)
+        self.assertEqual(actual_y.min(), y.min())
+        np.testing.assert_array_equal(actual_y, y[actual_x.astype(int)])
+
+        # A gap is interrupted by a NaN value.
+        x[600:] += 100
+        actual_x, actual_y = plot.decimate(x, y, 100, 50)
+        gap = np.flatnonzero(np.isnan(actual_y))
+        self.assertEqual(len(gap), 1)
+        self.assertEqual(actual_x[gap[0] - 1], 599)
+        self.assertEqual(actual_x[gap[0]], 599 + 25)
+        self.assertEqual(actual_x[gap[0] + 1], 700)
+
+    def test_decimate_choices(self):
+        x = np.arange(8)
+        y = np.array(['a', 'a', 'a', 'b', 'b', 'b', 'b', 'a'], dtype=object)
+
+        actual_x, actual_y = plot.decimate(x, y, 4, None)
+        self.assertEqual(actual_x.tolist(), [0, 2, 3, 6, 7])
+        self.assertEqual(actual_y.tolist(), ['a', 'a', 'b', 'b', 'a'])
+
+    def test_array_graph(self):
+        graph = plot.ArrayGraph()
+        self.assertEqual(len(graph.x), 0)
+
+        for i in range(3000):
+            graph.extend(np.array([i]), np.array([i * 2]))
+
+        graph.extend(np.array([3000]), np.array(['invalid'], dtype=object))
+        self.assertEqual(graph.x.tolist(), list(range(3001)))
+        self.assertEqual(graph.y.tolist(), [i * 2 for i in range(3000)] + ['invalid'])
+
 
     # ------- auxiliary functions -------
 